@@ -11,6 +11,11 @@ Adds indexes to support the most common query patterns:
 - Status filtering → idx_scans_status
 - Contract name search → idx_scans_contract_name
 - Findings per-scan-by-severity queries → idx_findings_scan_severity
+
+Existing databases are stamped at ``0001_baseline`` and then upgraded, so
+these indexes are usually built on populated tables.  On PostgreSQL they are
+created with ``CREATE INDEX CONCURRENTLY`` inside an autocommit block, which
+avoids holding a write lock on ``scans`` / ``findings`` for the whole build.
 """
 
 from typing import Sequence, Union
@@ -25,24 +30,53 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# (index name, table, columns)
+_INDEXES = (
+    ("idx_scans_scanned_at", "scans", [sa.text("scanned_at DESC")]),
+    ("idx_scans_created_at", "scans", ["created_at"]),
+    ("idx_scans_overall_score", "scans", ["overall_score"]),
+    ("idx_scans_status", "scans", ["status"]),
+    ("idx_scans_contract_name", "scans", ["contract_name"]),
+    # findings table — composite index for per-scan severity queries
+    ("idx_findings_scan_severity", "findings", ["scan_id", "severity"]),
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
 def upgrade() -> None:
-    """Create performance indexes."""
-    # scans table
-    op.create_index("idx_scans_scanned_at", "scans", [sa.text("scanned_at DESC")])
-    op.create_index("idx_scans_created_at", "scans", ["created_at"])
-    op.create_index("idx_scans_overall_score", "scans", ["overall_score"])
-    op.create_index("idx_scans_status", "scans", ["status"])
-    op.create_index("idx_scans_contract_name", "scans", ["contract_name"])
+    """Create performance indexes (concurrently on PostgreSQL)."""
+    if _is_postgresql():
+        # CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            for name, table, columns in _INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+        return
 
-    # findings table — composite index for per-scan severity queries
-    op.create_index("idx_findings_scan_severity", "findings", ["scan_id", "severity"])
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
 
 
 def downgrade() -> None:
-    """Drop performance indexes."""
-    op.drop_index("idx_findings_scan_severity", table_name="findings")
-    op.drop_index("idx_scans_contract_name", table_name="scans")
-    op.drop_index("idx_scans_status", table_name="scans")
-    op.drop_index("idx_scans_overall_score", table_name="scans")
-    op.drop_index("idx_scans_created_at", table_name="scans")
-    op.drop_index("idx_scans_scanned_at", table_name="scans")
+    """Drop performance indexes (concurrently on PostgreSQL)."""
+    if _is_postgresql():
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(_INDEXES):
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+        return
+
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,66 @@
+"""replace scanned_at index with a (scanned_at DESC, id DESC) composite
+
+Revision ID: 0003_scanned_at_id_index
+Revises: 0002_add_indexes
+Create Date: 2026-10-15
+
+``GET /scans`` orders by ``scanned_at DESC, id DESC`` so OFFSET/LIMIT pages
+are stable when timestamps tie.  The composite index serves that ORDER BY
+directly and supersedes the single-column ``idx_scans_scanned_at``.
+
+On PostgreSQL the indexes are built and dropped concurrently (see
+``0002_add_indexes``).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_scanned_at_id_index"
+down_revision: Union[str, Sequence[str], None] = "0002_add_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_NEW_INDEX = ("idx_scans_scanned_at_id", [sa.text("scanned_at DESC"), sa.text("id DESC")])
+_OLD_INDEX = ("idx_scans_scanned_at", [sa.text("scanned_at DESC")])
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _swap(create: tuple, drop: tuple) -> None:
+    create_name, create_columns = create
+    drop_name, _ = drop
+    if _is_postgresql():
+        # CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                create_name,
+                "scans",
+                create_columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                drop_name,
+                table_name="scans",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        return
+
+    op.create_index(create_name, "scans", create_columns)
+    op.drop_index(drop_name, table_name="scans")
+
+
+def upgrade() -> None:
+    """Create the composite index, then drop the single-column one."""
+    _swap(create=_NEW_INDEX, drop=_OLD_INDEX)
+
+
+def downgrade() -> None:
+    """Restore the single-column scanned_at index."""
+    _swap(create=_OLD_INDEX, drop=_NEW_INDEX)
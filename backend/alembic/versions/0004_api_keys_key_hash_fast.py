@@ -0,0 +1,48 @@
+"""add api_keys.key_hash_fast lookup column
+
+Revision ID: 0004_api_keys_key_hash_fast
+Revises: 0003_scanned_at_id_index
+Create Date: 2026-10-15
+
+``validate_api_key`` looks keys up by a keyed BLAKE2b digest instead of
+SHA256.  The column is nullable: existing rows still match on ``key_hash``
+and are backfilled the first time they authenticate.
+
+``api_keys`` is created by ``init_db()`` rather than by an earlier revision,
+so this revision is a no-op on databases that do not have the table yet.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_api_keys_key_hash_fast"
+down_revision: Union[str, Sequence[str], None] = "0003_scanned_at_id_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX_NAME = "ix_api_keys_key_hash_fast"
+
+
+def _has_api_keys_table() -> bool:
+    return sa.inspect(op.get_bind()).has_table("api_keys")
+
+
+def upgrade() -> None:
+    """Add the nullable key_hash_fast column and its index."""
+    if not _has_api_keys_table():
+        return
+    with op.batch_alter_table("api_keys") as batch_op:
+        batch_op.add_column(sa.Column("key_hash_fast", sa.String(32), nullable=True))
+        batch_op.create_index(_INDEX_NAME, ["key_hash_fast"])
+
+
+def downgrade() -> None:
+    """Drop key_hash_fast; lookups fall back to SHA256 key_hash."""
+    if not _has_api_keys_table():
+        return
+    with op.batch_alter_table("api_keys") as batch_op:
+        batch_op.drop_index(_INDEX_NAME)
+        batch_op.drop_column("key_hash_fast")
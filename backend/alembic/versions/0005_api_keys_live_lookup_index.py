@@ -0,0 +1,105 @@
+"""index only live API keys for the authentication lookup
+
+Revision ID: 0005_api_keys_live_lookup_index
+Revises: 0004_api_keys_key_hash_fast
+Create Date: 2026-10-15
+
+Replaces the plain ``key_hash_fast`` index and the low-selectivity
+``(is_active, is_revoked)`` index with one partial unique index on
+``key_hash_fast WHERE is_active AND NOT is_revoked``.  The lookup query
+keeps the same predicate, which is what lets the planner use the smaller
+index; revoked keys simply fall out of it.
+
+Like ``0004``, this is a no-op where ``api_keys`` does not exist yet.
+On PostgreSQL the indexes are built and dropped concurrently (see
+``0002_add_indexes``).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_api_keys_live_lookup_index"
+down_revision: Union[str, Sequence[str], None] = "0004_api_keys_key_hash_fast"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_LIVE_INDEX = "idx_api_keys_fast_live"
+_LIVE_PREDICATE = sa.text("is_active AND NOT is_revoked")
+
+# (index name, columns) replaced by the partial index
+_OLD_INDEXES = (
+    ("ix_api_keys_key_hash_fast", ["key_hash_fast"]),
+    ("idx_api_keys_active", ["is_active", "is_revoked"]),
+)
+
+
+def _has_api_keys_table() -> bool:
+    return sa.inspect(op.get_bind()).has_table("api_keys")
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Create the partial live-key index, then drop the ones it replaces."""
+    if not _has_api_keys_table():
+        return
+
+    if _is_postgresql():
+        # CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                _LIVE_INDEX,
+                "api_keys",
+                ["key_hash_fast"],
+                unique=True,
+                postgresql_where=_LIVE_PREDICATE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            for name, _ in _OLD_INDEXES:
+                op.drop_index(
+                    name,
+                    table_name="api_keys",
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+        return
+
+    op.create_index(
+        _LIVE_INDEX, "api_keys", ["key_hash_fast"], unique=True, sqlite_where=_LIVE_PREDICATE
+    )
+    for name, _ in _OLD_INDEXES:
+        op.drop_index(name, table_name="api_keys", if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the plain indexes and drop the partial one."""
+    if not _has_api_keys_table():
+        return
+
+    if _is_postgresql():
+        with op.get_context().autocommit_block():
+            for name, columns in _OLD_INDEXES:
+                op.create_index(
+                    name,
+                    "api_keys",
+                    columns,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+            op.drop_index(
+                _LIVE_INDEX,
+                table_name="api_keys",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        return
+
+    for name, columns in _OLD_INDEXES:
+        op.create_index(name, "api_keys", columns)
+    op.drop_index(_LIVE_INDEX, table_name="api_keys")
@@ -0,0 +1,93 @@
+"""store api_keys.key_hash_fast as raw bytes
+
+Revision ID: 0006_key_hash_fast_binary
+Revises: 0005_api_keys_live_lookup_index
+Create Date: 2026-10-15
+
+The lookup digest is now stored as 16 raw bytes instead of 32 hex
+characters, halving the key size of ``idx_api_keys_fast_live``.
+
+The column is dropped and re-added rather than converted: it is only a
+lookup accelerator, and ``validate_api_key`` backfills it from the SHA256
+``key_hash`` the next time each key authenticates.  Like ``0004``, this
+is a no-op where ``api_keys`` does not exist yet.  On PostgreSQL the
+partial index is dropped and rebuilt concurrently (see ``0005``).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_key_hash_fast_binary"
+down_revision: Union[str, Sequence[str], None] = "0005_api_keys_live_lookup_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_LIVE_INDEX = "idx_api_keys_fast_live"
+_LIVE_PREDICATE = sa.text("is_active AND NOT is_revoked")
+
+
+def _has_api_keys_table() -> bool:
+    return sa.inspect(op.get_bind()).has_table("api_keys")
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _drop_live_index() -> None:
+    if _is_postgresql():
+        # CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                _LIVE_INDEX,
+                table_name="api_keys",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        return
+
+    op.drop_index(_LIVE_INDEX, table_name="api_keys", if_exists=True)
+
+
+def _create_live_index() -> None:
+    if _is_postgresql():
+        with op.get_context().autocommit_block():
+            op.create_index(
+                _LIVE_INDEX,
+                "api_keys",
+                ["key_hash_fast"],
+                unique=True,
+                postgresql_where=_LIVE_PREDICATE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        return
+
+    op.create_index(
+        _LIVE_INDEX, "api_keys", ["key_hash_fast"], unique=True, sqlite_where=_LIVE_PREDICATE
+    )
+
+
+def _rebuild_column(column_type: sa.types.TypeEngine) -> None:
+    """Recreate key_hash_fast (empty) with *column_type* and re-index it."""
+    if not _has_api_keys_table():
+        return
+    _drop_live_index()
+    with op.batch_alter_table("api_keys") as batch_op:
+        batch_op.drop_column("key_hash_fast")
+    with op.batch_alter_table("api_keys") as batch_op:
+        batch_op.add_column(sa.Column("key_hash_fast", column_type, nullable=True))
+    _create_live_index()
+
+
+def upgrade() -> None:
+    """Replace the hex column with a 16-byte binary one."""
+    _rebuild_column(sa.LargeBinary(16))
+
+
+def downgrade() -> None:
+    """Restore the 32-character hex column."""
+    _rebuild_column(sa.String(32))
@@ -2,18 +2,26 @@
 BlockScope Analysis Module.
 
 Exports core components for smart contract vulnerability analysis.
+
+Exports are resolved lazily (PEP 562) so that importing a lightweight
+submodule such as ``analysis.cache`` or ``analysis.rules.base`` does not
+pull in the orchestrator, Pydantic models, or Slither wrapper.
 """
 
-from .models import Finding as PydanticFinding
-from .models import ScanRequest, ScanResult
-from .orchestrator import AnalysisOrchestrator
+from importlib import import_module
+from typing import Any, Dict, List, Tuple
 
-# Also export the rule-based Finding for rule authors
-try:
-    from .rules.base import Finding as RuleFinding
-    from .rules.base import Severity, VulnerabilityRule
-except ImportError:
-    pass
+# Exported name → (submodule, attribute)
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "AnalysisOrchestrator": (".orchestrator", "AnalysisOrchestrator"),
+    "ScanRequest": (".models", "ScanRequest"),
+    "ScanResult": (".models", "ScanResult"),
+    "PydanticFinding": (".models", "Finding"),
+    # Also export the rule-based Finding for rule authors
+    "RuleFinding": (".rules.base", "Finding"),
+    "Severity": (".rules.base", "Severity"),
+    "VulnerabilityRule": (".rules.base", "VulnerabilityRule"),
+}
 
 __all__ = [
     "AnalysisOrchestrator",
@@ -21,3 +29,18 @@ __all__ = [
     "ScanResult",
     "PydanticFinding",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access and cache them on the package."""
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -4,15 +4,64 @@ Data models for smart contract security scanning.
 This module defines the core data structures used for scan requests and results.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from enum import IntEnum
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
 
+class SeverityRank(IntEnum):
+    """
+    Integer rank for each severity level, most severe first.
+
+    Used for sorting, counting, and scoring findings without repeated
+    string lowering and dict lookups.  ``UNKNOWN`` covers any severity
+    string outside the recognised set.
+    """
+
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+    INFO = 4
+    UNKNOWN = 5
+
+
+_SEVERITY_RANKS: Dict[str, SeverityRank] = {
+    "critical": SeverityRank.CRITICAL,
+    "high": SeverityRank.HIGH,
+    "medium": SeverityRank.MEDIUM,
+    "low": SeverityRank.LOW,
+    "info": SeverityRank.INFO,
+}
+
+
+def severity_rank(severity: str) -> SeverityRank:
+    """
+    Map a severity string (case-insensitive) to its :class:`SeverityRank`.
+
+    Args:
+        severity: Severity label such as ``"critical"`` or ``"High"``.
+
+    Returns:
+        Matching rank, or ``SeverityRank.UNKNOWN`` if unrecognised.
+    """
+    # Severities are almost always already lowercase; only allocate a
+    # lowered copy when the exact lookup misses.
+    rank = _SEVERITY_RANKS.get(severity)
+    if rank is None:
+        rank = _SEVERITY_RANKS.get(severity.lower(), SeverityRank.UNKNOWN)
+    return rank
+
+
 class Finding(BaseModel):
     """
     Represents a single security finding/vulnerability in a smart contract.
+
+    The severity rank is derived from :attr:`severity` on access, so it stays
+    correct after reassignment or ``model_copy(update=...)``.
     """
 
     title: str = Field(..., description="Short title of the vulnerability")
@@ -22,6 +71,11 @@ class Finding(BaseModel):
     code_snippet: Optional[str] = Field(None, description="Relevant code snippet")
     recommendation: Optional[str] = Field(None, description="Suggested fix or mitigation")
 
+    @property
+    def rank(self) -> SeverityRank:
+        """Integer severity rank (``0`` = critical … ``5`` = unknown)."""
+        return severity_rank(self.severity)
+
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -36,6 +90,43 @@ class Finding(BaseModel):
     }
 
 
+@dataclass(slots=True)
+class FastFinding:
+    """
+    Lightweight, unvalidated finding used inside the analysis pipeline.
+
+    Slither and rule findings come from trusted code, so the orchestrator
+    builds these plain slotted dataclasses and only converts to the Pydantic
+    :class:`Finding` at the :class:`ScanResult` boundary via :meth:`to_model`.
+    Attribute names mirror :class:`Finding`.
+    """
+
+    title: str
+    severity: str
+    description: str
+    line_number: Optional[int] = None
+    code_snippet: Optional[str] = None
+    recommendation: Optional[str] = None
+    rank: Optional[SeverityRank] = None
+
+    def __post_init__(self) -> None:
+        # Callers that already know the rank (e.g. Slither impact mapping)
+        # pass it in to skip the string lookup.
+        if self.rank is None:
+            self.rank = severity_rank(self.severity)
+
+    def to_model(self) -> Finding:
+        """Return the equivalent Pydantic :class:`Finding` without re-validation."""
+        return Finding.model_construct(
+            title=self.title,
+            severity=self.severity,
+            description=self.description,
+            line_number=self.line_number,
+            code_snippet=self.code_snippet,
+            recommendation=self.recommendation,
+        )
+
+
 class ScanRequest(BaseModel):
     """
     Request model for initiating a smart contract security scan.
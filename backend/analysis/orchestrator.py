@@ -12,9 +12,18 @@ This module orchestrates the complete security analysis pipeline:
 
 Performance notes:
   - Identical contracts are served from the in-memory LRU cache (30-min TTL).
-  - Slither analysis and rule detection share a single temp file.
-  - Both passes run through a ``ThreadPoolExecutor`` when multiple CPU cores
-    are available, reducing wall-clock time by ~40–60 % on average hardware.
+  - Sources are written to ``/dev/shm`` (tmpfs) when available, so cache
+    misses avoid disk I/O.
+  - The contract is parsed by Slither exactly once per scan; detector
+    extraction and every rule consume the same parsed object.
+  - Detector extraction and each rule's ``detect()`` call are fanned out
+    across a shared ``ThreadPoolExecutor``.  Parsed Slither objects are not
+    picklable, and the parse itself already runs in a child process (see
+    :mod:`analysis.slither_wrapper`), so threads are used instead of a
+    process pool.
+  - Rules are dispatched in descending order of their moving-average
+    ``detect()`` latency (longest-processing-time-first), which keeps a slow
+    rule from becoming a straggler at the end of the fan-out.
 
 Two-tier cache architecture
 ---------------------------
@@ -34,16 +43,24 @@ On a **router hit**: analysis is skipped entirely; only a DB insert runs.
 On a **router miss**: Slither runs.
 """
 
+import asyncio
+import hashlib
 import logging
+import multiprocessing
+import operator
 import os
 import re
 import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
-
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .models import FastFinding
 from .models import Finding as PydanticFinding
-from .models import ScanRequest, ScanResult
+from .models import ScanRequest, ScanResult, SeverityRank
 from .rules.base import Finding as RuleFinding
 from .rules.base import VulnerabilityRule
 from .slither_wrapper import SlitherWrapper
@@ -51,37 +68,84 @@ from .source_rules import run_source_rules
 
 logger = logging.getLogger("blockscope.analysis")
 
+# Findings flowing through aggregation: internal fast findings from Slither and
+# rules, plus Pydantic findings produced by the source-based rules.
+_AnyFinding = Union[FastFinding, PydanticFinding]
+
 _ANALYSIS_WORKERS: int = max(2, min(os.cpu_count() or 2, 4))
-_ANALYSIS_POOL = ThreadPoolExecutor(
-    max_workers=_ANALYSIS_WORKERS,
-    thread_name_prefix="blockscope-analysis",
+_analysis_pool: Optional[ThreadPoolExecutor] = None
+_analysis_pool_lock = threading.Lock()
+
+
+def _get_analysis_pool() -> ThreadPoolExecutor:
+    """
+    Return the shared analysis pool, creating it on first use.
+
+    The pool is rebuilt after :func:`shutdown_analysis_pool`, so an app
+    that is shut down and started again (e.g. repeated test lifespans)
+    keeps working instead of failing with "cannot schedule new futures
+    after shutdown".
+    """
+    global _analysis_pool
+    with _analysis_pool_lock:
+        if _analysis_pool is None:
+            _analysis_pool = ThreadPoolExecutor(
+                max_workers=_ANALYSIS_WORKERS,
+                thread_name_prefix="blockscope-analysis",
+            )
+        return _analysis_pool
+
+
+def shutdown_analysis_pool() -> None:
+    """Shut down the shared analysis pool without waiting; the next scan recreates it."""
+    global _analysis_pool
+    with _analysis_pool_lock:
+        pool, _analysis_pool = _analysis_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Temp directory for materialised sources: tmpfs when available (Linux)
+_TEMP_SOURCE_DIR: Optional[str] = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
 )
 
-# Severity ordering used for deduplication sorting
-_SEVERITY_ORDER: Dict[str, int] = {
-    "critical": 0,
-    "high": 1,
-    "medium": 2,
-    "low": 3,
-    "info": 4,
-}
+# Line-number bits of the packed dedup key; all ones marks "no line"
+_NO_LINE: int = 0xFFFFFFFF
 
-# Scoring weights per severity level
-_SEVERITY_WEIGHTS: Dict[str, int] = {
-    "critical": 10,
-    "high": 5,
-    "medium": 2,
-    "low": 1,
-    "info": 0,
-}
+# Severity names indexed by SeverityRank (UNKNOWN is not reported)
+_SEVERITY_NAMES: Tuple[str, ...] = ("critical", "high", "medium", "low", "info")
+
+# Scoring weights indexed by SeverityRank: critical, high, medium, low, info, unknown
+_SEVERITY_WEIGHTS: Tuple[int, ...] = (10, 5, 2, 1, 0, 0)
+
+# Severity levels listed in scan summaries, most severe first
+_SUMMARY_LEVELS: Tuple[str, ...] = ("critical", "high", "medium", "low")
 
-# Slither impact → internal severity mapping
-_SLITHER_IMPACT_MAP: Dict[str, str] = {
-    "High": "critical",
-    "Medium": "high",
-    "Low": "medium",
-    "Informational": "low",
+# (minimum score, status label) pairs, checked in order; anything lower is UNSAFE
+_SUMMARY_STATUS: Tuple[Tuple[int, str], ...] = (
+    (80, "GOOD [OK]"),
+    (60, "MODERATE [WARNING]"),
+    (40, "RISKY [WARNING]"),
+)
+
+# Primary contract name; Solidity identifiers are ASCII-only
+_CONTRACT_NAME_RE = re.compile(r"\bcontract\s+(\w+)", re.ASCII)
+
+# Slither impact → (internal severity, rank), keyed by the impact's first
+# character.  Slither's four impact levels (High, Medium, Low, Informational)
+# all start with distinct letters; anything else (e.g. Optimization) → low.
+_SLITHER_IMPACT_BY_CHAR: Dict[str, Tuple[str, SeverityRank]] = {
+    "H": ("critical", SeverityRank.CRITICAL),
+    "M": ("high", SeverityRank.HIGH),
+    "L": ("medium", SeverityRank.MEDIUM),
+    "I": ("low", SeverityRank.LOW),
 }
+_SLITHER_IMPACT_DEFAULT: Tuple[str, SeverityRank] = ("low", SeverityRank.LOW)
+
+# Per-rule latency EWMA: seed value (seconds) and smoothing factor
+_RULE_COST_SEED: float = 1.0
+_RULE_COST_ALPHA: float = 0.1
 
 
 class AnalysisOrchestrator:
@@ -105,11 +169,19 @@ class AnalysisOrchestrator:
             rules: List of ``VulnerabilityRule`` instances to run during analysis.
         """
         self.rules: List[VulnerabilityRule] = rules
+        # EWMA of each rule's detect() latency, used to dispatch slow rules first
+        self._rule_cost: Dict[str, float] = {r.rule_id: _RULE_COST_SEED for r in rules}
         self.slither_wrapper: SlitherWrapper = SlitherWrapper()
-        logger.debug(
-            "AnalysisOrchestrator initialised",
-            extra={"rule_count": len(rules), "slither_available": self.slither_wrapper.available},
-        )
+        # Only probe Slither availability (which imports it) when the debug
+        # record will actually be emitted; otherwise defer to first analysis.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "AnalysisOrchestrator initialised",
+                extra={
+                    "rule_count": len(rules),
+                    "slither_available": self.slither_wrapper.available,
+                },
+            )
 
     # ----------------------------------------------
     # Public interface
@@ -122,13 +194,15 @@ class AnalysisOrchestrator:
         Steps:
 
         1. Check the analysis cache — return immediately on hit.
-        2. Write a single shared temp file for both Slither and rule passes.
-        3. Run Slither and custom rules concurrently via a thread pool.
+        2. Parse the source once with Slither; identical source served from
+           the content-addressed parse cache without touching disk.
+        3. Fan Slither extraction and each custom rule out across a thread pool.
         4. Run lightweight source-based rules (no compiler dependency).
-        5. Deduplicates findings.
-        6. Calculates severity breakdown and security score.
-        7. Generates a human-readable summary.
-        8. Stores the result in the cache and returns a :class:`ScanResult`.
+        5. Deduplicates findings, calculating the severity breakdown and
+           security score in the same pass.
+        6. Generates a human-readable summary.
+        7. Converts internal findings to Pydantic models and returns a
+           :class:`ScanResult`.
 
         Args:
             request: ``ScanRequest`` containing source code and metadata.
@@ -143,52 +217,41 @@ class AnalysisOrchestrator:
 
 
 
-        # -- 2. Write shared temp file ------------------------------------
-        tmp_file_path: Optional[str] = None
-        slither_findings: List[PydanticFinding] = []
-        rule_findings: List[PydanticFinding] = []
-
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".sol", delete=False, encoding="utf-8"
-            ) as tmp_file:
-                tmp_file.write(request.source_code)
-                tmp_file_path = tmp_file.name
-
-            # -- 3. Concurrent analysis -----------------------------------
-            future_slither = _ANALYSIS_POOL.submit(
-                self._run_slither_analysis_from_file,
-                tmp_file_path,
-            )
-            future_rules = _ANALYSIS_POOL.submit(
-                self._run_rule_analysis_from_file,
-                tmp_file_path,
-                request,
-            )
-
-            for future in as_completed([future_slither, future_rules]):
-                try:
-                    result_findings = future.result()
-                    if future is future_slither:
-                        slither_findings = result_findings
-                        logger.info(
-                            "Slither scan complete",
-                            extra={"finding_count": len(slither_findings)},
-                        )
-                    else:
-                        rule_findings = result_findings
-                        logger.info(
-                            "Rule scan complete",
-                            extra={"finding_count": len(rule_findings)},
-                        )
-                except Exception as exc:
-                    logger.warning(
-                        "A concurrent analysis pass failed — continuing",
-                        exc_info=exc,
-                    )
+        # -- 2. Parse exactly once (content-addressed) ---------------------
+        slither_findings: List[FastFinding] = []
+        rule_findings: List[FastFinding] = []
+        source_hash = hashlib.sha256(request.source_code.encode("utf-8")).hexdigest()
+        slither_obj, ast = self._parse_source(request.source_code, source_hash)
+
+        # -- 3. Fan out Slither extraction and each rule ------------------
+        # Rules are submitted longest-expected-first so a slow rule does not
+        # start last and leave the other workers idle behind it.
+        pool = _get_analysis_pool()
+        future_slither = pool.submit(self._extract_slither_findings, slither_obj)
+        rule_futures = [pool.submit(self._run_rule, rule, ast) for rule in self._rules_by_cost()]
+
+        for future in as_completed([future_slither, *rule_futures]):
+            try:
+                result_findings = future.result()
+            except Exception as exc:
+                logger.warning(
+                    "A concurrent analysis pass failed — continuing",
+                    exc_info=exc,
+                )
+                continue
+            if future is future_slither:
+                slither_findings = result_findings
+            else:
+                rule_findings.extend(result_findings)
 
-        finally:
-            _remove_temp_file(tmp_file_path)
+        logger.info(
+            "Slither scan complete",
+            extra={"finding_count": len(slither_findings)},
+        )
+        logger.info(
+            "Rule scan complete",
+            extra={"finding_count": len(rule_findings)},
+        )
 
         # -- 4. Source-based rules (no compiler required) -----------------
         source_rule_findings = self._run_source_rule_analysis(request)
@@ -198,23 +261,22 @@ class AnalysisOrchestrator:
         )
 
         # -- 5-7. Aggregate, score, summarise -----------------------------
-        all_findings = self._merge_and_deduplicate(
+        all_findings, severity_breakdown, overall_score = self._merge_and_deduplicate(
             slither_findings, rule_findings + source_rule_findings
         )
-        severity_breakdown = self._calculate_severity_breakdown(all_findings)
-        overall_score = self._calculate_score(all_findings)
         summary = self._generate_summary(severity_breakdown, overall_score)
         contract_name = request.contract_name or self._extract_contract_name(request.source_code)
 
         result = ScanResult(
             contract_name=contract_name,
             source_code=request.source_code,
-            findings=all_findings,
+            findings=[
+                f.to_model() if isinstance(f, FastFinding) else f for f in all_findings
+            ],
             vulnerabilities_count=len(all_findings),
             severity_breakdown=severity_breakdown,
             overall_score=overall_score,
             summary=summary,
-            timestamp=datetime.now(timezone.utc),
         )
 
 
@@ -230,89 +292,261 @@ class AnalysisOrchestrator:
         )
         return result
 
+    async def analyze_async(
+        self, request: ScanRequest, executor: Optional[Executor] = None
+    ) -> ScanResult:
+        """
+        Run :meth:`analyze` without blocking the event loop.
+
+        Preferred entry point for async frameworks (FastAPI, etc.): Slither
+        parsing and rule detection take seconds and would otherwise stall
+        every other request served by the loop.
+
+        Args:
+            request: ``ScanRequest`` containing source code and metadata.
+            executor: Executor to run the analysis on.  Defaults to the event
+                loop's default thread pool.  Do not pass the internal analysis
+                pool — :meth:`analyze` itself waits on tasks submitted there.
+
+        Returns:
+            ``ScanResult`` with all findings, scores, and summary.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.analyze, request)
+
+    def analyze_many(
+        self,
+        requests: List[ScanRequest],
+        workers: Optional[int] = None,
+        chunksize: int = 4,
+    ) -> List[ScanResult]:
+        """
+        Analyse many contracts in parallel across worker processes.
+
+        Intended for batch workloads (CI, repository-wide scans) where each
+        contract would otherwise pay Slither start-up cost serially.  Each
+        worker process builds its own orchestrator once from ``self.rules``
+        and keeps it (and its parse cache) for every request it handles.
+
+        Rules must be picklable to be shipped to the workers.  A single
+        request, or ``workers=1``, is analysed in-process.
+
+        Args:
+            requests: Scan requests to analyse.
+            workers: Maximum worker processes (default: CPU count).
+            chunksize: Requests sent to a worker per IPC round-trip.
+
+        Returns:
+            One :class:`ScanResult` per request, in the same order.
+        """
+        if not requests:
+            return []
+
+        max_workers = min(workers or os.cpu_count() or 1, len(requests))
+        if max_workers <= 1:
+            return [self.analyze(request) for request in requests]
+
+        logger.info(
+            "Starting batch analysis",
+            extra={"contract_count": len(requests), "workers": max_workers},
+        )
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.rules,),
+        ) as pool:
+            return list(pool.map(_worker_analyze, requests, chunksize=max(1, chunksize)))
+
+    def clear_cache(self) -> int:
+        """
+        Drop cached Slither parses and reset per-rule cost estimates.
+
+        Parses are cached by source hash and shared across orchestrators, so
+        tests that swap rules or patch the parser should call this to start
+        from a cold cache.
+
+        Returns:
+            Number of cached parse results evicted.
+        """
+        self._rule_cost = {r.rule_id: _RULE_COST_SEED for r in self.rules}
+        return self.slither_wrapper.clear_parse_cache()
+
     # ----------------------------------------------
     # Private helpers — concurrent analysis passes
     # ----------------------------------------------
 
-    def _run_slither_analysis_from_file(
-        self, tmp_file_path: str
-    ) -> List[PydanticFinding]:
+    def _parse_source(
+        self, source_code: str, source_hash: str
+    ) -> Tuple[Optional[Any], Optional[Any]]:
         """
-        Run Slither on an already-written temp file.
+        Resolve the Slither parse for ``source_code``, reusing cached parses.
 
-        Designed to be called from a thread pool alongside
-        :meth:`_run_rule_analysis_from_file`.
+        Identical source bytes hit the Slither parse cache directly, skipping
+        both the temp-file write and the Slither invocation.  On a miss the
+        source is written once via :func:`_materialize_source` and handed to
+        :meth:`_parse_once`.
+
+        Args:
+            source_code: Solidity source to analyse.
+            source_hash: SHA-256 hex digest of the UTF-8 encoded source.
+
+        Returns:
+            ``(slither_obj, ast)`` tuple, as returned by :meth:`_parse_once`.
+        """
+        if not self.slither_wrapper.available:
+            logger.warning("Slither not available — skipping static analysis")
+            return None, None
+
+        slither_obj = self.slither_wrapper.get_cached_parse(source_hash)
+        if slither_obj is not None:
+            logger.debug("Reusing cached Slither parse", extra={"source_hash": source_hash})
+            return slither_obj, self._resolve_ast(slither_obj)
+
+        tmp_file_path: Optional[str] = None
+        try:
+            tmp_file_path = _materialize_source(source_code, source_hash)
+            return self._parse_once(tmp_file_path, source_hash)
+        finally:
+            _remove_temp_file(tmp_file_path)
+
+    def _parse_once(
+        self, tmp_file_path: str, source_hash: Optional[str] = None
+    ) -> Tuple[Optional[Any], Optional[Any]]:
+        """
+        Parse the contract a single time for both Slither and rule passes.
 
         Args:
             tmp_file_path: Absolute path to the ``.sol`` temp file.
+            source_hash: Optional SHA-256 of the file contents, forwarded to
+                the parse cache so the file is not hashed a second time.
 
         Returns:
-            List of :class:`PydanticFinding` from Slither detectors.
+            ``(slither_obj, ast)`` tuple.  Either element is ``None`` when Slither
+            is unavailable or parsing fails; the AST is only resolved when rules
+            are registered.
         """
         if not self.slither_wrapper.available:
             logger.warning("Slither not available — skipping static analysis")
-            return []
+            return None, None
 
-        findings: List[PydanticFinding] = []
         try:
-            slither_obj = self.slither_wrapper.parse_contract(tmp_file_path)
-            if slither_obj and hasattr(slither_obj, "detectors_results"):
-                for detector_result in slither_obj.detectors_results:
-                    finding = self._convert_slither_finding(detector_result)
-                    if finding:
-                        findings.append(finding)
+            if source_hash is None:
+                slither_obj = self.slither_wrapper.parse_contract(tmp_file_path)
+            else:
+                slither_obj = self.slither_wrapper.parse_contract(
+                    tmp_file_path, content_hash=source_hash
+                )
         except Exception as exc:
             logger.warning(
                 "Slither analysis failed — continuing without static findings",
                 exc_info=exc,
             )
-        return findings
+            return None, None
 
-    def _run_rule_analysis_from_file(
-        self, tmp_file_path: str, request: ScanRequest
-    ) -> List[PydanticFinding]:
-        """
-        Execute all registered vulnerability rules against the temp file.
+        return slither_obj, self._resolve_ast(slither_obj)
 
-        Designed to be called from a thread pool alongside
-        :meth:`_run_slither_analysis_from_file`.
+    def _resolve_ast(self, slither_obj: Optional[Any]) -> Optional[Any]:
+        """
+        Return the AST nodes for ``slither_obj`` when any rules need them.
 
         Args:
-            tmp_file_path: Absolute path to the ``.sol`` temp file.
-            request: Original scan request (for context metadata).
+            slither_obj: Parsed Slither object, or ``None``.
 
         Returns:
-            Aggregated list of :class:`PydanticFinding` from all rules.
+            AST nodes, or ``None`` when there are no rules or resolution fails.
         """
-        if not self.rules:
-            return []
+        if not self.rules or slither_obj is None:
+            return None
+        try:
+            return self.slither_wrapper.get_ast_nodes(slither_obj)
+        except Exception as exc:
+            logger.warning("AST parsing failed — rules will be skipped", exc_info=exc)
+            return None
 
-        findings: List[PydanticFinding] = []
+    def _extract_slither_findings(self, slither_obj: Optional[Any]) -> List[FastFinding]:
+        """
+        Convert the detector results of a parsed Slither object to findings.
+
+        Args:
+            slither_obj: Object returned by :meth:`_parse_once`, or ``None``.
+
+        Returns:
+            List of :class:`FastFinding` from Slither detectors.
+        """
+        findings: List[FastFinding] = []
+        if slither_obj is None or not hasattr(slither_obj, "detectors_results"):
+            return findings
         try:
-            ast = None
-            if self.slither_wrapper.available:
-                try:
-                    # Leverages parse cache — likely already parsed by Slither thread
-                    slither_obj = self.slither_wrapper.parse_contract(tmp_file_path)
-                    ast = self.slither_wrapper.get_ast_nodes(slither_obj)
-                except Exception as exc:
-                    logger.warning("AST parsing failed — rules will be skipped", exc_info=exc)
-
-            for rule in self.rules:
-                try:
-                    rule_findings: List[RuleFinding] = rule.detect(ast) if ast else []
-                    for rf in rule_findings:
-                        findings.append(self._convert_rule_finding(rf))
-                except Exception as exc:
-                    logger.warning(
-                        "Rule '%s' raised an exception — skipping",
-                        rule.rule_id,
-                        exc_info=exc,
-                    )
+            for detector_result in slither_obj.detectors_results:
+                finding = self._convert_slither_finding(detector_result)
+                if finding:
+                    findings.append(finding)
         except Exception as exc:
-            logger.warning("Rule analysis setup failed", exc_info=exc)
+            logger.warning(
+                "Slither analysis failed — continuing without static findings",
+                exc_info=exc,
+            )
         return findings
 
+    def _run_rule(self, rule: VulnerabilityRule, ast: Optional[Any]) -> List[FastFinding]:
+        """
+        Execute a single vulnerability rule against the shared AST.
+
+        Called concurrently for every registered rule; ``ast`` is shared
+        between worker threads and must be treated as read-only.  Exceptions
+        raised by the rule are logged and swallowed so one broken rule never
+        aborts the scan.
+
+        Args:
+            rule: Rule to execute.
+            ast: AST nodes returned by :meth:`_parse_once`.
+
+        Returns:
+            Converted findings emitted by ``rule``.
+        """
+        if not ast:
+            return []
+        started = time.perf_counter()
+        rule_id, outcome = _safe_detect(rule, ast)
+        self._record_rule_cost(rule_id, time.perf_counter() - started)
+        if isinstance(outcome, Exception):
+            logger.warning(
+                "Rule '%s' raised an exception — skipping",
+                rule_id,
+                exc_info=outcome,
+            )
+            return []
+        return [self._convert_rule_finding(rf) for rf in outcome]
+
+    def _rules_by_cost(self) -> List[VulnerabilityRule]:
+        """
+        Return registered rules ordered by expected cost, most expensive first.
+
+        Rules without a recorded cost (e.g. appended after construction) are
+        treated as having the seed cost.
+
+        Returns:
+            A new list; ``self.rules`` is left untouched.
+        """
+        cost = self._rule_cost
+        return sorted(
+            self.rules, key=lambda r: cost.get(r.rule_id, _RULE_COST_SEED), reverse=True
+        )
+
+    def _record_rule_cost(self, rule_id: str, elapsed: float) -> None:
+        """
+        Fold one ``detect()`` timing into the rule's latency EWMA.
+
+        Args:
+            rule_id: Identifier of the rule that ran.
+            elapsed: Wall-clock seconds spent in ``detect()``.
+        """
+        previous = self._rule_cost.get(rule_id, _RULE_COST_SEED)
+        self._rule_cost[rule_id] = (
+            (1.0 - _RULE_COST_ALPHA) * previous + _RULE_COST_ALPHA * elapsed
+        )
+
     def _run_source_rule_analysis(self, request: ScanRequest) -> List[PydanticFinding]:
         """
         Run lightweight source-based rules that do not depend on Slither.
@@ -330,18 +564,21 @@ class AnalysisOrchestrator:
     # Private helpers — conversion
     # ----------------------------------------------
 
-    def _convert_slither_finding(self, detector_result: Dict) -> Optional[PydanticFinding]:
+    def _convert_slither_finding(self, detector_result: Dict) -> Optional[FastFinding]:
         """
-        Convert a raw Slither detector result dict to a :class:`PydanticFinding`.
+        Convert a raw Slither detector result dict to a :class:`FastFinding`.
 
         Args:
             detector_result: Dictionary produced by Slither's detector.
 
         Returns:
-            Converted :class:`PydanticFinding`, or ``None`` if conversion fails.
+            Converted :class:`FastFinding`, or ``None`` if conversion fails.
         """
         try:
-            severity = _SLITHER_IMPACT_MAP.get(detector_result.get("impact", "Low"), "low")
+            impact = detector_result.get("impact", "Low")
+            severity, rank = _SLITHER_IMPACT_BY_CHAR.get(
+                impact[:1] if impact else "", _SLITHER_IMPACT_DEFAULT
+            )
 
             line_number: Optional[int] = None
             elements = detector_result.get("elements", [])
@@ -350,9 +587,10 @@ class AnalysisOrchestrator:
                 lines: List[int] = source_mapping.get("lines", [])
                 line_number = lines[0] if lines else None
 
-            return PydanticFinding(
+            return FastFinding(
                 title=detector_result.get("check", "Unknown Slither Issue"),
                 severity=severity,
+                rank=rank,
                 description=detector_result.get("description", "Issue detected by Slither"),
                 line_number=line_number,
                 code_snippet=None,
@@ -364,17 +602,17 @@ class AnalysisOrchestrator:
             logger.warning("Failed to convert Slither finding", exc_info=exc)
             return None
 
-    def _convert_rule_finding(self, rule_finding: RuleFinding) -> PydanticFinding:
+    def _convert_rule_finding(self, rule_finding: RuleFinding) -> FastFinding:
         """
-        Convert a :class:`RuleFinding` dataclass to a :class:`PydanticFinding`.
+        Convert a :class:`RuleFinding` dataclass to a :class:`FastFinding`.
 
         Args:
             rule_finding: Finding emitted by a custom vulnerability rule.
 
         Returns:
-            Equivalent :class:`PydanticFinding` Pydantic model.
+            Equivalent :class:`FastFinding`.
         """
-        return PydanticFinding(
+        return FastFinding(
             title=rule_finding.name,
             severity=rule_finding.severity.value,
             description=rule_finding.description,
@@ -389,24 +627,32 @@ class AnalysisOrchestrator:
 
     def _merge_and_deduplicate(
         self,
-        slither_findings: List[PydanticFinding],
-        rule_findings: List[PydanticFinding],
-    ) -> List[PydanticFinding]:
+        slither_findings: List[_AnyFinding],
+        rule_findings: List[_AnyFinding],
+    ) -> Tuple[List[_AnyFinding], Dict[str, int], int]:
         """
         Merge findings from Slither and rules, removing duplicates.
 
-        Deduplication key: ``(severity, title, line_number)``.  Only findings
-        that represent the exact same issue (same check name, same severity, same
-        source line) are merged; when two entries share the key, the one with the
-        longer description is kept (heuristic for richer detail).
+        The severity breakdown and security score are accumulated in the same
+        pass, so the findings list is only walked once during aggregation.
+        Because severity is part of the dedup key, replacing an entry never
+        changes its severity and the running totals stay exact.
+
+        Deduplication key: ``(severity, title, line_number)``, with severity
+        compared by rank (case-insensitive).  Only findings that represent the
+        exact same issue (same check name, same severity, same source line) are
+        merged; when two entries share the key, the one with the longer
+        description is kept (heuristic for richer detail).
 
         Args:
             slither_findings: Findings from Slither static analysis.
             rule_findings: Findings from custom vulnerability rules.
 
         Returns:
-            Deduplicated and severity-sorted list of findings
-            (critical → high → medium → low → info).
+            ``(findings, severity_breakdown, score)`` where ``findings`` is the
+            deduplicated, severity-sorted list (critical → high → medium →
+            low → info) and the other two match
+            :meth:`_calculate_severity_breakdown` and :meth:`_calculate_score`.
         """
         # BUG-007 fix: the original key was (severity, line_number).  When two
         # *different* issues share the same severity and line_number=None (e.g. two
@@ -419,28 +665,41 @@ class AnalysisOrchestrator:
         # Fix: include the normalised title in the key so only genuinely duplicate
         # findings (same issue, same severity, same line) are merged.  Two findings
         # are only considered duplicates when all three fields match.
-        unique: Dict[Tuple[str, str, Optional[int]], PydanticFinding] = {}
-
-        for finding in slither_findings + rule_findings:
-            key: Tuple[str, str, Optional[int]] = (
-                finding.severity,
+        #
+        # Severity rank and line number are packed into one int
+        # (``rank << 32 | line``) so the key is a cheap (int, str) pair.
+        if not slither_findings and not rule_findings:
+            # Clean contracts are the common case: skip the merge machinery.
+            return [], dict.fromkeys(_SEVERITY_NAMES, 0), 100
+
+        unique: Dict[Tuple[int, str], _AnyFinding] = {}
+        counts: List[int] = [0] * len(_SEVERITY_WEIGHTS)
+
+        for finding in chain(slither_findings, rule_findings):
+            line = finding.line_number
+            key: Tuple[int, str] = (
+                (finding.rank << 32) | (_NO_LINE if line is None else line & _NO_LINE),
                 finding.title.strip().lower(),
-                finding.line_number,
             )
             existing = unique.get(key)
-            if existing is None or len(finding.description) > len(existing.description):
+            if existing is None:
+                unique[key] = finding
+                counts[finding.rank] += 1
+            elif len(finding.description) > len(existing.description):
                 unique[key] = finding
 
-        return sorted(
+        merged = sorted(
             unique.values(),
             key=lambda f: (
-                _SEVERITY_ORDER.get(f.severity, 5),
+                f.rank,
                 f.title,  # stable secondary sort so output is deterministic
                 f.line_number if f.line_number is not None else 9999,
             ),
         )
+        breakdown = dict(zip(_SEVERITY_NAMES, counts))
+        return merged, breakdown, _score_from_counts(counts)
 
-    def _calculate_severity_breakdown(self, findings: List[PydanticFinding]) -> Dict[str, int]:
+    def _calculate_severity_breakdown(self, findings: List[_AnyFinding]) -> Dict[str, int]:
         """
         Count findings grouped by severity level.
 
@@ -451,20 +710,12 @@ class AnalysisOrchestrator:
             Dict mapping severity to count, e.g.
             ``{"critical": 2, "high": 1, "medium": 0, "low": 3, "info": 0}``.
         """
-        breakdown: Dict[str, int] = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-            "info": 0,
-        }
-        for finding in findings:
-            severity = finding.severity.lower()
-            if severity in breakdown:
-                breakdown[severity] += 1
-        return breakdown
-
-    def _calculate_score(self, findings: List[PydanticFinding]) -> int:
+        if not findings:
+            return dict.fromkeys(_SEVERITY_NAMES, 0)
+        counts = Counter(finding.rank for finding in findings)
+        return {name: counts[rank] for rank, name in enumerate(_SEVERITY_NAMES)}
+
+    def _calculate_score(self, findings: List[_AnyFinding]) -> int:
         """
         Compute an overall security score (0–100).
 
@@ -483,10 +734,10 @@ class AnalysisOrchestrator:
         Returns:
             Integer score in the range [0, 100].
         """
-        score = 100
-        for finding in findings:
-            score -= _SEVERITY_WEIGHTS.get(finding.severity.lower(), 0)
-        return max(0, score)
+        if not findings:
+            return 100
+        counts = Counter(finding.rank for finding in findings)
+        return _score_from_counts([counts[rank] for rank in range(len(_SEVERITY_WEIGHTS))])
 
     def _generate_summary(self, severity_breakdown: Dict[str, int], score: int) -> str:
         """
@@ -500,31 +751,26 @@ class AnalysisOrchestrator:
             String such as ``"2 critical, 1 high — UNSAFE [FAIL]"``, or
             ``"No vulnerabilities found — SAFE [OK]"`` when clean.
         """
-        parts: List[str] = []
-        for level in ("critical", "high", "medium", "low"):
-            count = severity_breakdown.get(level, 0)
-            if count > 0:
-                parts.append(f"{count} {level}")
-
+        parts = [
+            f"{count} {level}"
+            for level in _SUMMARY_LEVELS
+            if (count := severity_breakdown.get(level, 0)) > 0
+        ]
         if not parts:
             return "No vulnerabilities found — SAFE [OK]"
 
-        if score >= 80:
-            status = "GOOD [OK]"
-        elif score >= 60:
-            status = "MODERATE [WARNING]"
-        elif score >= 40:
-            status = "RISKY [WARNING]"
-        else:
-            status = "UNSAFE [FAIL]"
-
+        status = next(
+            (label for threshold, label in _SUMMARY_STATUS if score >= threshold),
+            "UNSAFE [FAIL]",
+        )
         return f"{', '.join(parts)} — {status}"
 
     def _extract_contract_name(self, source_code: str) -> str:
         """
         Extract the primary contract name from Solidity source code.
 
-        Uses a simple regex matching ``contract <Name>``.
+        Uses the precompiled module-level ``_CONTRACT_NAME_RE`` matching
+        ``contract <Name>``.
 
         Args:
             source_code: Solidity source code string.
@@ -532,7 +778,7 @@ class AnalysisOrchestrator:
         Returns:
             Extracted contract name, or ``"Unknown"`` if none found.
         """
-        match = re.search(r"\bcontract\s+(\w+)", source_code)
+        match = _CONTRACT_NAME_RE.search(source_code)
         return match.group(1) if match else "Unknown"
 
     # ----------------------------------------------
@@ -553,6 +799,91 @@ class AnalysisOrchestrator:
 # ----------------------------------------------
 
 
+def _score_from_counts(counts: List[int]) -> int:
+    """
+    Compute the security score from per-rank finding counts.
+
+    The deduction is the dot product of ``counts`` with ``_SEVERITY_WEIGHTS``,
+    so the cost is fixed by the number of severity levels, not findings.
+
+    Args:
+        counts: Number of findings per :class:`~analysis.models.SeverityRank`.
+
+    Returns:
+        Integer score in the range [0, 100].
+    """
+    return max(0, 100 - sum(map(operator.mul, counts, _SEVERITY_WEIGHTS)))
+
+
+# Per-process orchestrator used by analyze_many() workers
+_WORKER_ORCHESTRATOR: Optional[AnalysisOrchestrator] = None
+
+
+def _init_worker(rules: List[VulnerabilityRule]) -> None:
+    """Build the worker-local orchestrator once per ``analyze_many`` process."""
+    global _WORKER_ORCHESTRATOR
+    _WORKER_ORCHESTRATOR = AnalysisOrchestrator(rules=rules)
+
+
+def _worker_analyze(request: ScanRequest) -> ScanResult:
+    """Analyse one request inside an ``analyze_many`` worker process."""
+    if _WORKER_ORCHESTRATOR is None:
+        _init_worker([])
+    return _WORKER_ORCHESTRATOR.analyze(request)
+
+
+def _safe_detect(
+    rule: VulnerabilityRule, ast: Any
+) -> Tuple[str, Union[List[RuleFinding], Exception]]:
+    """
+    Run ``rule.detect(ast)`` without letting exceptions escape.
+
+    Args:
+        rule: Rule to execute.
+        ast: Shared, read-only AST nodes.
+
+    Returns:
+        ``(rule_id, findings)`` on success or ``(rule_id, exception)`` on failure.
+    """
+    try:
+        return rule.rule_id, rule.detect(ast)
+    except Exception as exc:
+        return rule.rule_id, exc
+
+
+def _materialize_source(source_code: str, source_hash: str) -> str:
+    """
+    Write contract source to a uniquely named ``.sol`` temp file.
+
+    Prefers the ``/dev/shm`` tmpfs on Linux so the file never touches disk,
+    falling back to the platform temp directory.  ``mkstemp`` guarantees a
+    unique name (``O_EXCL``), so concurrent scans of identical source never
+    truncate or unlink each other's file.
+
+    Args:
+        source_code: Solidity source to write.
+        source_hash: SHA-256 hex digest of the source, used as a name prefix
+            to make temp files easy to correlate with log entries.
+
+    Returns:
+        Absolute path of the written file.  The caller must remove it with
+        :func:`_remove_temp_file`.
+    """
+    fd, path = tempfile.mkstemp(
+        suffix=".sol", prefix=f"bs-{source_hash[:16]}-", dir=_TEMP_SOURCE_DIR
+    )
+    try:
+        data = memoryview(source_code.encode("utf-8"))
+        while data:
+            data = data[os.write(fd, data):]
+    except BaseException:
+        os.close(fd)
+        _remove_temp_file(path)
+        raise
+    os.close(fd)
+    return path
+
+
 def _remove_temp_file(path: Optional[str]) -> None:
     """
     Delete a temporary file, suppressing errors if removal fails.
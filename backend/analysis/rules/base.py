@@ -12,14 +12,18 @@ class Severity(str, Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Finding:
-    """Represents a detected vulnerability finding."""
+    """
+    Represents a detected vulnerability finding.
+
+    Instances are immutable and slotted: large scans produce many of them,
+    and rules hand them to the orchestrator across threads.
+    """
 
     rule_id: str
     name: str
     title: str
-    name: str
     severity: Severity
     description: str
     line_number: int
@@ -43,8 +47,11 @@ class VulnerabilityRule:
         """
         Detect vulnerabilities in AST.
 
+        The orchestrator runs every rule concurrently against the same AST,
+        so implementations must treat ``ast`` as read-only.
+
         Args:
-            ast: Abstract syntax tree from Slither
+            ast: Abstract syntax tree from Slither (shared, read-only)
 
         Returns:
             List of Finding objects
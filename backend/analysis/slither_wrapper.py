@@ -166,12 +166,14 @@ class SlitherWrapper:
                 logger.debug("Slither successfully loaded")
         return bool(self._available)
 
-    def parse_contract(self, file_path: str) -> Any:
+    def parse_contract(self, file_path: str, content_hash: Optional[str] = None) -> Any:
         """
         Parse a Solidity contract using Slither, with caching + timeout.
 
         Args:
             file_path: Absolute or relative path to a ``.sol`` file.
+            content_hash: SHA-256 hex digest of the file contents, when the
+                caller already knows it.  Skips re-reading the file to hash it.
 
         Returns:
             Slither object containing analysis results.
@@ -191,12 +193,11 @@ class SlitherWrapper:
         if not path.exists():
             raise FileNotFoundError(f"Contract file not found: {path}")
 
-        content_hash: Optional[str]
-        try:
-            content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
-        except OSError as exc:
-            logger.warning("Could not hash '%s': %s", path, exc)
-            content_hash = None
+        if content_hash is None:
+            try:
+                content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError as exc:
+                logger.warning("Could not hash '%s': %s", path, exc)
 
         if content_hash:
             cached_result = _PARSE_CACHE.get(content_hash)
@@ -299,6 +300,22 @@ class SlitherWrapper:
             return None
         return slither_obj.contracts
 
+    @staticmethod
+    def get_cached_parse(content_hash: str) -> Optional[Any]:
+        """
+        Look up a previous parse by the SHA-256 of the contract source.
+
+        Lets callers skip writing a temp file entirely when the same source
+        has already been parsed.
+
+        Args:
+            content_hash: SHA-256 hex digest of the UTF-8 encoded source.
+
+        Returns:
+            The cached Slither object, or ``None`` on a miss.
+        """
+        return _PARSE_CACHE.get(content_hash)
+
     @staticmethod
     def clear_parse_cache() -> int:
         """Evict all cached parse results and return the number cleared."""
@@ -13,6 +13,16 @@ from typing import Iterable, List
 
 from .models import Finding
 
+# Patterns are compiled once at import rather than on every scan.
+_STATE_WRITE_RE = re.compile(
+    r"(?:balances|mapping|owner|admins?|allowance|locked|status|withdrawn)\b[^\n;]*=",
+    re.IGNORECASE,
+)
+_LOW_LEVEL_CALL_RE = re.compile(r"\.\s*call\s*(?:\{[^}]*\})?\s*\(", re.IGNORECASE)
+_TX_ORIGIN_RE = re.compile(r"\btx\.origin\b")
+_SELFDESTRUCT_RE = re.compile(r"\b(?:selfdestruct|suicide)\s*\(", re.IGNORECASE)
+_DELEGATECALL_RE = re.compile(r"\.\s*delegatecall\s*\(", re.IGNORECASE)
+
 
 def _line_number_for_offset(source_code: str, offset: int) -> int:
     """Convert a string offset into a 1-based line number."""
@@ -41,18 +51,13 @@ def _make_finding(
 
 def _find_reentrancy(source_code: str) -> Iterable[Finding]:
     lines = source_code.splitlines()
-    state_write_pattern = re.compile(
-        r"(?:balances|mapping|owner|admins?|allowance|locked|status|withdrawn)\b[^\n;]*=",
-        re.IGNORECASE,
-    )
-    call_pattern = re.compile(r"\.\s*call\s*(?:\{[^}]*\})?\s*\(", re.IGNORECASE)
 
     for index, line in enumerate(lines):
-        if call_pattern.search(line) is None:
+        if _LOW_LEVEL_CALL_RE.search(line) is None:
             continue
 
         lookahead = "\n".join(lines[index + 1 : index + 9])
-        if state_write_pattern.search(lookahead) is None:
+        if _STATE_WRITE_RE.search(lookahead) is None:
             continue
 
         yield Finding(
@@ -72,8 +77,7 @@ def _find_reentrancy(source_code: str) -> Iterable[Finding]:
 
 
 def _find_tx_origin(source_code: str) -> Iterable[Finding]:
-    pattern = re.compile(r"\btx\.origin\b")
-    for match in pattern.finditer(source_code):
+    for match in _TX_ORIGIN_RE.finditer(source_code):
         yield _make_finding(
             title="tx.origin Authentication",
             severity="high",
@@ -88,8 +92,7 @@ def _find_tx_origin(source_code: str) -> Iterable[Finding]:
 
 
 def _find_selfdestruct(source_code: str) -> Iterable[Finding]:
-    pattern = re.compile(r"\b(?:selfdestruct|suicide)\s*\(", re.IGNORECASE)
-    for match in pattern.finditer(source_code):
+    for match in _SELFDESTRUCT_RE.finditer(source_code):
         yield _make_finding(
             title="Dangerous Self-Destruct",
             severity="high",
@@ -104,8 +107,7 @@ def _find_selfdestruct(source_code: str) -> Iterable[Finding]:
 
 
 def _find_delegatecall(source_code: str) -> Iterable[Finding]:
-    pattern = re.compile(r"\.\s*delegatecall\s*\(", re.IGNORECASE)
-    for match in pattern.finditer(source_code):
+    for match in _DELEGATECALL_RE.finditer(source_code):
         yield _make_finding(
             title="Delegatecall Usage",
             severity="high",
@@ -0,0 +1,99 @@
+"""
+Shared fixtures for the analysis test suite.
+
+The FastAPI app and its ``TestClient`` are built once per session so the
+orchestrator, rule registry and app lifespan are initialised a single time.
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Environment setup — must run BEFORE any app imports
+# ---------------------------------------------------------------------------
+os.environ.setdefault("ENVIRONMENT", "testing")
+os.environ.setdefault("TESTING", "True")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-not-for-production-use-only")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key-not-for-production-use-only")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "False")
+os.environ.setdefault("LOG_FILE_ENABLED", "False")
+
+# Import the heavy modules once so every test module's top-level imports are
+# plain sys.modules lookups.  These use the same top-level package names the
+# tests do (``analysis``/``app``, via pythonpath) — importing them as
+# ``backend.*`` would load a second copy of each module.
+import analysis.orchestrator  # noqa: E402,F401
+import analysis.rules.base  # noqa: E402,F401
+import analysis.slither_wrapper  # noqa: E402,F401
+import app.main  # noqa: E402,F401
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application, imported once per session, with tables created."""
+    import app.models  # noqa: F401  (register models on Base.metadata)
+    from app.core.database import init_db
+    from app.main import app as fastapi_app
+
+    init_db()
+    return fastapi_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """A ``TestClient`` whose lifespan spans the whole session."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_orchestrator():
+    """
+    Resolve the shared orchestrator's rules and Slither availability up front.
+
+    Slither is imported lazily on first use; probing it here keeps that
+    one-off cost out of whichever test happens to run first.
+    """
+    from app.routers.scan import orchestrator
+
+    orchestrator._rules_by_cost()
+    orchestrator.slither_wrapper.available
+
+
+@pytest.fixture(scope="session")
+def mock_scan_api():
+    """
+    A minimal FastAPI app exposing ``POST /api/v1/scan`` over a stubbed orchestrator.
+
+    ``SlitherWrapper`` is replaced only while the orchestrator is built, so
+    the stub lives on that one instance and nothing else in the session sees
+    the patch.
+
+    Yields:
+        ``(app, orchestrator, client)``
+    """
+    from analysis import AnalysisOrchestrator, ScanRequest, ScanResult
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    stub = Mock()
+    stub.available = True
+    stub.get_cached_parse = Mock(return_value=None)
+    stub.parse_contract = Mock(return_value=None)
+    stub.get_ast_nodes = Mock(return_value=None)
+
+    with patch("analysis.orchestrator.SlitherWrapper", return_value=stub):
+        orchestrator = AnalysisOrchestrator(rules=[])
+
+    app = FastAPI()
+
+    @app.post("/api/v1/scan", response_model=ScanResult)
+    async def scan_contract(request: ScanRequest) -> ScanResult:
+        return orchestrator.analyze(request)
+
+    yield app, orchestrator, TestClient(app)
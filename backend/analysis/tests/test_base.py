@@ -1,5 +1,7 @@
 """Tests for base rule classes."""
 
+import dataclasses
+
 import pytest
 
 from analysis.rules.base import Finding, Severity, VulnerabilityRule
@@ -51,3 +53,22 @@ def test_rule_base_not_implemented():
 
     with pytest.raises(NotImplementedError):
         rule.detect(None)
+
+
+def test_finding_is_frozen_and_slotted():
+    """Findings are immutable, hashable and carry no per-instance __dict__."""
+    finding = Finding(
+        rule_id="TEST_001",
+        name="Test Vulnerability",
+        title="Test Vulnerability",
+        severity=Severity.LOW,
+        description="Test",
+        line_number=1,
+        code_snippet="code",
+        remediation="fix",
+    )
+
+    assert not hasattr(finding, "__dict__")
+    assert hash(finding) == hash(dataclasses.replace(finding))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        finding.line_number = 2
@@ -5,21 +5,20 @@ Updated to work with current implementation.
 These tests bridge CLI, orchestrator, and future FastAPI endpoints.
 """
 
+import json
 import subprocess
 import sys
 
 import pytest
 from analysis import AnalysisOrchestrator, ScanRequest, ScanResult
+from click.testing import CliRunner
 
 # ============================================================================
 # FIXTURES
 # ============================================================================
 
 
-@pytest.fixture
-def sample_contract():
-    """Sample Solidity contract for testing."""
-    return """
+SIMPLE_STORAGE = """
 pragma solidity ^0.8.0;
 
 contract SimpleStorage {
@@ -32,6 +31,19 @@ contract SimpleStorage {
 """
 
 
+# One runner for all in-process CLI invocations
+CLI_RUNNER = CliRunner()
+
+# Fields the API layer relies on; checked against Pydantic's prebuilt model_fields
+SCAN_RESULT_FIELDS = ("timestamp", "contract_name", "overall_score", "findings", "summary")
+
+
+@pytest.fixture
+def sample_contract():
+    """Sample Solidity contract for testing."""
+    return SIMPLE_STORAGE
+
+
 @pytest.fixture
 def orchestrator():
     """Create orchestrator for testing."""
@@ -53,42 +65,56 @@ def test_cli_to_orchestrator(sample_contract, tmp_path):
     test_file = tmp_path / "test.sol"
     test_file.write_text(sample_contract)
 
-    # Run CLI
-    result = subprocess.run(
-        [sys.executable, "-m", "backend.cli.main", "scan", str(test_file)],
-        capture_output=True,
-        text=True,
-        timeout=10,
+    from backend.cli.main import cli
+
+    # Run CLI in-process
+    result = CLI_RUNNER.invoke(
+        cli, ["scan", str(test_file)], standalone_mode=False, catch_exceptions=False
     )
 
     # Assert CLI ran (may have warnings about Slither, but shouldn't crash)
-    assert result.returncode in [0, 1], "CLI should complete execution"
-    output = result.stdout + result.stderr
-    assert len(output) > 0, "CLI should produce output"
+    assert result.exit_code in [0, 1], "CLI should complete execution"
+    assert len(result.output) > 0, "CLI should produce output"
 
 
 def test_cli_json_output(sample_contract, tmp_path):
     """
-    Test CLI JSON output format (if/when implemented).
+    Test CLI JSON output format.
+    """
+    from backend.cli.main import cli
+
+    test_file = tmp_path / "test.sol"
+    test_file.write_text(sample_contract)
+
+    result = CLI_RUNNER.invoke(
+        cli,
+        ["scan", str(test_file), "-o", "json"],
+        standalone_mode=False,
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.stdout)
+    assert data["contract_name"] == "test"
+    assert 0 <= data["overall_score"] <= 100
 
-    For now, just verify CLI runs without critical errors.
+
+@pytest.mark.slow
+def test_cli_module_entrypoint(sample_contract, tmp_path):
+    """
+    Smoke-test the ``python -m backend.cli.main`` entrypoint in a subprocess.
     """
     test_file = tmp_path / "test.sol"
     test_file.write_text(sample_contract)
 
-    # Try to run with --json flag (may not be implemented yet)
     result = subprocess.run(
         [sys.executable, "-m", "backend.cli.main", "scan", str(test_file)],
         capture_output=True,
-        text=True,
         timeout=10,
     )
 
-    # For now, just verify it runs
-    assert result.returncode in [0, 1], "CLI should run"
-
-    # Note: JSON output format to be implemented by team
-    # When implemented, add: data = json.loads(result.stdout)
+    assert result.returncode in [0, 1], "CLI should complete execution"
+    assert len(result.stdout + result.stderr) > 0, "CLI should produce output"
 
 
 # ============================================================================
@@ -96,25 +122,13 @@ def test_cli_json_output(sample_contract, tmp_path):
 # ============================================================================
 
 
-def test_fastapi_scan_endpoint():
+def test_fastapi_scan_endpoint(mock_scan_api):
     """
     Test FastAPI scan endpoint integration.
 
-    This test uses the mock FastAPI app from test_e2e.py.
-    The real implementation will be done by Jiten.
+    Uses the session-scoped mock app (same shape as the one in test_e2e.py).
     """
-    from fastapi import FastAPI
-    from fastapi.testclient import TestClient
-
-    # Create mock app (same as in test_e2e.py)
-    app = FastAPI()
-    orchestrator = AnalysisOrchestrator(rules=[])
-
-    @app.post("/api/v1/scan", response_model=ScanResult)
-    async def scan_contract(request: ScanRequest) -> ScanResult:
-        return orchestrator.analyze(request)
-
-    client = TestClient(app)
+    _, _, client = mock_scan_api
 
     # Test the endpoint
     request_data = {
@@ -155,13 +169,8 @@ def test_fastapi_get_scan_by_id():
 
     This is a placeholder for when Jiten implements scan persistence.
     """
-    # For now, just verify the models exist
-    # Verify ScanResult has timestamp (used as ID)
-
-    from analysis import ScanResult
-
-    assert hasattr(ScanResult, "__annotations__")
-    assert "timestamp" in ScanResult.__annotations__
+    # For now, just verify the model shape (timestamp is used as ID)
+    assert set(SCAN_RESULT_FIELDS) <= ScanResult.model_fields.keys()
 
     # TODO: When Jiten implements /api/v1/scans/{id} endpoint:
     # response = client.get(f"/api/v1/scans/{scan_id}")
@@ -200,38 +209,28 @@ def test_orchestrator_direct(sample_contract):
     assert isinstance(result.findings, list)
     assert isinstance(result.summary, str)
 
-    print(f"\n[OK] Direct orchestrator test passed!")
-    print(f"   Score: {result.overall_score}/100")
-    print(f"   Summary: {result.summary}")
-
 
-def test_orchestrator_with_multiple_contracts(sample_contract):
+@pytest.mark.parametrize(
+    "name,code",
+    [
+        ("Contract1", SIMPLE_STORAGE),
+        ("Contract2", "pragma solidity ^0.8.0; contract Test2 {}"),
+        ("Contract3", "pragma solidity ^0.8.0; contract Test3 { uint x; }"),
+    ],
+)
+def test_orchestrator_with_multiple_contracts(name, code):
     """
     Test orchestrator can handle multiple scans.
+
+    Parametrized so pytest-xdist can spread the contracts across workers.
     """
     orchestrator = AnalysisOrchestrator(rules=[])
 
-    # Scan multiple contracts
-    contracts = [
-        ("Contract1", sample_contract),
-        ("Contract2", "pragma solidity ^0.8.0; contract Test2 {}"),
-        ("Contract3", "pragma solidity ^0.8.0; contract Test3 { uint x; }"),
-    ]
-
-    results = []
-    for name, code in contracts:
-        request = ScanRequest(source_code=code, contract_name=name, file_path=f"/{name}.sol")
-        result = orchestrator.analyze(request)
-        results.append(result)
-
-    # Assert all scans completed
-    assert len(results) == 3
-    for result in results:
-        assert isinstance(result, ScanResult)
-        assert 0 <= result.overall_score <= 100
+    request = ScanRequest(source_code=code, contract_name=name, file_path=f"/{name}.sol")
+    result = orchestrator.analyze(request)
 
-    print(f"\n[OK] Multiple contracts test passed!")
-    print(f"   Scanned {len(results)} contracts successfully")
+    assert isinstance(result, ScanResult)
+    assert 0 <= result.overall_score <= 100
 
 
 # ============================================================================
@@ -256,8 +255,6 @@ def test_models_integration():
     assert finding.title == "Test Finding"
     assert finding.severity == "high"
 
-    print(f"\n[OK] Models integration test passed!")
-
 
 def test_rules_integration():
     """Test that rules can be integrated with orchestrator."""
@@ -288,8 +285,6 @@ def test_rules_integration():
     result = orchestrator.analyze(request)
     assert isinstance(result, ScanResult)
 
-    print(f"\n[OK] Rules integration test passed!")
-
 
 # ============================================================================
 # NOTES FOR TEAM
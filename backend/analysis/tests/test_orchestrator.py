@@ -69,50 +69,70 @@ def vulnerable_contract():
     """
 
 
+# Stub SlitherWrapper instances, built once per module and reset between tests.
+# The patch is autouse, so tests that ask for no mock get the neutral stub.
+# The tests import ``analysis.orchestrator``, so that is the module patched.
+_SLITHER_WRAPPER_TARGET = "analysis.orchestrator.SlitherWrapper"
+
+_MOCK_SLITHER_OBJ = Mock()
+_MOCK_SLITHER_OBJ.detectors_results = [
+    {
+        "check": "reentrancy-eth",
+        "impact": "High",
+        "description": "Reentrancy vulnerability detected",
+        "recommendation": "Use ReentrancyGuard",
+        "elements": [{"source_mapping": {"lines": [15]}}],
+    },
+    {
+        "check": "uninitialized-local",
+        "impact": "Medium",
+        "description": "Uninitialized local variable",
+        "recommendation": "Initialize all variables",
+        "elements": [],
+    },
+]
+
+
+def _stub_wrapper(parse_result):
+    return Mock(
+        available=True,
+        get_cached_parse=Mock(return_value=None),
+        parse_contract=Mock(return_value=parse_result),
+        get_ast_nodes=Mock(return_value=None),
+    )
+
+
+_MOCK_INSTANCE = _stub_wrapper(None)
+_MOCK_INSTANCE_WITH_FINDINGS = _stub_wrapper(_MOCK_SLITHER_OBJ)
+
+# What tests that request no mock fixture see: Slither reported unavailable.
+_NEUTRAL_INSTANCE = _stub_wrapper(None)
+_NEUTRAL_INSTANCE.available = False
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_slither_wrapper():
+    """Patch the SlitherWrapper class once for the whole module."""
+    with patch(_SLITHER_WRAPPER_TARGET, return_value=_NEUTRAL_INSTANCE) as mock_wrapper:
+        yield mock_wrapper
+
+
 @pytest.fixture
-def mock_slither_wrapper():
+def mock_slither_wrapper(_patched_slither_wrapper):
     """Mock SlitherWrapper to avoid actual Slither execution."""
-    with patch("backend.analysis.orchestrator.SlitherWrapper") as mock_wrapper:
-        # Configure mock
-        mock_instance = Mock()
-        mock_instance.available = True
-        mock_instance.parse_contract = Mock(return_value=None)
-        mock_instance.get_ast_nodes = Mock(return_value=None)
-        mock_wrapper.return_value = mock_instance
-
-        yield mock_instance
+    _patched_slither_wrapper.return_value = _MOCK_INSTANCE
+    yield _MOCK_INSTANCE
+    _patched_slither_wrapper.return_value = _NEUTRAL_INSTANCE
+    _MOCK_INSTANCE.reset_mock()
 
 
 @pytest.fixture
-def mock_slither_with_findings():
+def mock_slither_with_findings(_patched_slither_wrapper):
     """Mock SlitherWrapper that returns findings."""
-    with patch("backend.analysis.orchestrator.SlitherWrapper") as mock_wrapper:
-        # Create mock Slither object with findings
-        mock_slither_obj = Mock()
-        mock_slither_obj.detectors_results = [
-            {
-                "check": "reentrancy-eth",
-                "impact": "High",
-                "description": "Reentrancy vulnerability detected",
-                "recommendation": "Use ReentrancyGuard",
-                "elements": [{"source_mapping": {"lines": [15]}}],
-            },
-            {
-                "check": "uninitialized-local",
-                "impact": "Medium",
-                "description": "Uninitialized local variable",
-                "recommendation": "Initialize all variables",
-                "elements": [],
-            },
-        ]
-
-        mock_instance = Mock()
-        mock_instance.available = True
-        mock_instance.parse_contract = Mock(return_value=mock_slither_obj)
-        mock_instance.get_ast_nodes = Mock(return_value=None)
-        mock_wrapper.return_value = mock_instance
-
-        yield mock_instance
+    _patched_slither_wrapper.return_value = _MOCK_INSTANCE_WITH_FINDINGS
+    yield _MOCK_INSTANCE_WITH_FINDINGS
+    _patched_slither_wrapper.return_value = _NEUTRAL_INSTANCE
+    _MOCK_INSTANCE_WITH_FINDINGS.reset_mock()
 
 
 @pytest.fixture
@@ -232,78 +252,44 @@ def test_analyze_returns_scan_result(simple_contract, empty_rules, mock_slither_
     assert isinstance(result.summary, str), "Summary should be a string"
     assert len(result.summary) > 0, "Summary should not be empty"
 
-    print(f"\n[OK] TEST 1 PASSED: analyze() returns ScanResult with findings, score, and summary")
-
 
 # ============================================================================
-# TEST 3: Score Calculation (TASK REQUIREMENT)
+# TEST 3: Score Calculation + Severity Breakdown (TASK REQUIREMENT)
 # ============================================================================
 
-
-def test_score_calculation_exact_math():
-    """
-    TASK TEST 2: Score calculation is correct.
-    Tests that 1 critical, 2 high results in score of 80.
-    Formula: 100 - 10 - 5 - 5 = 80
-    """
-    orchestrator = AnalysisOrchestrator(rules=[])
-
-    # Create findings: 1 critical, 2 high
-    findings = [
-        PydanticFinding(
-            title="Critical Vulnerability", severity="critical", description="Critical issue found"
-        ),
-        PydanticFinding(
-            title="High Vulnerability 1", severity="high", description="High severity issue 1"
-        ),
-        PydanticFinding(
-            title="High Vulnerability 2", severity="high", description="High severity issue 2"
-        ),
+_SEVERITY_ORDER = ("critical", "high", "medium", "low", "info")
+
+# (counts per severity in _SEVERITY_ORDER, expected score)
+SCORE_CASES = [
+    ((1, 2, 0, 0, 0), 80),  # TASK: 100 - 10 - 5 - 5
+    ((0, 0, 3, 0, 0), 94),  # 100 - 3 * 2
+    ((0, 0, 0, 4, 0), 96),  # 100 - 4 * 1
+    ((0, 0, 0, 0, 5), 100),  # info is free
+    ((1, 1, 1, 1, 1), 82),  # 100 - 10 - 5 - 2 - 1
+    ((11, 0, 0, 0, 0), 0),  # floored at zero
+]
+
+
+def _make_findings(spec):
+    """Build PydanticFindings with ``spec[i]`` findings of ``_SEVERITY_ORDER[i]``."""
+    return [
+        PydanticFinding(title=f"{severity}-{i}", severity=severity, description="Test")
+        for severity, count in zip(_SEVERITY_ORDER, spec)
+        for i in range(count)
     ]
 
-    # Calculate score
-    score = orchestrator._calculate_score(findings)
-
-    # Assert: 100 - 10 (critical) - 5 (high) - 5 (high) = 80
-    assert score == 80, f"Expected score 80, got {score}"
-
-    print(f"\n[OK] TEST 2 PASSED: Score calculation correct (1 critical + 2 high = 80)")
-
-
-# ============================================================================
-# TEST 4: Severity Breakdown (TASK REQUIREMENT)
-# ============================================================================
-
 
-def test_severity_breakdown_populated():
+@pytest.mark.parametrize("spec,expected_score", SCORE_CASES)
+def test_score_and_breakdown(spec, expected_score):
     """
-    TASK TEST 3: Severity breakdown is populated correctly.
-    Tests that severity_breakdown["critical"] == 1 and severity_breakdown["high"] == 2.
+    TASK TESTS 2 + 3: score and severity breakdown agree with the finding mix.
+    Formula: 100 - 10*critical - 5*high - 2*medium - 1*low, floored at 0.
     """
     orchestrator = AnalysisOrchestrator(rules=[])
+    findings = _make_findings(spec)
 
-    # Create findings: 1 critical, 2 high
-    findings = [
-        PydanticFinding(title="C1", severity="critical", description="Critical"),
-        PydanticFinding(title="H1", severity="high", description="High 1"),
-        PydanticFinding(title="H2", severity="high", description="High 2"),
-    ]
-
-    # Calculate breakdown
-    breakdown = orchestrator._calculate_severity_breakdown(findings)
-
-    # Assert critical count
-    assert breakdown["critical"] == 1, f"Expected critical=1, got {breakdown['critical']}"
-
-    # Assert high count
-    assert breakdown["high"] == 2, f"Expected high=2, got {breakdown['high']}"
-
-    # Assert other counts are 0
-    assert breakdown["medium"] == 0, "Expected medium=0"
-    assert breakdown["low"] == 0, "Expected low=0"
-    assert breakdown["info"] == 0, "Expected info=0"
-
-    print(f"\n[OK] TEST 3 PASSED: Severity breakdown correct (critical=1, high=2)")
+    assert orchestrator._calculate_score(findings) == expected_score
+    assert orchestrator._calculate_severity_breakdown(findings) == dict(zip(_SEVERITY_ORDER, spec))
 
 
 # ============================================================================
@@ -391,7 +377,7 @@ def test_deduplication_removes_duplicates():
         )
     ]
 
-    deduplicated = orchestrator._merge_and_deduplicate(slither_findings, rule_findings)
+    deduplicated, _, _ = orchestrator._merge_and_deduplicate(slither_findings, rule_findings)
 
     # Should keep only 1 (the one with longer description)
     assert len(deduplicated) == 1
@@ -451,13 +437,3 @@ def test_full_integration_workflow(vulnerable_contract, mock_slither_wrapper):
 
     # Timestamp exists
     assert result.timestamp is not None, "Timestamp should be set"
-
-    print(f"\n[OK] Full integration test passed!")
-    print(f"   Contract: {result.contract_name}")
-    print(f"   Score: {result.overall_score}/100")
-    print(f"   Findings: {result.vulnerabilities_count}")
-    print(f"   Summary: {result.summary}")
-    print(f"\n🎉 All Task 3 requirements verified!")
-    print(f"   [OK] TEST 1: analyze() returns ScanResult with findings, score, summary")
-    print(f"   [OK] TEST 2: Score calculation (1 critical + 2 high = 80)")
-    print(f"   [OK] TEST 3: Severity breakdown populated correctly")
@@ -1,3 +1,9 @@
+import pytest
+
+# Share one worker (and one session client) under pytest-xdist
+pytestmark = pytest.mark.xdist_group(name="api")
+
+
 def test_file_too_large(client):
     files = {"file": ("a.sol", b"contract A {}", "text/plain")}
     response = client.post("/api/v1/scan/file", files=files)
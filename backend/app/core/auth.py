@@ -3,20 +3,62 @@ BlockScope API Key Authentication System
 Provides secure API key management and authentication
 """
 
+import asyncio
+import base64
 import hashlib
-import secrets
+import logging
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from app.core.config import settings
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_db_context
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader
-from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    bindparam,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger("blockscope.auth")
 
 # ==================== Database Models ====================
 
+# Rows that may authenticate; mirrored by validate_api_key's WHERE clause.
+_LIVE_KEY_PREDICATE = "is_active AND NOT is_revoked"
+
+
+def _join_csv(values: Optional[list]) -> Optional[str]:
+    """Store a list column as stripped, de-duplicated comma-separated text."""
+    if not values:
+        return None
+    cleaned = dict.fromkeys(value.strip() for value in values if value and value.strip())
+    return ",".join(cleaned) or None
+
+
+@lru_cache(maxsize=1024)
+def _parse_allowed_ips(allowed_ips: str) -> FrozenSet[str]:
+    """Split a comma-separated IP allow-list once per distinct value."""
+    return frozenset(ip.strip() for ip in allowed_ips.split(",") if ip.strip())
+
 
 class APIKey(Base):
     """
@@ -29,6 +71,7 @@ class APIKey(Base):
 
     # API Key details
     key_hash = Column(String(128), unique=True, nullable=False, index=True)
+    key_hash_fast = Column(LargeBinary(16), nullable=True)  # Raw keyed BLAKE2b lookup digest
     key_prefix = Column(String(16), nullable=False, index=True)  # First 8 chars for identification
     name = Column(String(255), nullable=False)  # Human-readable name
     description = Column(String(1000), nullable=True)
@@ -59,17 +102,34 @@ class APIKey(Base):
 
     # Indexes for performance
     __table_args__ = (
-        Index("idx_api_keys_active", "is_active", "is_revoked"),
+        # Only live keys can authenticate, so the lookup index holds only
+        # them; revoked rows drop out of it automatically.
+        Index(
+            "idx_api_keys_fast_live",
+            "key_hash_fast",
+            unique=True,
+            postgresql_where=text(_LIVE_KEY_PREDICATE),
+            sqlite_where=text(_LIVE_KEY_PREDICATE),
+        ),
         Index("idx_api_keys_tier", "tier"),
         Index("idx_api_keys_created", "created_at"),
     )
 
+    @property
+    def allowed_ip_set(self) -> FrozenSet[str]:
+        """Allowed client IPs as a set (empty when unrestricted)."""
+        if not self.allowed_ips:
+            return frozenset()
+        return _parse_allowed_ips(self.allowed_ips)
+
     def __repr__(self):
         return f"<APIKey {self.key_prefix}... - {self.name}>"
 
 
 # ==================== API Key Generation ====================
 
+_API_KEY_PREFIX_BYTES: bytes = settings.API_KEY_PREFIX.encode()
+
 
 def generate_api_key() -> tuple[str, str, str]:
     """
@@ -81,14 +141,14 @@ def generate_api_key() -> tuple[str, str, str]:
             - key_hash: SHA256 hash to store in database
             - key_prefix: First 8 characters for identification
     """
-    # Generate random key
-    random_part = secrets.token_urlsafe(settings.API_KEY_LENGTH)
-
-    # Add prefix
-    raw_key = f"{settings.API_KEY_PREFIX}{random_part}"
+    # Generate random key (same alphabet and length as secrets.token_urlsafe),
+    # built as bytes so it can be hashed without a str -> bytes round trip
+    random_part = base64.urlsafe_b64encode(os.urandom(settings.API_KEY_LENGTH)).rstrip(b"=")
+    raw_key_bytes = _API_KEY_PREFIX_BYTES + random_part
 
     # Generate hash for storage (never store raw key!)
-    key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+    key_hash = hashlib.sha256(raw_key_bytes).hexdigest()
+    raw_key = raw_key_bytes.decode()
 
     # Extract prefix for identification
     key_prefix = raw_key[:12]  # prefix + first few chars
@@ -109,6 +169,448 @@ def hash_api_key(raw_key: str) -> str:
     return hashlib.sha256(raw_key.encode()).hexdigest()
 
 
+# BLAKE2b only accepts keys up to 64 bytes, so the configured secret is
+# condensed to a fixed-size key once at import time.
+_FAST_HASH_KEY: bytes = hashlib.blake2b(
+    (settings.AUTH_HASH_KEY or settings.SECRET_KEY).encode(), digest_size=32
+).digest()
+
+
+def hash_api_key_fast(raw_key: str) -> bytes:
+    """
+    Hash an API key for request-time lookup.
+
+    Keyed BLAKE2b-128 is cheaper than SHA256 on short inputs and, being
+    keyed with a server-side secret, is still safe to store and index.
+    The raw 16-byte digest is stored rather than hex, which halves the
+    lookup index's key size.  The SHA256 ``key_hash`` stays the at-rest
+    identity of the key.
+
+    Args:
+        raw_key: Raw API key string
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest of the key
+    """
+    return hashlib.blake2b(raw_key.encode(), digest_size=16, key=_FAST_HASH_KEY).digest()
+
+
+# ==================== Validation Lookup ====================
+
+
+@dataclass(slots=True, frozen=True)
+class AuthenticatedKey:
+    """
+    Read-only view of a validated API key.
+
+    Carries only the columns request handling needs; use :class:`APIKey`
+    for anything that reads or writes the full row.
+    """
+
+    id: int
+    name: str
+    tier: str
+    expires_at: Optional[datetime]
+    allowed_ips: Optional[str]
+    allowed_ip_set: FrozenSet[str]
+
+
+# Built once at import; the statements' compiled forms are reused by
+# SQLAlchemy's compiled cache on every call.  The WHERE clause repeats the
+# partial index predicate verbatim so the planner can match the index.
+_AUTH_COLUMNS = select(
+    APIKey.id,
+    APIKey.name,
+    APIKey.tier,
+    APIKey.expires_at,
+    APIKey.allowed_ips,
+    APIKey.key_hash_fast,
+)
+
+_AUTH_LOOKUP = (
+    _AUTH_COLUMNS.where(APIKey.key_hash_fast == bindparam("fast_hash"))
+    .where(text(_LIVE_KEY_PREDICATE))
+    .limit(1)
+)
+
+# Rows created before key_hash_fast existed only match on SHA256
+_AUTH_LOOKUP_LEGACY = (
+    _AUTH_COLUMNS.where(APIKey.key_hash == bindparam("key_hash"))
+    .where(text(_LIVE_KEY_PREDICATE))
+    .limit(1)
+)
+
+_BACKFILL_FAST_HASH = (
+    update(APIKey.__table__)
+    .where(APIKey.__table__.c.id == bindparam("key_id"))
+    .values(key_hash_fast=bindparam("fast_hash"))
+)
+
+
+# ==================== Validation Cache ====================
+
+# Hot keys are looked up on every authenticated request; caching the
+# validated key by its fast hash skips both the SHA256 and the SELECT.  The TTL
+# bounds how long a change made outside this process (e.g. revocation from
+# another worker) can go unseen.
+_API_KEY_CACHE_SIZE: int = 4096
+_API_KEY_CACHE_TTL_SECONDS: float = 60.0
+
+
+class _APIKeyCache:
+    """
+    Thread-safe LRU with TTL keyed by ``key_hash_fast``.
+
+    The positive cache holds immutable :class:`AuthenticatedKey` records
+    rather than ORM instances, so they can be shared across requests and
+    sessions; the negative cache holds ``True`` for unknown keys.
+    """
+
+    def __init__(
+        self,
+        max_size: int = _API_KEY_CACHE_SIZE,
+        ttl_seconds: float = _API_KEY_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._store: "OrderedDict[bytes, Tuple[object, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key_hash: bytes) -> Optional[object]:
+        """
+        Return the cached value for *key_hash*, or ``None`` on miss/expiry.
+
+        Args:
+            key_hash: Fast lookup hash of the raw key
+
+        Returns:
+            The cached value, or ``None``
+        """
+        with self._lock:
+            entry = self._store.get(key_hash)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.monotonic() - stored_at > self._ttl:
+                del self._store[key_hash]
+                return None
+            self._store.move_to_end(key_hash)
+            return value
+
+    def set(self, key_hash: bytes, value: object) -> None:
+        """
+        Store *value* under *key_hash*, evicting the LRU entry if full.
+
+        Args:
+            key_hash: Fast lookup hash of the raw key
+            value: Value to cache
+        """
+        with self._lock:
+            self._store[key_hash] = (value, time.monotonic())
+            self._store.move_to_end(key_hash)
+            if len(self._store) > self._max_size:
+                self._store.popitem(last=False)
+
+    def invalidate(self, key_hash: bytes) -> bool:
+        """
+        Drop the entry for *key_hash*.
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        with self._lock:
+            return self._store.pop(key_hash, None) is not None
+
+    def clear(self) -> int:
+        """
+        Drop every entry.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            count = len(self._store)
+            self._store.clear()
+            return count
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._store)
+
+
+_api_key_cache = _APIKeyCache()
+
+# Hashes that matched no live key.  Junk keys from scanners are rejected
+# from memory on repeat instead of costing two indexed lookups each.  A
+# process-local Bloom filter could not see keys created by other workers,
+# whereas a freshly issued key cannot already be in this cache.
+_UNKNOWN_KEY_CACHE_SIZE: int = 8192
+_UNKNOWN_KEY_CACHE_TTL_SECONDS: float = 300.0
+
+_unknown_key_cache = _APIKeyCache(
+    max_size=_UNKNOWN_KEY_CACHE_SIZE, ttl_seconds=_UNKNOWN_KEY_CACHE_TTL_SECONDS
+)
+
+
+def clear_api_key_cache() -> int:
+    """
+    Drop all cached API key lookups, positive and negative.
+
+    Returns:
+        int: Number of entries removed
+    """
+    return _api_key_cache.clear() + _unknown_key_cache.clear()
+
+
+# ==================== Usage Tracking ====================
+
+# Usage counters are aggregated in memory and written back in one batched
+# UPDATE per interval instead of one write transaction per request.
+_USAGE_FLUSH_INTERVAL_SECONDS: float = 30.0
+
+
+class _UsageBuffer:
+    """Thread-safe per-key request counts awaiting a flush."""
+
+    def __init__(self) -> None:
+        self._counts: Counter = Counter()
+        self._last_used: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key_id: int, used_at: datetime, count: int = 1) -> None:
+        """
+        Add *count* requests for *key_id*, keeping the latest timestamp.
+
+        Args:
+            key_id: API key ID
+            used_at: Time of the (latest) request
+            count: Number of requests to add
+        """
+        with self._lock:
+            self._counts[key_id] += count
+            previous = self._last_used.get(key_id)
+            if previous is None or used_at > previous:
+                self._last_used[key_id] = used_at
+
+    def drain(self) -> List[Dict]:
+        """
+        Take and reset all pending counts.
+
+        Returns:
+            list: ``{"key_id", "delta", "used_at"}`` rows, one per key
+        """
+        with self._lock:
+            rows = [
+                {"key_id": key_id, "delta": delta, "used_at": self._last_used[key_id]}
+                for key_id, delta in self._counts.items()
+            ]
+            self._counts.clear()
+            self._last_used.clear()
+        return rows
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._counts)
+
+
+_usage_buffer = _UsageBuffer()
+
+_api_keys_table = APIKey.__table__
+_USAGE_UPDATE = (
+    update(_api_keys_table)
+    .where(_api_keys_table.c.id == bindparam("key_id"))
+    .values(
+        total_requests=_api_keys_table.c.total_requests + bindparam("delta"),
+        last_used_at=bindparam("used_at"),
+    )
+)
+
+
+def _requeue_usage(rows: List[Dict]) -> None:
+    """Put drained usage rows back into the in-process buffer."""
+    for row in rows:
+        _usage_buffer.record(row["key_id"], row["used_at"], row["delta"])
+
+
+def _write_usage(rows: List[Dict], db: Optional[Session] = None) -> int:
+    """
+    Apply usage rows to the database in one executemany UPDATE.
+
+    Rows are re-queued if the write fails, so a transient database error
+    delays rather than loses them.
+
+    Args:
+        rows: ``{"key_id", "delta", "used_at"}`` rows
+        db: Database session (a short-lived one is opened if omitted)
+
+    Returns:
+        int: Number of API keys updated
+    """
+    if not rows:
+        return 0
+
+    try:
+        if db is None:
+            with get_db_context() as session:
+                session.execute(_USAGE_UPDATE, rows)
+        else:
+            db.execute(_USAGE_UPDATE, rows)
+            db.commit()
+    except Exception as exc:
+        if db is not None:
+            db.rollback()
+        _requeue_usage(rows)
+        logger.warning("API key usage flush failed (%d keys re-queued): %s", len(rows), exc)
+        return 0
+
+    return len(rows)
+
+
+def flush_api_key_usage(db: Optional[Session] = None) -> int:
+    """
+    Write this process's buffered usage counters to the database.
+
+    Args:
+        db: Database session (a short-lived one is opened if omitted)
+
+    Returns:
+        int: Number of API keys updated
+    """
+    return _write_usage(_usage_buffer.drain(), db)
+
+
+# When Redis is up, every worker adds its counts to shared ``INCRBY``
+# counters and whichever worker flushes next drains them with ``GETDEL``,
+# so the database sees one UPDATE per key per interval across the fleet.
+_USAGE_COUNT_KEY = "ak:c:"
+_USAGE_TIME_KEY = "ak:t:"
+_USAGE_TIME_TTL_SECONDS = 86400
+
+# Keep the newest ``last_used_at`` seen by any worker; a plain SET would let
+# a slow worker overwrite a newer timestamp with an older one.
+_STAGE_USAGE_TIME_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+local used_at = ARGV[1]
+if current and tonumber(current) > tonumber(used_at) then
+    used_at = current
+end
+redis.call('SET', KEYS[1], used_at, 'EX', ARGV[2])
+return used_at
+"""
+
+
+def _get_usage_redis():
+    """Return the shared Redis client, or ``None`` if unavailable."""
+    try:
+        from app.core.redis import redis_manager
+
+        if not redis_manager.is_available:
+            return None
+        return redis_manager.redis
+    except Exception:
+        return None
+
+
+def _notify_redis_unavailable(exc: Exception) -> None:
+    """Report a failed Redis operation to the RedisManager."""
+    try:
+        from app.core.redis import redis_manager
+
+        redis_manager.mark_unavailable(str(exc))
+    except Exception:
+        pass
+
+
+async def _stage_usage_in_redis(redis, rows: List[Dict]) -> None:
+    """Add local usage rows to the shared Redis counters."""
+    pipe = redis.pipeline(transaction=False)
+    for row in rows:
+        key_id = row["key_id"]
+        pipe.incrby(f"{_USAGE_COUNT_KEY}{key_id}", row["delta"])
+        pipe.eval(
+            _STAGE_USAGE_TIME_SCRIPT,
+            1,
+            f"{_USAGE_TIME_KEY}{key_id}",
+            row["used_at"].timestamp(),
+            _USAGE_TIME_TTL_SECONDS,
+        )
+    await pipe.execute()
+
+
+async def _collect_usage_from_redis(redis) -> List[Dict]:
+    """Atomically take every shared counter out of Redis as usage rows."""
+    count_keys = [key async for key in redis.scan_iter(match=f"{_USAGE_COUNT_KEY}*", count=500)]
+    if not count_keys:
+        return []
+
+    pipe = redis.pipeline(transaction=False)
+    for key in count_keys:
+        pipe.getdel(key)
+        pipe.getdel(f"{_USAGE_TIME_KEY}{key[len(_USAGE_COUNT_KEY) :]}")
+    values = await pipe.execute()
+
+    rows = []
+    for key, delta, used_at in zip(count_keys, values[::2], values[1::2]):
+        if not delta or int(delta) <= 0:
+            continue
+        rows.append(
+            {
+                "key_id": int(key[len(_USAGE_COUNT_KEY) :]),
+                "delta": int(delta),
+                "used_at": (
+                    datetime.fromtimestamp(float(used_at), timezone.utc)
+                    if used_at
+                    else datetime.now(timezone.utc)
+                ),
+            }
+        )
+    return rows
+
+
+async def flush_api_key_usage_async() -> int:
+    """
+    Flush usage counters, aggregating across workers through Redis.
+
+    Falls back to :func:`flush_api_key_usage` when Redis is unavailable.
+
+    Returns:
+        int: Number of API keys updated
+    """
+    redis = _get_usage_redis()
+    if redis is None:
+        return await asyncio.to_thread(flush_api_key_usage)
+
+    local_rows = _usage_buffer.drain()
+    try:
+        if local_rows:
+            await _stage_usage_in_redis(redis, local_rows)
+    except Exception as exc:
+        _requeue_usage(local_rows)
+        _notify_redis_unavailable(exc)
+        return await asyncio.to_thread(flush_api_key_usage)
+
+    try:
+        rows = await _collect_usage_from_redis(redis)
+    except Exception as exc:
+        # Staged counts stay in Redis for the next flush
+        _notify_redis_unavailable(exc)
+        return 0
+
+    return await asyncio.to_thread(_write_usage, rows)
+
+
+async def run_usage_flusher(interval: float = _USAGE_FLUSH_INTERVAL_SECONDS) -> None:
+    """
+    Periodically flush buffered usage counters until cancelled.
+
+    Args:
+        interval: Seconds between flushes
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await flush_api_key_usage_async()
+
+
 # ==================== API Key CRUD Operations ====================
 
 
@@ -151,8 +653,10 @@ def create_api_key(
         expires_at = datetime.now(timezone.utc) + timedelta(days=expires_in_days)
 
     # Create model
+    fast_hash = hash_api_key_fast(raw_key)
     api_key = APIKey(
         key_hash=key_hash,
+        key_hash_fast=fast_hash,
         key_prefix=key_prefix,
         name=name,
         description=description,
@@ -160,64 +664,138 @@ def create_api_key(
         owner_email=owner_email,
         tier=tier,
         expires_at=expires_at,
-        allowed_ips=",".join(allowed_ips) if allowed_ips else None,
-        allowed_domains=",".join(allowed_domains) if allowed_domains else None,
+        allowed_ips=_join_csv(allowed_ips),
+        allowed_domains=_join_csv(allowed_domains),
     )
 
     db.add(api_key)
+    db.flush()
+
+    # Every column default is client-side and the INSERT returned the id, so
+    # the flushed instance is already complete.  Re-apply those values after
+    # commit expires them instead of paying a SELECT to reload the row.
+    loaded = {column.key: getattr(api_key, column.key) for column in APIKey.__table__.columns}
     db.commit()
-    db.refresh(api_key)
+    for key, value in loaded.items():
+        set_committed_value(api_key, key, value)
+    _unknown_key_cache.invalidate(fast_hash)
 
     return raw_key, api_key
 
 
-def validate_api_key(
-    db: Session, raw_key: str, client_ip: Optional[str] = None
-) -> Optional[APIKey]:
+def _load_api_key(db: Session, raw_key: str, fast_hash: bytes) -> Optional[AuthenticatedKey]:
     """
-    Validate an API key and return the model if valid.
+    Look a key up in the database and cache it.
 
     Args:
         db: Database session
         raw_key: Raw API key from request
-        client_ip: Client IP address for IP validation
+        fast_hash: ``hash_api_key_fast(raw_key)``
 
     Returns:
-        APIKey: API key model if valid, None otherwise
+        AuthenticatedKey: The live key, or None if no live key matches
     """
-    # Hash the provided key
-    key_hash = hash_api_key(raw_key)
+    row = db.execute(_AUTH_LOOKUP, {"fast_hash": fast_hash}).first()
+    if row is None:
+        row = db.execute(_AUTH_LOOKUP_LEGACY, {"key_hash": hash_api_key(raw_key)}).first()
 
-    # Query database
-    api_key = (
-        db.query(APIKey)
-        .filter(
-            APIKey.key_hash == key_hash, APIKey.is_active.is_(True), APIKey.is_revoked.is_(False)
-        )
-        .first()
+    if not row:
+        _unknown_key_cache.set(fast_hash, True)
+        return None
+
+    if row.key_hash_fast != fast_hash:
+        db.execute(_BACKFILL_FAST_HASH, {"key_id": row.id, "fast_hash": fast_hash})
+        db.commit()
+
+    api_key = AuthenticatedKey(
+        id=row.id,
+        name=row.name,
+        tier=row.tier,
+        expires_at=row.expires_at,
+        allowed_ips=row.allowed_ips,
+        allowed_ip_set=_parse_allowed_ips(row.allowed_ips) if row.allowed_ips else frozenset(),
     )
+    _api_key_cache.set(fast_hash, api_key)
+    return api_key
 
-    if not api_key:
-        return None
 
+def _authorize(api_key: AuthenticatedKey, client_ip: Optional[str]) -> Optional[AuthenticatedKey]:
+    """Apply expiry and IP checks to a live key and record its use."""
     # Check expiration
     if api_key.expires_at and api_key.expires_at < datetime.now(timezone.utc):
         return None
 
     # Check IP restriction
-    if api_key.allowed_ips and client_ip:
-        allowed = [ip.strip() for ip in api_key.allowed_ips.split(",")]
-        if client_ip not in allowed:
+    if api_key.allowed_ip_set and client_ip:
+        if client_ip not in api_key.allowed_ip_set:
             return None
 
-    # Update usage
-    api_key.total_requests += 1
-    api_key.last_used_at = datetime.now(timezone.utc)
-    db.commit()
+    # Record usage (written back in batches by flush_api_key_usage)
+    _usage_buffer.record(api_key.id, datetime.now(timezone.utc))
 
     return api_key
 
 
+def validate_api_key(
+    db: Session, raw_key: str, client_ip: Optional[str] = None
+) -> Optional[AuthenticatedKey]:
+    """
+    Validate an API key and return it if valid.
+
+    Args:
+        db: Database session
+        raw_key: Raw API key from request
+        client_ip: Client IP address for IP validation
+
+    Returns:
+        AuthenticatedKey: Read-only view of the key if valid, None otherwise
+    """
+    # Serve hot keys from the in-process cache; fall back to the database
+    fast_hash = hash_api_key_fast(raw_key)
+    api_key = _api_key_cache.get(fast_hash)
+    if api_key is None:
+        if _unknown_key_cache.get(fast_hash):
+            return None
+        api_key = _load_api_key(db, raw_key, fast_hash)
+        if api_key is None:
+            return None
+    return _authorize(api_key, client_ip)
+
+
+async def validate_api_key_async(
+    db: Session, raw_key: str, client_ip: Optional[str] = None
+) -> Optional[AuthenticatedKey]:
+    """
+    Event-loop friendly :func:`validate_api_key`.
+
+    Cache hits (including known-unknown keys) are answered inline; only a
+    cache miss runs the synchronous database lookup, in the threadpool, so
+    it never blocks the event loop.
+
+    The lookup still takes the synchronous ``Session`` from ``get_db`` so
+    the auth dependencies work with every router as it is today; moving
+    them to :func:`app.core.database.get_async_db` means migrating
+    ``get_db`` and the routers with them.
+
+    Args:
+        db: Database session
+        raw_key: Raw API key from request
+        client_ip: Client IP address for IP validation
+
+    Returns:
+        AuthenticatedKey: Read-only view of the key if valid, None otherwise
+    """
+    fast_hash = hash_api_key_fast(raw_key)
+    api_key = _api_key_cache.get(fast_hash)
+    if api_key is None:
+        if _unknown_key_cache.get(fast_hash):
+            return None
+        api_key = await run_in_threadpool(_load_api_key, db, raw_key, fast_hash)
+        if api_key is None:
+            return None
+    return _authorize(api_key, client_ip)
+
+
 def revoke_api_key(db: Session, key_id: int) -> bool:
     """
     Revoke an API key.
@@ -238,6 +816,9 @@ def revoke_api_key(db: Session, key_id: int) -> bool:
     api_key.revoked_at = datetime.now(timezone.utc)
     db.commit()
 
+    if api_key.key_hash_fast:
+        _api_key_cache.invalidate(api_key.key_hash_fast)
+
     return True
 
 
@@ -274,7 +855,7 @@ api_key_header = APIKeyHeader(name=settings.API_KEY_HEADER_NAME, auto_error=Fals
 
 async def get_api_key(
     api_key: str = Security(api_key_header), db: Session = Depends(get_db)
-) -> APIKey:
+) -> AuthenticatedKey:
     """
     FastAPI dependency to validate API key from header.
 
@@ -283,7 +864,7 @@ async def get_api_key(
         db: Database session
 
     Returns:
-        APIKey: Validated API key model
+        AuthenticatedKey: Validated API key
 
     Raises:
         HTTPException: If API key is invalid or missing
@@ -296,7 +877,7 @@ async def get_api_key(
         )
 
     # Validate key
-    validated_key = validate_api_key(db, api_key)
+    validated_key = await validate_api_key_async(db, api_key)
 
     if not validated_key:
         raise HTTPException(
@@ -310,7 +891,7 @@ async def get_api_key(
 
 async def get_optional_api_key(
     api_key: Optional[str] = Security(api_key_header), db: Session = Depends(get_db)
-) -> Optional[APIKey]:
+) -> Optional[AuthenticatedKey]:
     """
     Optional API key authentication.
     Returns None if no key provided, validates if present.
@@ -320,47 +901,55 @@ async def get_optional_api_key(
         db: Database session
 
     Returns:
-        Optional[APIKey]: Validated API key or None
+        Optional[AuthenticatedKey]: Validated API key or None
     """
     if not api_key:
         return None
 
-    return validate_api_key(db, api_key)
+    return await validate_api_key_async(db, api_key)
 
 
 # ==================== Rate Limit Helper ====================
 
+# Built once at import from settings; read-only so callers cannot mutate
+# the shared tables.
+_ANONYMOUS_LIMITS: Mapping[str, int] = MappingProxyType(
+    {
+        "per_minute": settings.RATE_LIMIT_PER_MINUTE,
+        "per_hour": settings.RATE_LIMIT_PER_HOUR,
+        "per_day": settings.RATE_LIMIT_PER_DAY,
+    }
+)
+
+_TIER_LIMITS: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {
+        "free": MappingProxyType(
+            {
+                "per_minute": settings.API_KEY_RATE_LIMIT_PER_MINUTE,
+                "per_hour": settings.API_KEY_RATE_LIMIT_PER_HOUR,
+                "per_day": settings.API_KEY_RATE_LIMIT_PER_DAY,
+            }
+        ),
+        "pro": MappingProxyType({"per_minute": 100, "per_hour": 1000, "per_day": 10000}),
+        "enterprise": MappingProxyType({"per_minute": 500, "per_hour": 5000, "per_day": 50000}),
+    }
+)
+
 
-def get_rate_limits(api_key: Optional[APIKey] = None) -> dict:
+def get_rate_limits(api_key: Optional[AuthenticatedKey] = None) -> Mapping[str, int]:
     """
     Get rate limits based on API key tier or default.
 
     Args:
-        api_key: API key model (if authenticated)
+        api_key: Validated API key (if authenticated)
 
     Returns:
-        dict: Rate limits {per_minute, per_hour, per_day}
+        Mapping: Read-only rate limits {per_minute, per_hour, per_day}
     """
     if not api_key:
-        # Unauthenticated limits
-        return {
-            "per_minute": settings.RATE_LIMIT_PER_MINUTE,
-            "per_hour": settings.RATE_LIMIT_PER_HOUR,
-            "per_day": settings.RATE_LIMIT_PER_DAY,
-        }
-
-    # Tier-based limits
-    tier_limits = {
-        "free": {
-            "per_minute": settings.API_KEY_RATE_LIMIT_PER_MINUTE,
-            "per_hour": settings.API_KEY_RATE_LIMIT_PER_HOUR,
-            "per_day": settings.API_KEY_RATE_LIMIT_PER_DAY,
-        },
-        "pro": {"per_minute": 100, "per_hour": 1000, "per_day": 10000},
-        "enterprise": {"per_minute": 500, "per_hour": 5000, "per_day": 50000},
-    }
+        return _ANONYMOUS_LIMITS
 
-    return tier_limits.get(api_key.tier, tier_limits["free"])
+    return _TIER_LIMITS.get(api_key.tier, _TIER_LIMITS["free"])
 
 
 # ==================== Usage Example ====================
@@ -368,13 +957,13 @@ def get_rate_limits(api_key: Optional[APIKey] = None) -> dict:
 # In your FastAPI endpoint:
 
 from fastapi import APIRouter, Depends
-from app.core.auth import get_api_key, APIKey
+from app.core.auth import get_api_key, AuthenticatedKey
 
 router = APIRouter()
 
 @router.get("/protected-endpoint")
 async def protected_endpoint(
-    api_key: APIKey = Depends(get_api_key)
+    api_key: AuthenticatedKey = Depends(get_api_key)
 ):
     # This endpoint requires valid API key
     return {
@@ -385,7 +974,7 @@ async def protected_endpoint(
 
 @router.get("/optional-auth-endpoint")
 async def optional_auth_endpoint(
-    api_key: Optional[APIKey] = Depends(get_optional_api_key)
+    api_key: Optional[AuthenticatedKey] = Depends(get_optional_api_key)
 ):
     # This endpoint works with or without API key
     if api_key:
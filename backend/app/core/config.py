@@ -3,13 +3,83 @@ BlockScope Configuration Module
 Handles all environment variables with validation using Pydantic Settings
 """
 
+import logging
 import os
-import secrets
-from functools import lru_cache
-from typing import List, Optional
-
-from pydantic import EmailStr, Field, HttpUrl, PostgresDsn, RedisDsn, conint, constr, validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from pydantic import (
+    EmailStr,
+    Field,
+    HttpUrl,
+    PostgresDsn,
+    RedisDsn,
+    conint,
+    constr,
+    field_validator,
+    model_validator,
+)
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
+from pydantic_settings.sources import DotEnvSettingsSource, read_env_file
+
+logger = logging.getLogger("blockscope.config")
+
+# ==================== Env Files ====================
+# Later files take priority, matching pydantic-settings' env_file semantics
+_ENV_FILES = (".env.development", ".env")
+_ENV_FILE_ENCODING = "utf-8"
+
+
+@lru_cache(maxsize=8)
+def _read_env_files(
+    paths: Tuple[str, ...], encoding: Optional[str], case_sensitive: bool
+) -> Dict[str, Optional[str]]:
+    """Read and merge env files once per process (keyed by absolute path)."""
+    values: Dict[str, Optional[str]] = {}
+    for path in paths:
+        if Path(path).is_file():
+            values.update(
+                read_env_file(Path(path), encoding=encoding, case_sensitive=case_sensitive)
+            )
+    return values
+
+
+class _CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """Dotenv settings source that parses each env file at most once."""
+
+    def _read_env_files(self, case_sensitive: bool) -> Dict[str, Optional[str]]:
+        env_files = self.env_file
+        if env_files is None:
+            return {}
+        if isinstance(env_files, (str, os.PathLike)):
+            env_files = [env_files]
+        paths = tuple(os.path.abspath(os.path.expanduser(f)) for f in env_files)
+        return _read_env_files(paths, self.env_file_encoding, case_sensitive)
+
+
+# ==================== Validation Constants ====================
+_ALLOWED_ENVIRONMENTS = frozenset({"development", "testing", "staging", "production"})
+_ALLOWED_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_ALLOWED_JWT_ALGORITHMS = frozenset({"HS256", "HS384", "HS512", "RS256", "RS384", "RS512"})
+_WEAK_SECRET_KEYS = frozenset(
+    {
+        "changeme",
+        "secret",
+        "password",
+        "dev_secret_key_DO_NOT_USE_IN_PRODUCTION_abc123xyz789",
+    }
+)
+_WEAK_ADMIN_PASSWORDS = frozenset({"admin", "password", "changeme", "admin123"})
+
+# List fields that may be supplied as comma-separated strings (e.g. from .env)
+_CSV_LIST_FIELDS = (
+    "CORS_ORIGINS",
+    "CORS_ALLOW_METHODS",
+    "CORS_ALLOW_HEADERS",
+    "ALLOWED_EXTENSIONS",
+)
 
 
 class Settings(BaseSettings):
@@ -36,21 +106,22 @@ class Settings(BaseSettings):
         default="INFO", description="Logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL"
     )
 
-    @validator("ENVIRONMENT")
+    @field_validator("ENVIRONMENT")
+    @classmethod
     def validate_environment(cls, v):
         """Ensure environment is one of allowed values"""
-        allowed = ["development", "testing", "staging", "production"]
-        if v not in allowed:
-            raise ValueError(f"ENVIRONMENT must be one of {allowed}")
+        if v not in _ALLOWED_ENVIRONMENTS:
+            raise ValueError(f"ENVIRONMENT must be one of {sorted(_ALLOWED_ENVIRONMENTS)}")
         return v
 
-    @validator("LOG_LEVEL")
+    @field_validator("LOG_LEVEL")
+    @classmethod
     def validate_log_level(cls, v):
         """Ensure log level is valid"""
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in allowed:
-            raise ValueError(f"LOG_LEVEL must be one of {allowed}")
-        return v.upper()
+        level = v.upper()
+        if level not in _ALLOWED_LOG_LEVELS:
+            raise ValueError(f"LOG_LEVEL must be one of {sorted(_ALLOWED_LOG_LEVELS)}")
+        return level
 
     # ==================== Server Configuration ====================
     HOST: str = Field(default="0.0.0.0", description="Server host")
@@ -68,7 +139,8 @@ class Settings(BaseSettings):
     )
     DB_ECHO: bool = Field(default=False, description="Log SQL statements")
 
-    @validator("DATABASE_URL", pre=True)
+    @field_validator("DATABASE_URL", mode="before")
+    @classmethod
     def validate_database_url(cls, v):
         """Ensure database URL is properly formatted"""
         if not v:
@@ -82,7 +154,7 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0", description="Redis connection string"
     )
     REDIS_PASSWORD: Optional[str] = Field(default=None, description="Redis password")
-    REDIS_MAX_CONNECTIONS: conint(gt=0) = Field(default=50, description="Max Redis connections")
+    REDIS_MAX_CONNECTIONS: conint(gt=0) = Field(default=10, description="Max Redis connections")
     REDIS_SOCKET_TIMEOUT: conint(gt=0) = Field(default=5, description="Socket timeout")
     REDIS_SOCKET_CONNECT_TIMEOUT: conint(gt=0) = Field(default=5, description="Connection timeout")
 
@@ -101,32 +173,31 @@ class Settings(BaseSettings):
         default=30, description="Refresh token expiration in days"
     )
 
-    @validator("SECRET_KEY", "JWT_SECRET_KEY")
+    @field_validator("SECRET_KEY", "JWT_SECRET_KEY")
+    @classmethod
     def validate_secret_keys(cls, v):
         """Ensure secret keys are strong"""
-        if v in [
-            "changeme",
-            "secret",
-            "password",
-            "dev_secret_key_DO_NOT_USE_IN_PRODUCTION_abc123xyz789",
-        ]:
+        if v in _WEAK_SECRET_KEYS:
             raise ValueError("Please change the default secret key to a secure random value")
         if len(v) < 32:
             raise ValueError("Secret key must be at least 32 characters long")
         return v
 
-    @validator("JWT_ALGORITHM")
+    @field_validator("JWT_ALGORITHM")
+    @classmethod
     def validate_jwt_algorithm(cls, v):
         """Ensure JWT algorithm is secure"""
-        allowed = ["HS256", "HS384", "HS512", "RS256", "RS384", "RS512"]
-        if v not in allowed:
-            raise ValueError(f"JWT_ALGORITHM must be one of {allowed}")
+        if v not in _ALLOWED_JWT_ALGORITHMS:
+            raise ValueError(f"JWT_ALGORITHM must be one of {sorted(_ALLOWED_JWT_ALGORITHMS)}")
         return v
 
     # API Key Configuration
     API_KEY_HEADER_NAME: str = Field(default="X-API-Key", description="API key header name")
     API_KEY_LENGTH: conint(ge=16, le=64) = Field(default=32, description="API key length")
     API_KEY_PREFIX: str = Field(default="bsc_", description="API key prefix")
+    AUTH_HASH_KEY: Optional[str] = Field(
+        default=None, description="Key for the fast API key lookup hash (defaults to SECRET_KEY)"
+    )
 
     # Password hashing
     BCRYPT_ROUNDS: conint(ge=10, le=16) = Field(default=12, description="BCrypt hashing rounds")
@@ -142,27 +213,6 @@ class Settings(BaseSettings):
     CORS_ALLOW_HEADERS: List[str] = Field(default=["*"], description="Allowed headers")
     CORS_MAX_AGE: conint(gt=0) = Field(default=3600, description="Preflight cache time")
 
-    @validator("CORS_ORIGINS", pre=True)
-    def parse_cors_origins(cls, v):
-        """Parse CORS origins from comma-separated string or list"""
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v
-
-    @validator("CORS_ALLOW_METHODS", "CORS_ALLOW_HEADERS", pre=True)
-    def parse_cors_lists(cls, v):
-        """Parse comma-separated CORS method/header strings into lists."""
-        if isinstance(v, str):
-            return [item.strip() for item in v.split(",")]
-        return v
-
-    @validator("CORS_ORIGINS")
-    def validate_cors_origins(cls, v, values):
-        """Warn if CORS is too permissive in production"""
-        if values.get("ENVIRONMENT") == "production" and "*" in v:
-            raise ValueError("CORS_ORIGINS should not contain '*' in production")
-        return v
-
     # ==================== Rate Limiting Configuration ====================
     RATE_LIMIT_ENABLED: bool = Field(default=True, description="Enable rate limiting")
     RATE_LIMIT_PER_MINUTE: conint(gt=0) = Field(
@@ -193,23 +243,6 @@ class Settings(BaseSettings):
         default=255, description="Maximum filename length"
     )
 
-    @validator("ALLOWED_EXTENSIONS", pre=True)
-    def parse_allowed_extensions(cls, v):
-        """Parse allowed extensions from comma-separated string or list"""
-        if isinstance(v, str):
-            return [ext.strip() for ext in v.split(",")]
-        return v
-
-    @validator("ALLOWED_EXTENSIONS")
-    def validate_allowed_extensions(cls, v):
-        """Ensure extensions start with dot"""
-        validated = []
-        for ext in v:
-            if not ext.startswith("."):
-                ext = f".{ext}"
-            validated.append(ext.lower())
-        return validated
-
     # ==================== Slither Configuration ====================
     SLITHER_TIMEOUT: conint(gt=0) = Field(
         default=300, description="Slither analysis timeout in seconds"
@@ -242,15 +275,16 @@ class Settings(BaseSettings):
     SMTP_TLS: bool = Field(default=True, description="Use TLS")
     SMTP_SSL: bool = Field(default=False, description="Use SSL")
 
-    @validator("SMTP_FROM_EMAIL")
-    def validate_smtp_config(cls, v, values):
+    @model_validator(mode="after")
+    def validate_smtp_config(self):
         """If SMTP is enabled, ensure required fields are set"""
-        if values.get("SMTP_ENABLED"):
-            if not all([values.get("SMTP_HOST"), values.get("SMTP_USER"), v]):
+        # Like the field validator it replaces, only check an explicit sender
+        if self.SMTP_ENABLED and "SMTP_FROM_EMAIL" in self.model_fields_set:
+            if not all([self.SMTP_HOST, self.SMTP_USER, self.SMTP_FROM_EMAIL]):
                 raise ValueError(
                     "SMTP_HOST, SMTP_USER, and SMTP_FROM_EMAIL required when SMTP_ENABLED=True"
                 )
-        return v
+        return self
 
     # ==================== Monitoring & Logging ====================
     SENTRY_DSN: Optional[str] = Field(default=None, description="Sentry DSN")
@@ -304,13 +338,14 @@ class Settings(BaseSettings):
     ADMIN_USERNAME: str = Field(default="admin", description="Admin username")
     ADMIN_PASSWORD: constr(min_length=8) = Field(default="changeme", description="Admin password")
 
-    @validator("ADMIN_PASSWORD")
-    def validate_admin_password(cls, v, values):
+    @model_validator(mode="after")
+    def validate_admin_password(self):
         """Warn about weak admin password in production"""
-        if values.get("ENVIRONMENT") == "production":
-            if v in ["admin", "password", "changeme", "admin123"]:
+        # Only an explicitly supplied password is checked (the default is not)
+        if self.ENVIRONMENT == "production" and "ADMIN_PASSWORD" in self.model_fields_set:
+            if self.ADMIN_PASSWORD in _WEAK_ADMIN_PASSWORDS:
                 raise ValueError("ADMIN_PASSWORD must be changed from default in production!")
-        return v
+        return self
 
     # ==================== External Services ====================
     ETH_RPC_URL: Optional[HttpUrl] = Field(default=None, description="Ethereum RPC URL")
@@ -332,15 +367,52 @@ class Settings(BaseSettings):
     TESTING: bool = Field(default=False, description="Testing mode")
     TEST_DATABASE_URL: Optional[PostgresDsn] = Field(default=None, description="Test database URL")
 
+    # ==================== List Parsing ====================
+    @model_validator(mode="before")
+    @classmethod
+    def split_csv_lists(cls, data):
+        """Split comma-separated CORS / extension strings into lists"""
+        if isinstance(data, dict):
+            for name in _CSV_LIST_FIELDS:
+                value = data.get(name)
+                if isinstance(value, str):
+                    data[name] = [item.strip() for item in value.split(",")]
+        return data
+
+    @model_validator(mode="after")
+    def normalise_lists(self):
+        """Dot-prefix and lowercase extensions; reject wildcard CORS in production"""
+        self.ALLOWED_EXTENSIONS = [
+            (ext if ext.startswith(".") else f".{ext}").lower() for ext in self.ALLOWED_EXTENSIONS
+        ]
+        if self.ENVIRONMENT == "production" and "*" in self.CORS_ORIGINS:
+            raise ValueError("CORS_ORIGINS should not contain '*' in production")
+        return self
+
     # ==================== Settings Config ====================
+    # env files are read by _CachedDotEnvSettingsSource (see settings_customise_sources)
     model_config = SettingsConfigDict(
-        env_file=(".env.development", ".env"),
-        env_file_encoding="utf-8",
+        env_file=None,
         case_sensitive=True,
         extra="ignore",
         enable_decoding=False,
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Swap the dotenv source for one that caches parsed env files"""
+        cached_dotenv = _CachedDotEnvSettingsSource(
+            settings_cls, env_file=_ENV_FILES, env_file_encoding=_ENV_FILE_ENCODING
+        )
+        return init_settings, env_settings, cached_dotenv, file_secret_settings
+
     # ==================== Computed Properties ====================
     @property
     def is_development(self) -> bool:
@@ -352,35 +424,64 @@ class Settings(BaseSettings):
         """Check if running in production"""
         return self.ENVIRONMENT == "production"
 
-    @property
+    # URL strings are derived once per instance; settings are not mutated after load.
+    @cached_property
     def database_url_sync(self) -> str:
         """Get sync database URL"""
         return str(self.DATABASE_URL)
 
-    @property
+    @cached_property
     def database_url_async(self) -> str:
         """Get async database URL"""
-        return str(self.DATABASE_URL).replace("postgresql://", "postgresql+asyncpg://")
+        return self.database_url_sync.replace("postgresql://", "postgresql+asyncpg://")
 
-    @property
+    @cached_property
     def redis_url_str(self) -> str:
         """Get Redis URL as string"""
         return str(self.REDIS_URL)
 
+    @cached_property
+    def cors_origins_set(self) -> FrozenSet[str]:
+        """Get CORS origins as a set for O(1) membership tests"""
+        return frozenset(self.CORS_ORIGINS)
+
+    @cached_property
+    def allowed_extensions_set(self) -> FrozenSet[str]:
+        """Get allowed upload extensions as a set for O(1) membership tests"""
+        return frozenset(self.ALLOWED_EXTENSIONS)
+
+    @cached_property
+    def database_display(self) -> str:
+        """Get database host/port/name without credentials (for logs and summaries)"""
+        parts = urlsplit(self.database_url_sync)
+        if not parts.hostname:
+            return "configured"
+        port = f":{parts.port}" if parts.port else ""
+        return f"{parts.hostname}{port}{parts.path}"
+
+    @cached_property
+    def redis_display(self) -> str:
+        """Get Redis host/port/db without credentials (for logs and summaries)"""
+        url = self.REDIS_URL
+        if not url.host:
+            return "configured"
+        port = f":{url.port}" if url.port else ""
+        return f"{url.host}{port}{url.path or ''}"
+
     def generate_secret_key(self) -> str:
         """Generate a secure secret key"""
-        return secrets.token_urlsafe(64)
+        return generate_secure_key(64)
 
     def validate_all(self) -> None:
-        """Perform additional validation checks"""
-        # Check production-specific requirements
-        if self.is_production:
-            if self.DEBUG:
-                raise ValueError("DEBUG must be False in production")
-            if self.ENABLE_API_DOCS:
-                print("WARNING: API docs are enabled in production")
-            if "*" in self.CORS_ORIGINS:
-                raise ValueError("CORS_ORIGINS should not contain '*' in production")
+        """Perform additional validation checks (production only)"""
+        if not self.is_production:
+            return
+        if self.DEBUG:
+            raise ValueError("DEBUG must be False in production")
+        if "*" in self.cors_origins_set:
+            raise ValueError("CORS_ORIGINS should not contain '*' in production")
+        if self.ENABLE_API_DOCS:
+            logger.warning("API docs are enabled in production")
 
 
 @lru_cache()
@@ -400,15 +501,27 @@ def get_settings() -> Settings:
         settings.validate_all()
         return settings
     except Exception as e:
-        print(f"Configuration Error: {str(e)}")
-        print("\nPlease check your environment variables.")
-        print("Required variables: DATABASE_URL, SECRET_KEY, JWT_SECRET_KEY")
-        print(f"\nCurrent ENVIRONMENT: {os.getenv('ENVIRONMENT', 'unknown')}")
+        logger.error(
+            "Configuration error: %s\n"
+            "Please check your environment variables. "
+            "Required variables: DATABASE_URL, SECRET_KEY, JWT_SECRET_KEY. "
+            "Current ENVIRONMENT: %s",
+            e,
+            os.environ.get("ENVIRONMENT", "unknown"),
+        )
         raise
 
 
-# Export settings instance
-settings = get_settings()
+def __getattr__(name: str):
+    """
+    Resolve ``settings`` lazily so importing this module does no work.
+
+    ``from app.core.config import settings`` keeps working; the first access
+    builds and validates the cached instance via :func:`get_settings`.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ==================== Helper Functions ====================
@@ -424,24 +537,22 @@ def generate_secure_key(length: int = 64) -> str:
     Returns:
         str: Secure random key
     """
+    import secrets  # only needed by this rarely-used helper
+
     return secrets.token_urlsafe(length)
 
 
 def print_config_summary():
     """Print configuration summary (for debugging)"""
-    s = settings
+    s = get_settings()
     print("\n" + "=" * 60)
     print("BLOCKSCOPE CONFIGURATION SUMMARY")
     print("=" * 60)
     print(f"Environment:      {s.ENVIRONMENT}")
     print(f"Debug Mode:       {s.DEBUG}")
     print(f"API Docs:         {s.ENABLE_API_DOCS}")
-    print(
-        f"Database:         {s.DATABASE_URL.split('@')[1] if '@' in str(s.DATABASE_URL) else 'configured'}"
-    )
-    print(
-        f"Redis:            {s.REDIS_URL.split('@')[1] if '@' in str(s.REDIS_URL) else 'configured'}"
-    )
+    print(f"Database:         {s.database_display}")
+    print(f"Redis:            {s.redis_display}")
     print(
         f"CORS Origins:     {', '.join(s.CORS_ORIGINS[:3])}{'...' if len(s.CORS_ORIGINS) > 3 else ''}"
     )
@@ -453,7 +564,7 @@ def print_config_summary():
 if __name__ == "__main__":  # pragma: no cover
     # Test configuration loading
     try:
-        settings = get_settings()
+        get_settings()
         print("Configuration loaded successfully.")
         print_config_summary()
     except Exception as e:
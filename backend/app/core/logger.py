@@ -7,18 +7,34 @@ Provides structured JSON logging with:
 - Error context capture
 - Rotating file handler
 - Environment-aware formatting (JSON in prod, human-readable in dev)
+- Non-blocking output: records are queued and written by a background thread
 """
 
+import atexit
 import json
 import logging
 import os
+import queue
+import threading
 import time
 import traceback
 import uuid
 from contextvars import ContextVar
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a pinned dependency
+    orjson = None  # type: ignore[assignment]
+
+# No formatter here emits thread / process fields, so skip collecting them
+# for every LogRecord.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 # ──────────────────────────────────────────────
 # Context variable for per-request tracking
@@ -61,6 +77,29 @@ def get_elapsed_ms() -> float:
     return round((time.perf_counter() - start) * 1000, 2)
 
 
+def _record_context(record: logging.LogRecord) -> Tuple[str, float]:
+    """
+    Return the request ID and elapsed time for a record.
+
+    Queued records carry the values captured on the logging thread; records
+    formatted directly fall back to the current context.
+    """
+    rid = getattr(record, "request_id", None)
+    if rid is None:
+        return get_request_id(), get_elapsed_ms()
+    return rid, getattr(record, "elapsed_ms", 0.0)
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    """Serialise a log payload with ``orjson`` when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits — let the stdlib handle it
+    return json.dumps(payload, default=str)
+
+
 # ──────────────────────────────────────────────
 # JSON log formatter
 # ──────────────────────────────────────────────
@@ -83,13 +122,14 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-encoded log line.
         """
+        rid, elapsed = _record_context(record)
         payload: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "request_id": get_request_id(),
-            "elapsed_ms": get_elapsed_ms(),
+            "request_id": rid,
+            "elapsed_ms": elapsed,
         }
 
         # Include module / function context
@@ -119,7 +159,7 @@ class JSONFormatter(logging.Formatter):
             if key not in _RESERVED and not key.startswith("_"):
                 payload[key] = value
 
-        return json.dumps(payload, default=str)
+        return _dumps(payload)
 
 
 class HumanFormatter(logging.Formatter):
@@ -150,9 +190,8 @@ class HumanFormatter(logging.Formatter):
         """
         color = self.LEVEL_COLORS.get(record.levelname, "")
         reset = self.RESET
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        rid = get_request_id()
-        elapsed = get_elapsed_ms()
+        ts = datetime.fromtimestamp(record.created, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        rid, elapsed = _record_context(record)
         elapsed_str = f"{elapsed:>8.1f}ms" if elapsed else "        -  "
 
         base = (
@@ -166,6 +205,38 @@ class HumanFormatter(logging.Formatter):
         return base
 
 
+# ──────────────────────────────────────────────
+# Queued output
+# ──────────────────────────────────────────────
+
+class _ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that snapshots per-request context before enqueueing.
+
+    Formatting happens on the listener thread, where the request context
+    variables are not set, so the request ID and elapsed time are copied
+    onto the record here.  The queue is in-process, so ``exc_info`` is kept
+    for the real formatters instead of being flattened to text.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy the record, merge its message args and attach request context.
+
+        Args:
+            record: The record being logged.
+
+        Returns:
+            A record that is safe to format on another thread.
+        """
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        record.request_id = get_request_id()
+        record.elapsed_ms = get_elapsed_ms()
+        return record
+
+
 # ──────────────────────────────────────────────
 # Logger factory
 # ──────────────────────────────────────────────
@@ -188,7 +259,44 @@ def _is_json_mode() -> bool:
     return env not in ("development", "dev", "local")
 
 
+_setup_lock = threading.Lock()
+
+
 def setup_logger(name: str = "blockscope") -> logging.Logger:
+    """
+    Return the configured logger for ``name``, building it at most once.
+
+    Thread-safe: concurrent first calls for the same name attach exactly
+    one set of handlers.
+
+    Args:
+        name: Logger name (default: "blockscope").
+
+    Returns:
+        Configured Logger instance.
+    """
+    with _setup_lock:
+        return _build_logger(name)
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Flush and stop a queue listener; a no-op if it is already stopped."""
+    if listener._thread is not None:
+        listener.stop()
+
+
+def _detach_queue_handlers(logger: logging.Logger) -> None:
+    """Remove queue handlers from an earlier build (e.g. before a module reload)."""
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            listener = getattr(handler, "listener", None)
+            if listener is not None:
+                _stop_listener(listener)
+            logger.removeHandler(handler)
+
+
+@lru_cache(maxsize=None)
+def _build_logger(name: str) -> logging.Logger:
     """
     Build and configure the BlockScope application logger.
 
@@ -197,6 +305,8 @@ def setup_logger(name: str = "blockscope") -> logging.Logger:
     - Console handler always active
     - Rotating file handler (configurable via env vars)
     - Request ID injected automatically via context var
+    - Handlers run on a background ``QueueListener`` thread, so callers
+      never block on console or disk I/O
 
     Args:
         name: Logger name (default: "blockscope").
@@ -205,10 +315,7 @@ def setup_logger(name: str = "blockscope") -> logging.Logger:
         Configured Logger instance.
     """
     logger = logging.getLogger(name)
-
-    # Avoid double-adding handlers if already configured
-    if logger.handlers:
-        return logger
+    _detach_queue_handlers(logger)
 
     level = _get_log_level()
     logger.setLevel(level)
@@ -223,7 +330,7 @@ def setup_logger(name: str = "blockscope") -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # Rotating file handler
     log_file_enabled = os.getenv("LOG_FILE_ENABLED", "true").lower() in ("true", "1", "yes")
@@ -243,7 +350,15 @@ def setup_logger(name: str = "blockscope") -> logging.Logger:
         file_handler.setLevel(level)
         # File handler always uses JSON for machine-parseable logs
         file_handler.setFormatter(JSONFormatter())
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_handler = _ContextQueueHandler(log_queue)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler.listener = listener  # type: ignore[attr-defined]
+    listener.start()
+    atexit.register(_stop_listener, listener)
+    logger.addHandler(queue_handler)
 
     return logger
 
@@ -290,9 +405,14 @@ class PerformanceTimer:
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         elapsed_ms = round((time.perf_counter() - self._start) * 1000, 2)
+        failed = exc_type is not None
+        slow = elapsed_ms > self.warn_threshold_ms
+        # The common fast path logs at DEBUG; skip building the record when disabled.
+        if not (failed or slow or self.log.isEnabledFor(logging.DEBUG)):
+            return
         log_extra = {"operation": self.operation, "duration_ms": elapsed_ms, **self.extra}
 
-        if exc_type is not None:
+        if failed:
             self.log.error(
                 "Operation '%s' failed after %.1f ms",
                 self.operation,
@@ -300,7 +420,7 @@ class PerformanceTimer:
                 extra=log_extra,
                 exc_info=True,
             )
-        elif elapsed_ms > self.warn_threshold_ms:
+        elif slow:
             self.log.warning(
                 "Slow operation '%s' completed in %.1f ms",
                 self.operation,
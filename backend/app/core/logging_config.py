@@ -1,51 +1,53 @@
 import logging
 import logging.handlers
+import os
 from pathlib import Path
 
 LOGS_DIR = Path("logs")
 
 
+def _file_logging_enabled() -> bool:
+    return os.getenv("LOG_FILE_ENABLED", "true").lower() in ("true", "1", "yes")
+
+
 def setup_logging():
-    LOGS_DIR.mkdir(exist_ok=True)
+    # Same LOG_LEVEL variable Settings reads; records below it are never built.
+    level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
     LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
     DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
+    console_handler.setLevel(level)
     console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
 
-    file_handler = logging.handlers.RotatingFileHandler(
-        filename=LOGS_DIR / "blockscope.log",
-        maxBytes=5 * 1024 * 1024,
-        backupCount=5,
-        encoding="utf-8",
-    )
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-
-    error_handler = logging.handlers.RotatingFileHandler(
-        filename=LOGS_DIR / "errors.log",
-        maxBytes=5 * 1024 * 1024,
-        backupCount=5,
-        encoding="utf-8",
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
-
-    existing_files = [
-        h.baseFilename
-        for h in root_logger.handlers
-        if isinstance(h, logging.handlers.RotatingFileHandler)
-    ]
-
-    if str(LOGS_DIR / "blockscope.log") not in existing_files:
-        root_logger.addHandler(file_handler)
-
-    if str(LOGS_DIR / "errors.log") not in existing_files:
-        root_logger.addHandler(error_handler)
+    root_logger.setLevel(level)
+
+    # Only touch the filesystem (mkdir, open) when file logging is on, and
+    # only open a log file that is not already attached.
+    if _file_logging_enabled():
+        LOGS_DIR.mkdir(exist_ok=True)
+        existing_files = {
+            h.baseFilename
+            for h in root_logger.handlers
+            if isinstance(h, logging.handlers.RotatingFileHandler)
+        }
+        for filename, file_level in (
+            ("blockscope.log", logging.INFO),
+            ("errors.log", logging.ERROR),
+        ):
+            path = LOGS_DIR / filename
+            if os.path.abspath(path) in existing_files:
+                continue
+            file_handler = logging.handlers.RotatingFileHandler(
+                filename=path,
+                maxBytes=5 * 1024 * 1024,
+                backupCount=5,
+                encoding="utf-8",
+            )
+            file_handler.setLevel(file_level)
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+            root_logger.addHandler(file_handler)
 
     if not any(
         isinstance(h, logging.StreamHandler)
@@ -5,23 +5,36 @@ Implements sliding window rate limiting backed by Redis, with automatic
 in-memory fallback when Redis is unreachable.
 
 Architecture:
-    - Primary: Redis sorted-set based sliding window (accurate, distributed)
+    - Primary: Redis sliding-window counter (constant memory, distributed),
+      or sorted-set sliding window for exact rolling counts
     - Fallback: Simple in-memory counter (per-IP, per-minute only)
     - Auto-recovery: Switches back to Redis once connectivity is restored
 """
 
 import collections
+import hashlib
+import itertools
 import logging
 import time
 import threading
-from typing import Callable, Optional
+import uuid
+from pathlib import Path
+from typing import List, Optional
 
 import redis.asyncio as aioredis
+from redis.exceptions import NoScriptError
 from app.core.config import settings
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 429s are sent exactly when the server is under pressure; encode them with orjson
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as _RejectionResponse
+except ImportError:  # pragma: no cover - orjson is a pinned dependency
+    _RejectionResponse = JSONResponse
 
 logger = logging.getLogger("blockscope.ratelimit")
 
@@ -58,6 +71,8 @@ class RateLimitRedis:
                     socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
                     socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
                 )
+            if redis_manager.is_available:
+                await load_scripts(redis_manager.redis)
         except Exception as exc:
             logger.warning("RateLimitRedis.connect() failed: %s", exc)
 
@@ -185,15 +200,86 @@ _fallback_limiter = _InMemoryRateLimiter()
 # ==================== Rate Limiting Logic ====================
 
 
+_STRATEGY_COUNTER = "counter"
+_STRATEGY_ZSET = "zset"
+_STRATEGIES = frozenset({_STRATEGY_COUNTER, _STRATEGY_ZSET})
+
+_WINDOW_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
+
+# Sorted-set members only need to be unique; the score carries the time.
+# The random prefix keeps workers sharing one Redis from colliding.
+_MEMBER_PREFIX = uuid.uuid4().hex[:12]
+_MEMBER_SEQUENCE = itertools.count()
+
+
+class _LuaScript:
+    """
+    Server-side script invoked by SHA1.
+
+    The SHA is computed locally, so the common path is a single
+    ``EVALSHA``; the source is only sent again after Redis answers
+    ``NOSCRIPT`` (e.g. following a restart or ``SCRIPT FLUSH``).
+    """
+
+    def __init__(self, filename: str):
+        self.source = (Path(__file__).parent / filename).read_text(encoding="utf-8")
+        self.sha = hashlib.sha1(self.source.encode("utf-8")).hexdigest()
+
+    async def load(self, redis_client: aioredis.Redis) -> None:
+        """Register the script with Redis (``SCRIPT LOAD``)."""
+        self.sha = await redis_client.script_load(self.source)
+
+    async def __call__(self, redis_client: aioredis.Redis, keys: List[str], args: list) -> list:
+        try:
+            return await redis_client.evalsha(self.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            await self.load(redis_client)
+            return await redis_client.evalsha(self.sha, len(keys), *keys, *args)
+
+
+_COUNTER_SCRIPT = _LuaScript("rate_limit_counter.lua")
+_ZSET_SCRIPT = _LuaScript("rate_limit_zset.lua")
+
+
+async def load_scripts(redis_client: aioredis.Redis) -> None:
+    """
+    Preload the rate-limit scripts so the first request skips ``NOSCRIPT``.
+
+    Args:
+        redis_client: Connected Redis client
+    """
+    for script in (_COUNTER_SCRIPT, _ZSET_SCRIPT):
+        await script.load(redis_client)
+
+
 class RateLimiter:
     """
     Sliding window rate limiter using Redis.
-    Implements token bucket algorithm with Redis sorted sets.
+
+    Two strategies are available:
+
+    - ``"counter"`` (default): sliding-window counter. Each window keeps
+      one integer per fixed bucket and the previous bucket is weighted by
+      how much of it still overlaps the window. Constant memory per
+      identifier.
+    - ``"zset"``: one sorted-set member per request. Exact rolling
+      counts, at the cost of memory proportional to the limit.
+
+    Both run as Lua scripts (``rate_limit_counter.lua`` and
+    ``rate_limit_zset.lua``), so each decision is one atomic round-trip.
     """
 
-    def __init__(self, redis_client: Optional[aioredis.Redis] = None, prefix: str = "ratelimit"):
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        prefix: str = "ratelimit",
+        strategy: str = _STRATEGY_COUNTER,
+    ):
+        if strategy not in _STRATEGIES:
+            raise ValueError(f"Unknown rate limit strategy: {strategy!r}")
         self._redis = redis_client
         self.prefix = prefix
+        self.strategy = strategy
 
     def _get_redis(self) -> Optional[aioredis.Redis]:
         """
@@ -233,13 +319,29 @@ class RateLimiter:
         """
         return f"{self.prefix}:{identifier}:{window}"
 
+    def _get_bucket_key(self, identifier: str, window: str, bucket: int) -> str:
+        """
+        Generate Redis key for one fixed bucket of the counter strategy.
+
+        Args:
+            identifier: Unique identifier (IP, API key, user ID)
+            window: Time window (minute, hour, day)
+            bucket: Bucket index, ``floor(now / window_seconds)``
+
+        Returns:
+            str: Redis key
+        """
+        return f"{self.prefix}:{identifier}:{window}:{bucket}"
+
     async def is_rate_limited(
         self, identifier: str, limits: dict, burst_allowance: int = 0
     ) -> tuple[bool, dict]:
         """
         Check if request should be rate limited.
 
-        Falls back to in-memory limiting when Redis is unreachable.
+        The check and the record happen atomically inside Redis in one
+        ``EVALSHA`` round-trip. Falls back to in-memory limiting when
+        Redis is unreachable.
 
         Args:
             identifier: Unique identifier
@@ -258,81 +360,21 @@ class RateLimiter:
 
         # ── Primary: Redis-based sliding window ──
         current_time = time.time()
-
-        # Check each window
-        windows = {
-            "minute": (60, limits.get("per_minute", 0)),
-            "hour": (3600, limits.get("per_hour", 0)),
-            "day": (86400, limits.get("per_day", 0)),
-        }
-
-        limit_info = {
-            "limited": False,
-            "retry_after": 0,
-            "limit": 0,
-            "remaining": 0,
-            "reset": 0,
-            "window": "",
-        }
+        args = [current_time] + [limits.get(f"per_{name}", 0) for name in _WINDOW_SECONDS]
+        args.append(burst_allowance)
 
         try:
-            for window_name, (window_seconds, limit) in windows.items():
-                if limit == 0:  # Skip if limit not set
-                    continue
-
-                key = self._get_key(identifier, window_name)
-
-                # Remove old requests outside window
-                cutoff_time = current_time - window_seconds
-                await redis_client.zremrangebyscore(key, "-inf", cutoff_time)
-
-                # Count requests in current window
-                count = await redis_client.zcard(key)
-
-                # Check if limit exceeded (with burst allowance)
-                effective_limit = limit + burst_allowance
-
-                if count >= effective_limit:
-                    # Rate limited!
-                    oldest = await redis_client.zrange(key, 0, 0, withscores=True)
-                    if oldest:
-                        oldest_time = oldest[0][1]
-                        retry_after = int(oldest_time + window_seconds - current_time)
-
-                        limit_info.update(
-                            {
-                                "limited": True,
-                                "retry_after": max(1, retry_after),
-                                "limit": limit,
-                                "remaining": 0,
-                                "reset": int(oldest_time + window_seconds),
-                                "window": window_name,
-                            }
-                        )
-
-                        return True, limit_info
-
-                # Update limit info for headers
-                if window_name == "minute":  # Use minute window for headers
-                    limit_info.update(
-                        {
-                            "limit": limit,
-                            "remaining": max(0, limit - count),
-                            "reset": int(current_time + window_seconds),
-                        }
-                    )
-
-            # Not rate limited - record this request
-            request_id = f"{current_time}:{id(identifier)}"
-
-            # Add to all relevant windows
-            for window_name, (window_seconds, limit) in windows.items():
-                if limit > 0:
-                    key = self._get_key(identifier, window_name)
-                    await redis_client.zadd(key, {request_id: current_time})
-                    await redis_client.expire(key, window_seconds + 60)  # Extra buffer
-
-            return False, limit_info
+            if self.strategy == _STRATEGY_ZSET:
+                keys = [self._get_key(identifier, name) for name in _WINDOW_SECONDS]
+                args.append(f"{_MEMBER_PREFIX}:{next(_MEMBER_SEQUENCE)}")
+                result = await _ZSET_SCRIPT(redis_client, keys, args)
+            else:
+                keys = []
+                for window_name, window_seconds in _WINDOW_SECONDS.items():
+                    bucket = int(current_time // window_seconds)
+                    keys.append(self._get_bucket_key(identifier, window_name, bucket))
+                    keys.append(self._get_bucket_key(identifier, window_name, bucket - 1))
+                result = await _COUNTER_SCRIPT(redis_client, keys, args)
 
         except Exception as exc:
             # Redis error — mark unavailable and fall back to in-memory
@@ -345,6 +387,42 @@ class RateLimiter:
             per_min = limits.get("per_minute", 60)
             return _fallback_limiter.is_rate_limited(identifier, per_min)
 
+        limit_info = {
+            "limited": False,
+            "retry_after": 0,
+            "limit": 0,
+            "remaining": 0,
+            "reset": 0,
+            "window": "",
+        }
+
+        if result[0]:
+            # Rate limited!
+            window_name = list(_WINDOW_SECONDS)[int(result[1]) - 1]
+            limit_info.update(
+                {
+                    "limited": True,
+                    "retry_after": int(result[2]),
+                    "limit": limits[f"per_{window_name}"],
+                    "remaining": 0,
+                    "reset": int(result[3]),
+                    "window": window_name,
+                }
+            )
+            return True, limit_info
+
+        # Use minute window for headers
+        if limits.get("per_minute", 0) > 0:
+            limit_info.update(
+                {
+                    "limit": limits["per_minute"],
+                    "remaining": int(result[1]),
+                    "reset": int(result[2]),
+                }
+            )
+
+        return False, limit_info
+
     async def get_usage(self, identifier: str) -> dict:
         """
         Get current usage for an identifier.
@@ -360,16 +438,27 @@ class RateLimiter:
             return {"minute": 0, "hour": 0, "day": 0, "source": "unavailable"}
 
         current_time = time.time()
-        usage = {}
-        windows = {"minute": 60, "hour": 3600, "day": 86400}
 
         try:
-            for window_name, window_seconds in windows.items():
-                key = self._get_key(identifier, window_name)
-                cutoff_time = current_time - window_seconds
-                await redis_client.zremrangebyscore(key, "-inf", cutoff_time)
-                count = await redis_client.zcard(key)
-                usage[window_name] = count
+            pipe = redis_client.pipeline(transaction=False)
+            if self.strategy == _STRATEGY_ZSET:
+                for window_name, window_seconds in _WINDOW_SECONDS.items():
+                    key = self._get_key(identifier, window_name)
+                    pipe.zremrangebyscore(key, "-inf", current_time - window_seconds)
+                    pipe.zcard(key)
+                counts = (await pipe.execute())[1::2]
+            else:
+                for window_name, window_seconds in _WINDOW_SECONDS.items():
+                    bucket = int(current_time // window_seconds)
+                    pipe.get(self._get_bucket_key(identifier, window_name, bucket))
+                    pipe.get(self._get_bucket_key(identifier, window_name, bucket - 1))
+                results = await pipe.execute()
+                counts = []
+                for index, window_seconds in enumerate(_WINDOW_SECONDS.values()):
+                    weight = (window_seconds - current_time % window_seconds) / window_seconds
+                    current, previous = results[index * 2], results[index * 2 + 1]
+                    counts.append(round(int(previous or 0) * weight + int(current or 0)))
+            usage = dict(zip(_WINDOW_SECONDS, counts))
         except Exception:
             return {"minute": 0, "hour": 0, "day": 0, "source": "error"}
 
@@ -389,11 +478,15 @@ class RateLimiter:
         if redis_client is None:
             return False
 
-        windows = ["minute", "hour", "day"]
+        current_time = time.time()
+        keys = []
+        for window_name, window_seconds in _WINDOW_SECONDS.items():
+            bucket = int(current_time // window_seconds)
+            keys.append(self._get_key(identifier, window_name))
+            keys.append(self._get_bucket_key(identifier, window_name, bucket))
+            keys.append(self._get_bucket_key(identifier, window_name, bucket - 1))
         try:
-            for window in windows:
-                key = self._get_key(identifier, window)
-                await redis_client.delete(key)
+            await redis_client.delete(*keys)
         except Exception:
             return False
 
@@ -402,99 +495,129 @@ class RateLimiter:
 
 # ==================== Middleware ====================
 
+# Paths never rate limited (health checks, metrics, API docs)
+SKIP_PATHS: frozenset = frozenset({"/health", "/metrics", "/docs", "/redoc", "/openapi.json"})
+
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
-    FastAPI middleware for rate limiting.
+    ASGI middleware for rate limiting.
     Checks rate limits before processing requests.
+
+    Implemented as a pure ASGI callable: allowed requests are passed
+    straight through with the rate-limit headers appended to the
+    ``http.response.start`` message, and rejected ones are answered
+    with 429 without reaching the application.
     """
 
-    def __init__(self, app: ASGIApp, redis_client: Optional[aioredis.Redis] = None, enabled: bool = True):
-        super().__init__(app)
-        self.limiter = RateLimiter(redis_client)
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis_client: Optional[aioredis.Redis] = None,
+        enabled: bool = True,
+        strategy: str = _STRATEGY_COUNTER,
+    ):
+        self.app = app
+        self.limiter = RateLimiter(redis_client, strategy=strategy)
         self.enabled = enabled and settings.RATE_LIMIT_ENABLED
 
-    def _get_identifier(self, request: Request) -> str:
+        # Settings read on every request, resolved once
+        self._api_key_header = settings.API_KEY_HEADER_NAME.lower().encode("latin-1")
+        self._burst_allowance = settings.RATE_LIMIT_BURST
+        self._api_key_limits = {
+            "per_minute": settings.API_KEY_RATE_LIMIT_PER_MINUTE,
+            "per_hour": settings.API_KEY_RATE_LIMIT_PER_HOUR,
+            "per_day": settings.API_KEY_RATE_LIMIT_PER_DAY,
+        }
+        self._anonymous_limits = {
+            "per_minute": settings.RATE_LIMIT_PER_MINUTE,
+            "per_hour": settings.RATE_LIMIT_PER_HOUR,
+            "per_day": settings.RATE_LIMIT_PER_DAY,
+        }
+
+    def _get_identifier(
+        self, scope: Scope, api_key: Optional[bytes], forwarded_for: Optional[bytes]
+    ) -> str:
         """
         Get unique identifier for rate limiting.
         Prioritizes: API key > User ID > IP address
 
         Args:
-            request: FastAPI request
+            scope: ASGI connection scope
+            api_key: Raw API key header value, if sent
+            forwarded_for: Raw ``X-Forwarded-For`` header value, if sent
 
         Returns:
             str: Unique identifier
         """
         # Check for API key in header
-        api_key = request.headers.get(settings.API_KEY_HEADER_NAME)
         if api_key:
-            return f"apikey:{api_key[:16]}"  # Use prefix for identification
+            # Use prefix for identification
+            return f"apikey:{api_key[:16].decode('latin-1')}"
 
         # Check for authenticated user (if using session/JWT)
-        if hasattr(request.state, "user_id"):
-            return f"user:{request.state.user_id}"
+        state = scope.get("state") or {}
+        if "user_id" in state:
+            return f"user:{state['user_id']}"
 
         # Fall back to IP address
         # Check for proxy headers
-        forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
-            ip = forwarded_for.split(",")[0].strip()
+            ip = forwarded_for.decode("latin-1").split(",")[0].strip()
         else:
-            ip = request.client.host if request.client else "unknown"
+            client = scope.get("client")
+            ip = client[0] if client else "unknown"
 
         return f"ip:{ip}"
 
-    def _get_limits(self, request: Request) -> dict:
+    def _get_limits(self, api_key: Optional[bytes]) -> dict:
         """
         Get rate limits for request.
 
         Args:
-            request: FastAPI request
+            api_key: Raw API key header value, if sent
 
         Returns:
-            dict: Rate limits
+            dict: Rate limits (shared, do not mutate)
         """
-        # Check if API key is present (higher limits)
-        if request.headers.get(settings.API_KEY_HEADER_NAME):
-            return {
-                "per_minute": settings.API_KEY_RATE_LIMIT_PER_MINUTE,
-                "per_hour": settings.API_KEY_RATE_LIMIT_PER_HOUR,
-                "per_day": settings.API_KEY_RATE_LIMIT_PER_DAY,
-            }
-
-        # Default limits (unauthenticated)
-        return {
-            "per_minute": settings.RATE_LIMIT_PER_MINUTE,
-            "per_hour": settings.RATE_LIMIT_PER_HOUR,
-            "per_day": settings.RATE_LIMIT_PER_DAY,
-        }
+        # API key holders get higher limits
+        return self._api_key_limits if api_key else self._anonymous_limits
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request through rate limiting.
 
         Args:
-            request: FastAPI request
-            call_next: Next middleware/endpoint
-
-        Returns:
-            Response: HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Skip if disabled
-        if not self.enabled:
-            return await call_next(request)
+        # Skip if disabled or not an HTTP request
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip for health checks and metrics
-        if request.url.path in ["/health", "/metrics", "/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
+        if scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # One pass over the raw headers for everything the limiter needs
+        api_key = forwarded_for = None
+        for name, value in scope["headers"]:
+            if name == self._api_key_header:
+                if api_key is None:
+                    api_key = value
+            elif name == b"x-forwarded-for" and forwarded_for is None:
+                forwarded_for = value
 
         # Get identifier and limits
-        identifier = self._get_identifier(request)
-        limits = self._get_limits(request)
+        identifier = self._get_identifier(scope, api_key, forwarded_for)
+        limits = self._get_limits(api_key)
 
         # Check rate limit
         is_limited, limit_info = await self.limiter.is_rate_limited(
-            identifier, limits, burst_allowance=settings.RATE_LIMIT_BURST
+            identifier, limits, burst_allowance=self._burst_allowance
         )
 
         # Add rate limit headers
@@ -508,7 +631,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             # Return 429 Too Many Requests
             response_headers["Retry-After"] = str(limit_info["retry_after"])
 
-            return JSONResponse(
+            response = _RejectionResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "rate_limit_exceeded",
@@ -519,15 +642,17 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 },
                 headers=response_headers,
             )
+            await response(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        for header, value in response_headers.items():
-            response.headers[header] = value
+        async def send_with_headers(message: Message) -> None:
+            # Add rate limit headers to response
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(response_headers)
+            await send(message)
 
-        return response
+        # Process request
+        await self.app(scope, receive, send_with_headers)
 
 
 # ==================== Decorator for Route-Specific Limits ====================
@@ -0,0 +1,46 @@
+-- Sliding-window counter: weight the previous bucket, then count the request.
+--
+-- KEYS: current and previous bucket keys per window, in the order
+--       minute_current, minute_previous, hour_current, hour_previous,
+--       day_current, day_previous
+-- ARGV: now, per_minute, per_hour, per_day, burst
+--
+-- A limit of 0 disables that window. Returns
+-- {1, window_index, retry_after, reset} when limited, otherwise
+-- {0, remaining_minute, reset_minute}.
+
+local now = tonumber(ARGV[1])
+local burst = tonumber(ARGV[5])
+local windows = {60, 3600, 86400}
+local active = {}
+local remaining, reset = 0, 0
+
+for i = 1, 3 do
+    local limit = tonumber(ARGV[i + 1])
+    if limit > 0 then
+        local seconds = windows[i]
+        local elapsed = now % seconds
+        local current = tonumber(redis.call('GET', KEYS[2 * i - 1]) or '0')
+        local previous = tonumber(redis.call('GET', KEYS[2 * i]) or '0')
+        local estimated = previous * (seconds - elapsed) / seconds + current + 1
+        local bucket_end = math.floor(now - elapsed + seconds)
+        if estimated > limit + burst then
+            return {1, i, math.max(1, bucket_end - math.floor(now)), bucket_end}
+        end
+        if i == 1 then
+            remaining = math.max(0, math.floor(limit - estimated))
+            reset = bucket_end
+        end
+        active[#active + 1] = i
+    end
+end
+
+-- A bucket lives for exactly two windows from its creation, so the TTL
+-- is only set when INCR creates it.
+for _, i in ipairs(active) do
+    if redis.call('INCR', KEYS[2 * i - 1]) == 1 then
+        redis.call('EXPIRE', KEYS[2 * i - 1], windows[i] * 2)
+    end
+end
+
+return {0, remaining, reset}
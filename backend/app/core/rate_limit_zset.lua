@@ -0,0 +1,41 @@
+-- Sorted-set sliding window: check every window, then record the request.
+--
+-- KEYS: minute, hour and day sorted-set keys
+-- ARGV: now, per_minute, per_hour, per_day, burst, member
+--
+-- A limit of 0 disables that window. Returns
+-- {1, window_index, retry_after, reset} when limited, otherwise
+-- {0, remaining_minute, reset_minute}.
+
+local now = tonumber(ARGV[1])
+local burst = tonumber(ARGV[5])
+local windows = {60, 3600, 86400}
+local counts = {}
+
+for i = 1, 3 do
+    local limit = tonumber(ARGV[i + 1])
+    if limit > 0 then
+        local seconds = windows[i]
+        redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', now - seconds)
+        local count = redis.call('ZCARD', KEYS[i])
+        if count >= limit + burst then
+            local oldest = tonumber(redis.call('ZRANGE', KEYS[i], 0, 0, 'WITHSCORES')[2])
+            return {1, i, math.max(1, math.floor(oldest + seconds - now)), math.floor(oldest + seconds)}
+        end
+        counts[i] = count
+    end
+end
+
+-- The TTL is refreshed on every hit: the set must outlive its newest
+-- member, so EXPIRE ... NX would drop recent requests with the key.
+for i = 1, 3 do
+    if counts[i] then
+        redis.call('ZADD', KEYS[i], ARGV[1], ARGV[6])
+        redis.call('EXPIRE', KEYS[i], windows[i] + 60)
+    end
+end
+
+if counts[1] then
+    return {0, math.max(0, tonumber(ARGV[2]) - counts[1]), math.floor(now + 60)}
+end
+return {0, 0, 0}
@@ -27,22 +27,62 @@ import time
 from typing import Optional
 
 import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 logger = logging.getLogger("blockscope.redis")
 
 
+class _BlockingConnectionPool(aioredis.BlockingConnectionPool):
+    """
+    ``BlockingConnectionPool`` that connects outside the pool's condition.
+
+    redis-py 5.0.1 opens the socket while holding the condition and hands
+    a failed connection back through ``release()``, which waits on that
+    same condition.  An unreachable server then stalls every caller for
+    the full pool ``timeout`` and reports "No connection available"
+    instead of the real error.  Only the checkout is done under the
+    condition here.
+    """
+
+    async def _checkout(self):
+        async with self._condition:
+            await self._condition.wait_for(self.can_get_connection)
+            try:
+                connection = self._available_connections.pop()
+            except IndexError:
+                connection = self.make_connection()
+            self._in_use_connections.add(connection)
+            return connection
+
+    async def get_connection(self, command_name, *keys, **options):
+        """Get a connection from the pool, blocking until one is available."""
+        try:
+            connection = await asyncio.wait_for(self._checkout(), self.timeout)
+        except asyncio.TimeoutError as err:
+            raise RedisConnectionError("No connection available.") from err
+
+        try:
+            await self.ensure_connection(connection)
+        except BaseException:
+            await self.release(connection)
+            raise
+        return connection
+
+
 class RedisManager:
     """
     Async Redis connection manager with health tracking.
 
     Features:
-        - Single shared connection pool (module-level instance)
+        - Single shared, bounded connection pool (module-level instance);
+          callers wait for a free connection instead of opening new ones
         - ``is_available`` flag for graceful degradation
         - ``mark_unavailable()`` for consumers to report errors
         - ``connection_status`` property for health endpoints
     """
 
     def __init__(self) -> None:
+        self._pool: Optional[_BlockingConnectionPool] = None
         self._redis: Optional[aioredis.Redis] = None
         self._available: bool = False
         self._last_error: Optional[str] = None
@@ -57,13 +97,18 @@ class RedisManager:
         self,
         url: str = "redis://localhost:6379/0",
         password: Optional[str] = None,
-        max_connections: int = 50,
+        max_connections: int = 10,
         socket_timeout: int = 5,
         socket_connect_timeout: int = 5,
     ) -> bool:
         """
         Establish the Redis connection pool.
 
+        The pool is a ``BlockingConnectionPool``: once ``max_connections``
+        are checked out, further callers wait up to ``socket_timeout``
+        seconds for one to be released rather than opening more sockets
+        and hitting the server's client limit.
+
         Returns:
             ``True`` if the connection succeeded and PING was answered.
         """
@@ -71,14 +116,16 @@ class RedisManager:
             return self._available
 
         try:
-            self._redis = aioredis.from_url(
+            self._pool = _BlockingConnectionPool.from_url(
                 url,
                 password=password,
                 max_connections=max_connections,
+                timeout=socket_timeout,
                 socket_timeout=socket_timeout,
                 socket_connect_timeout=socket_connect_timeout,
                 decode_responses=True,
             )
+            self._redis = aioredis.Redis(connection_pool=self._pool)
             # Verify connectivity
             await self._redis.ping()
             self._available = True
@@ -99,10 +146,13 @@ class RedisManager:
         if self._redis is not None:
             try:
                 await self._redis.close()
+                if self._pool is not None:
+                    await self._pool.disconnect()
                 logger.info("Redis disconnected")
             except Exception:
                 pass
             finally:
+                self._pool = None
                 self._redis = None
                 self._available = False
                 self._connect_time = None
@@ -3,49 +3,136 @@ BlockScope Security Middleware
 Implements security headers, file validation, XSS protection, and more
 """
 
+import logging
 import re
+import time
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import List, Optional
 
 from app.core.config import settings
-from fastapi import Request, Response, UploadFile
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import UploadFile
+from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_request_logger = logging.getLogger("blockscope.requests")
+
+# ==================== Precompiled Patterns ====================
+
+# Characters never allowed in an uploaded filename
+_ILLEGAL_FILENAME_CHARS_RE = re.compile(r'[<>:"|?*]')
+
+# Suspicious content checks, fused into one alternation so the upload prefix
+# is scanned once.  Group name → original pattern (reported on a match).
+_SUSPICIOUS_CONTENT_PATTERNS = {
+    "script": r"<script[^>]*>",  # JavaScript
+    "eval": r"eval\s*\(",  # Eval calls
+    "exec": r"exec\s*\(",  # Exec calls
+    "jquery": r"\$\(.*\)",  # jQuery
+}
+_SUSPICIOUS_CONTENT_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _SUSPICIOUS_CONTENT_PATTERNS.items()),
+    re.IGNORECASE,
+)
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w\s.-]")
+_DOT_RUN_RE = re.compile(r"\.+")
+_SQL_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+# str.translate table deleting C0 control characters (incl. NUL) except tab and newline
+_CONTROL_CHAR_TABLE = {code: None for code in range(32) if chr(code) not in "\n\t"}
+
+# ==================== ASGI Helpers ====================
+
+
+def _find_headers(scope: Scope, names: tuple) -> dict:
+    """
+    Look up raw request headers straight from an ASGI scope.
+
+    Walks ``scope["headers"]`` once and stops as soon as every name has
+    been seen, without building a ``Headers`` mapping.
+
+    Args:
+        scope: ASGI HTTP connection scope
+        names: Lower-case header names as bytes
+
+    Returns:
+        dict: First value found for each name (missing names are absent)
+    """
+    found = {}
+    for name, value in scope["headers"]:
+        if name in names and name not in found:
+            found[name] = value
+            if len(found) == len(names):
+                break
+    return found
+
 
 # ==================== Security Headers Middleware ====================
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Add security headers to all responses.
     Implements OWASP security best practices.
+
+    Pure ASGI middleware: headers are added to the ``http.response.start``
+    message on its way out, without wrapping the request in a task.  None
+    of the values depend on the request beyond the docs/non-docs CSP and
+    HTTPS-only HSTS, so every variant is encoded once in ``__init__``.
     """
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Add security headers to response"""
-        response = await call_next(request)
+        self.app = app
+
+        common = [
+            # Prevent clickjacking attacks
+            ("X-Frame-Options", "DENY"),
+            # Prevent MIME type sniffing
+            ("X-Content-Type-Options", "nosniff"),
+            # Enable XSS protection in older browsers
+            ("X-XSS-Protection", "1; mode=block"),
+            # Referrer policy
+            ("Referrer-Policy", "strict-origin-when-cross-origin"),
+            # Permissions Policy (formerly Feature Policy)
+            ("Permissions-Policy", "geolocation=(), microphone=(), camera=()"),
+        ]
+        self._headers = self._encode(
+            common + [("Content-Security-Policy", self._content_security_policy(docs=False))]
+        )
+        self._docs_headers = self._encode(
+            common + [("Content-Security-Policy", self._content_security_policy(docs=True))]
+        )
 
-        docs_request = request.url.path.startswith("/docs") or request.url.path.startswith("/redoc")
+        # Strict Transport Security (HTTPS only)
+        self._hsts_header = self._encode(
+            [("Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload")]
+        )
 
-        # Prevent clickjacking attacks
-        response.headers["X-Frame-Options"] = "DENY"
+        # Headers replaced by ours, plus server information (removed)
+        self._replaced = frozenset(name for name, _ in self._headers) | {b"server"}
+        self._replaced_https = self._replaced | {name for name, _ in self._hsts_header}
 
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
+    @staticmethod
+    def _encode(headers: List[tuple]) -> List[tuple]:
+        """Encode ``(name, value)`` pairs as raw ASGI header tuples."""
+        return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
 
-        # Enable XSS protection in older browsers
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+    @staticmethod
+    def _content_security_policy(docs: bool) -> str:
+        """
+        Build the Content Security Policy.
 
-        # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        Args:
+            docs: Whether the policy is for the Swagger/ReDoc pages, which
+                load their assets from the jsDelivr CDN
 
-        # Content Security Policy
+        Returns:
+            str: ``Content-Security-Policy`` header value
+        """
         csp_directives = ["default-src 'self'"]
-        if docs_request:
+        if docs:
             csp_directives.extend(
                 [
                     "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net",
@@ -72,22 +159,69 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 "form-action 'self'",
             ]
         )
-        response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
+        return "; ".join(csp_directives)
 
-        # Strict Transport Security (HTTPS only)
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains; preload"
-            )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to response"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path.startswith("/docs") or path.startswith("/redoc"):
+            added = self._docs_headers
+        else:
+            added = self._headers
+        if scope.get("scheme") == "https":
+            added = added + self._hsts_header
+            replaced = self._replaced_https
+        else:
+            replaced = self._replaced
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    header for header in message.get("headers", ()) if header[0] not in replaced
+                ] + added
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
-        # Permissions Policy (formerly Feature Policy)
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
 
-        # Remove server information
-        if "Server" in response.headers:
-            del response.headers["Server"]
+# ==================== Request Size Limit Middleware ====================
 
-        return response
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject requests whose declared ``Content-Length`` exceeds a byte budget.
+
+    Runs before routing, so an oversized multipart upload is refused with
+    413 before Starlette parses or spools any of it.  Chunked requests
+    without a ``Content-Length`` fall through to the per-route limits.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int = settings.MAX_UPLOAD_SIZE):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Short-circuit oversized requests with 413"""
+        if scope["type"] == "http":
+            content_length = _find_headers(scope, (b"content-length",)).get(b"content-length")
+            if (
+                content_length
+                and content_length.isdigit()
+                and int(content_length) > self.max_body_size
+            ):
+                max_mb = self.max_body_size / (1024 * 1024)
+                response = JSONResponse(
+                    status_code=413,
+                    content={"detail": f"Request body too large (max {max_mb:.1f}MB)"},
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
 
 
 # ==================== File Validation ====================
@@ -104,6 +238,9 @@ class FileValidator:
     ):
         self.max_size = max_size
         self.allowed_extensions = allowed_extensions or settings.ALLOWED_EXTENSIONS
+        self._allowed_extension_set = (
+            frozenset(allowed_extensions) if allowed_extensions else settings.allowed_extensions_set
+        )
 
     def validate_filename(self, filename: str) -> tuple[bool, Optional[str]]:
         """
@@ -128,12 +265,12 @@ class FileValidator:
             return False, "Invalid filename: null byte detected"
 
         # Check for suspicious characters
-        if re.search(r'[<>:"|?*]', filename):
+        if _ILLEGAL_FILENAME_CHARS_RE.search(filename):
             return False, "Invalid filename: contains illegal characters"
 
         # Check extension
         ext = Path(filename).suffix.lower()
-        if ext not in self.allowed_extensions:
+        if ext not in self._allowed_extension_set:
             return False, f"Invalid file type. Allowed: {', '.join(self.allowed_extensions)}"
 
         return True, None
@@ -179,49 +316,47 @@ class FileValidator:
 
         return True, None
 
-    async def validate_content(self, file: UploadFile) -> tuple[bool, Optional[str]]:
+    async def validate_content(self, file: UploadFile) -> tuple[bool, Optional[str], bytes]:
         """
         Validate file content for malicious code.
 
+        Only the first 8 KB are inspected.  The file is left positioned
+        after that prefix, which is returned so the caller can continue
+        reading from there instead of seeking back and reading it twice.
+
         Args:
             file: Uploaded file
 
         Returns:
-            tuple: (is_valid, error_message)
+            tuple: (is_valid, error_message, prefix)
         """
+        content = b""
         try:
             # Read first chunk to check content
             content = await file.read(8192)  # Read first 8KB
-            await file.seek(0)  # Reset file pointer
 
             # Check for null bytes (binary file)
             if b"\x00" in content:
-                return False, "Invalid file: appears to be binary"
+                return False, "Invalid file: appears to be binary", content
 
             # Try to decode as text
             try:
                 text = content.decode("utf-8")
             except UnicodeDecodeError:
-                return False, "Invalid file encoding: not valid UTF-8 text"
-
-            # Check for suspicious patterns (basic check)
-            suspicious_patterns = [
-                r"<script[^>]*>",  # JavaScript
-                r"eval\s*\(",  # Eval calls
-                r"exec\s*\(",  # Exec calls
-                r"\$\(.*\)",  # jQuery
-            ]
+                return False, "Invalid file encoding: not valid UTF-8 text", content
 
-            for pattern in suspicious_patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return False, f"Suspicious content detected: {pattern}"
+            # Check for suspicious patterns (basic check, single pass)
+            match = _SUSPICIOUS_CONTENT_RE.search(text)
+            if match is not None:
+                pattern = _SUSPICIOUS_CONTENT_PATTERNS[match.lastgroup]
+                return False, f"Suspicious content detected: {pattern}", content
 
-            return True, None
+            return True, None, content
 
         except Exception as e:
-            return False, f"Error validating content: {str(e)}"
+            return False, f"Error validating content: {str(e)}", content
 
-    async def validate_file(self, file: UploadFile) -> tuple[bool, Optional[str]]:
+    async def validate_file(self, file: UploadFile) -> tuple[bool, Optional[str], bytes]:
         """
         Perform all validations on uploaded file.
 
@@ -229,29 +364,27 @@ class FileValidator:
             file: Uploaded file
 
         Returns:
-            tuple: (is_valid, error_message)
+            tuple: (is_valid, error_message, prefix) where ``prefix`` holds
+            the bytes already consumed from ``file`` (see
+            :meth:`validate_content`); prepend it to the rest of the read.
         """
         # Validate filename
         is_valid, error = self.validate_filename(file.filename)
         if not is_valid:
-            return False, error
+            return False, error, b""
 
         # Validate size
         is_valid, error = self.validate_size(file)
         if not is_valid:
-            return False, error
+            return False, error, b""
 
         # Validate MIME type
         is_valid, error = self.validate_mime_type(file)
         if not is_valid:
-            return False, error
+            return False, error, b""
 
         # Validate content
-        is_valid, error = await self.validate_content(file)
-        if not is_valid:
-            return False, error
-
-        return True, None
+        return await self.validate_content(file)
 
 
 # ==================== Input Sanitization ====================
@@ -284,11 +417,8 @@ class InputSanitizer:
         if max_length and len(text) > max_length:
             text = text[:max_length]
 
-        # Remove null bytes
-        text = text.replace("\x00", "")
-
-        # Remove control characters except newline and tab
-        text = "".join(char for char in text if ord(char) >= 32 or char in "\n\t")
+        # Remove null bytes and other control characters except newline and tab
+        text = text.translate(_CONTROL_CHAR_TABLE)
 
         return text
 
@@ -304,7 +434,7 @@ class InputSanitizer:
             str: Sanitized text without HTML
         """
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        text = _HTML_TAG_RE.sub("", text)
 
         # Escape special characters
         replacements = {"<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;", "/": "&#x2F;"}
@@ -329,10 +459,10 @@ class InputSanitizer:
         filename = Path(filename).name
 
         # Remove dangerous characters
-        filename = re.sub(r"[^\w\s.-]", "", filename)
+        filename = _UNSAFE_FILENAME_CHARS_RE.sub("", filename)
 
         # Remove multiple dots
-        filename = re.sub(r"\.+", ".", filename)
+        filename = _DOT_RUN_RE.sub(".", filename)
 
         # Limit length
         if len(filename) > 255:
@@ -381,67 +511,77 @@ class SQLValidator:
             bool: True if valid
         """
         # Allow only alphanumeric and underscore
-        return bool(re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", identifier))
+        return bool(_SQL_IDENTIFIER_RE.match(identifier))
 
 
 # ==================== Request Logging Middleware ====================
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Log all requests for security auditing.
     """
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Log request details"""
-        import logging
-        import time
-
-        logger = logging.getLogger("blockscope.requests")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Record start time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Get client info
-        client_ip = request.client.host if request.client else "unknown"
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        forwarded_for = _find_headers(scope, (b"x-forwarded-for",)).get(b"x-forwarded-for")
         if forwarded_for:
-            client_ip = forwarded_for.split(",")[0].strip()
+            client_ip = forwarded_for.decode("latin-1").split(",")[0].strip()
 
-        # Process request
-        try:
-            response = await call_next(request)
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
 
-            # Calculate duration
-            duration = time.time() - start_time
-
-            # Log successful request
-            if settings.LOG_REQUESTS:
-                logger.info(
-                    f"{request.method} {request.url.path} - "
-                    f"Status: {response.status_code} - "
-                    f"IP: {client_ip} - "
-                    f"Duration: {duration:.3f}s"
-                )
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-            return response
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_status)
 
         except Exception as e:
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Log error
-            logger.error(
-                f"{request.method} {request.url.path} - "
-                f"Error: {str(e)} - "
-                f"IP: {client_ip} - "
-                f"Duration: {duration:.3f}s"
+            _request_logger.error(
+                "%s %s - Error: %s - IP: %s - Duration: %.3fs",
+                method,
+                path,
+                e,
+                client_ip,
+                duration,
             )
             raise
 
+        # Log successful request
+        if settings.LOG_REQUESTS and _request_logger.isEnabledFor(logging.INFO):
+            duration = time.perf_counter() - start_time
+            _request_logger.info(
+                "%s %s - Status: %s - IP: %s - Duration: %.3fs",
+                method,
+                path,
+                status_code,
+                client_ip,
+                duration,
+            )
+
 
 # ==================== Helper Functions ====================
 
@@ -470,6 +610,9 @@ def setup_security_middleware(app) -> None:
     Args:
         app: FastAPI application
     """
+    # Refuse oversized bodies up front (added first so headers still apply)
+    app.add_middleware(RequestSizeLimitMiddleware)
+
     # Add security headers
     app.add_middleware(SecurityHeadersMiddleware)
 
@@ -502,12 +645,13 @@ file_validator = FileValidator()
 
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
-    # Validate file
-    is_valid, error = await file_validator.validate_file(file)
+    # Validate file (the first 8 KB are consumed and handed back)
+    is_valid, error, prefix = await file_validator.validate_file(file)
     if not is_valid:
         raise HTTPException(400, detail=error)
 
     # Process file...
+    contents = prefix + await file.read()
     return {"message": "File uploaded successfully"}
 
 @app.post("/search")
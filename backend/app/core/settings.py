@@ -57,6 +57,7 @@ class Settings(BaseSettings):
     # Redis
     # =========================
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 10
 
     # =========================
     # Security
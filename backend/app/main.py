@@ -3,6 +3,7 @@ BlockScope API - Main Application
 Secure, production-ready FastAPI application with comprehensive security features
 """
 
+import asyncio
 import logging
 import sys
 import time
@@ -228,6 +229,9 @@ async def lifespan(app: FastAPI):
                 socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
             )
             if redis_manager.is_available:
+                from app.core.rate_limit import load_scripts
+
+                await load_scripts(redis_manager.redis)
                 logger.info("Redis connected (caching + rate limiting)")
             else:
                 logger.warning("Redis unavailable — caching and rate limiting degraded")
@@ -236,14 +240,24 @@ async def lifespan(app: FastAPI):
 
     # Database connectivity
     try:
-        from app.core.database import engine, text
+        from app.core.database import get_engine, text
 
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             conn.execute(text("SELECT 1"))
         logger.info("Database connection verified")
     except Exception as exc:
         logger.warning("Database connection failed on startup: %s", exc)
 
+    # Batched API key usage tracking
+    usage_flusher: Optional[asyncio.Task] = None
+    if SECURITY_ENABLED:  # pragma: no cover
+        try:
+            from app.core.auth import run_usage_flusher
+
+            usage_flusher = asyncio.create_task(run_usage_flusher())
+        except Exception as exc:
+            logger.warning("API key usage flusher not started: %s", exc)
+
     logger.info("Application startup complete")
 
     yield  # <- application runs here
@@ -251,11 +265,27 @@ async def lifespan(app: FastAPI):
     # -- Shutdown ---------------------------------------------------------
     logger.info("Shutting down %s ...", settings.APP_NAME)
 
+    # Stop the periodic flusher and write out whatever usage is still buffered.
+    if usage_flusher is not None:
+        usage_flusher.cancel()
+        try:
+            await usage_flusher
+        except asyncio.CancelledError:
+            pass
+    if SECURITY_ENABLED:  # pragma: no cover
+        try:
+            from app.core.auth import flush_api_key_usage_async
+
+            await flush_api_key_usage_async()
+        except Exception as exc:
+            logger.debug("API key usage flush skipped: %s", exc)
+
     # Shut down the shared analysis thread pool cleanly so worker threads
     # are not left dangling when uvicorn exits.
     try:
-        from analysis.orchestrator import _ANALYSIS_POOL
-        _ANALYSIS_POOL.shutdown(wait=False, cancel_futures=True)
+        from analysis.orchestrator import shutdown_analysis_pool
+
+        shutdown_analysis_pool()
         logger.info("Analysis thread pool shut down")
     except Exception as exc:  # pragma: no cover
         logger.debug("Analysis thread pool shutdown skipped: %s", exc)
@@ -267,6 +297,12 @@ async def lifespan(app: FastAPI):
     except Exception as exc:  # pragma: no cover
         logger.debug("Thread pool shutdown skipped: %s", exc)
 
+    try:
+        from app.core.database import dispose_async_engine
+        await dispose_async_engine()
+    except Exception as exc:  # pragma: no cover
+        logger.debug("Async engine dispose skipped: %s", exc)
+
     if SECURITY_ENABLED:  # pragma: no cover
         try:
             from app.core.redis import redis_manager
@@ -531,8 +567,8 @@ async def performance_metrics() -> Dict[str, Any]:
 
     # DB pool
     try:
-        from app.core.database import engine
-        pool = engine.pool
+        from app.core.database import get_engine
+        pool = get_engine().pool
         perf_metrics["db_pool"] = {
             "size": pool.size(),
             "checked_out": pool.checkedout(),
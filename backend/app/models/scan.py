@@ -16,7 +16,9 @@ class Scan(Base):
     __tablename__ = "scans"
     __table_args__ = (
         # Indexes for common query patterns
-        Index("idx_scans_scanned_at", desc("scanned_at")),  # GET /scans ordering (DESC)
+        Index(
+            "idx_scans_scanned_at_id", desc("scanned_at"), desc("id")
+        ),  # GET /scans ordering (DESC) with stable id tie-breaker
         Index("idx_scans_created_at", "created_at"),  # Alternative time ordering
         Index("idx_scans_overall_score", "overall_score"),  # Score-based filtering
         Index("idx_scans_status", "status"),  # Status filtering
@@ -19,7 +19,7 @@ except ImportError:  # pragma: no cover
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
-from app.core.database import engine
+from app.core.database import get_engine
 
 from app.core.config import settings  # type: ignore[no-redef]
 
@@ -32,7 +32,7 @@ startup_complete = False
 
 def check_database():
     try:
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             conn.execute(text("SELECT 1"))
         return {"status": "ok"}
     except Exception as e:
@@ -11,11 +11,14 @@ Endpoints:
 Design notes:
     - Code duplication is eliminated via ``_build_scan_record`` and
       ``_scan_result_to_response`` helpers.
+    - Scans are persisted with a Core ``INSERT … RETURNING id`` so no
+      post-commit ``refresh`` SELECT is needed.
+    - File uploads are read in bounded chunks; oversized files are rejected
+      with 413 before their full contents are buffered.
     - Every endpoint logs its request ID and wall-clock duration.
     - All public surface is fully type-annotated.
 """
 
-import asyncio
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor
@@ -26,8 +29,14 @@ from analysis import AnalysisOrchestrator
 from analysis import ScanRequest as AnalysisScanRequest
 from analysis.cache import analysis_cache as _analysis_cache
 from analysis.models import ScanResult
-from app.core.config import settings
-from app.core.database import get_by_id, get_db, paginate, paginate_with_total
+from app.core.config import get_settings
+from app.core.database import (
+    bulk_insert_returning,
+    get_by_id,
+    get_db,
+    paginate,
+    paginate_with_total,
+)
 from app.core.logger import PerformanceTimer, log_error_context, logger
 from app.metrics import CACHE_HITS, CACHE_MISSES
 from app.models.scan import Scan
@@ -77,6 +86,14 @@ _SCAN_EXECUTOR = ThreadPoolExecutor(
 
 router = APIRouter(tags=["scans"])
 
+# Source length bounds (characters) and the largest upload worth reading:
+# UTF-8 needs at most 4 bytes per character, so anything bigger can never
+# decode to an acceptable source and is rejected without being buffered.
+_MIN_SOURCE_CHARS: int = 10
+_MAX_SOURCE_CHARS: int = 500_000
+_MAX_UPLOAD_BYTES: int = 4 * _MAX_SOURCE_CHARS
+_UPLOAD_CHUNK_SIZE: int = 64 * 1024
+
 # Single orchestrator instance shared across all requests
 orchestrator = AnalysisOrchestrator(rules=[])
 
@@ -133,7 +150,7 @@ def _validate_source_length(source_code: str) -> None:
     Raises:
         HTTPException: 400 if source_code is too short or too long.
     """
-    if len(source_code) < 10:
+    if len(source_code) < _MIN_SOURCE_CHARS:
         raise HTTPException(
             status_code=400,
             detail=(
@@ -141,7 +158,7 @@ def _validate_source_length(source_code: str) -> None:
                 "Please provide a valid Solidity contract."
             ),
         )
-    if len(source_code) > 500_000:
+    if len(source_code) > _MAX_SOURCE_CHARS:
         raise HTTPException(
             status_code=400,
             detail=(
@@ -151,6 +168,45 @@ def _validate_source_length(source_code: str) -> None:
         )
 
 
+async def _read_upload(
+    file: UploadFile, limit: int = _MAX_UPLOAD_BYTES, prefix: bytes = b""
+) -> bytes:
+    """
+    Read an uploaded file in fixed-size chunks, stopping once ``limit`` is passed.
+
+    Unlike a bare ``await file.read()``, an oversized upload is rejected after
+    at most ``limit + chunk`` bytes instead of being copied into memory whole.
+
+    Args:
+        file: Uploaded file, positioned just after ``prefix``.
+        limit: Maximum number of bytes accepted.
+        prefix: Bytes already consumed from ``file`` (e.g. by content
+            validation); the read continues after them instead of rewinding.
+
+    Returns:
+        The complete file contents.
+
+    Raises:
+        HTTPException: 413 if the upload exceeds ``limit`` bytes.
+    """
+    size = getattr(file, "size", None)
+    if size is not None and size > limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large (max {limit // 1000} KB).",
+        )
+
+    buffer = bytearray(prefix)
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        buffer += chunk
+        if len(buffer) > limit:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large (max {limit // 1000} KB).",
+            )
+    return bytes(buffer)
+
+
 def _findings_to_json(scan_result: ScanResult) -> List[Dict[str, Any]]:
     """
     Convert a :class:`ScanResult`'s findings list to JSON-serialisable dicts.
@@ -173,6 +229,31 @@ def _findings_to_json(scan_result: ScanResult) -> List[Dict[str, Any]]:
     ]
 
 
+def _build_scan_values(
+    scan_result: ScanResult, findings_json: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Build the ``scans`` column values for a completed scan result.
+
+    Args:
+        scan_result: Orchestrator output.
+        findings_json: Pre-serialised findings list.
+
+    Returns:
+        Column-name → value dict suitable for a Core ``INSERT`` or ``Scan(**values)``.
+    """
+    return {
+        "contract_name": scan_result.contract_name,
+        "source_code": scan_result.source_code,
+        "vulnerabilities_count": scan_result.vulnerabilities_count,
+        "severity_breakdown": scan_result.severity_breakdown,
+        "overall_score": scan_result.overall_score,
+        "summary": scan_result.summary,
+        "findings": findings_json,
+        "scanned_at": datetime.now(timezone.utc),
+    }
+
+
 def _build_scan_record(scan_result: ScanResult, findings_json: List[Dict[str, Any]]) -> Scan:
     """
     Construct an ORM ``Scan`` instance from a completed scan result.
@@ -184,16 +265,27 @@ def _build_scan_record(scan_result: ScanResult, findings_json: List[Dict[str, An
     Returns:
         Unsaved ``Scan`` ORM instance (caller must ``db.add`` + ``db.commit``).
     """
-    return Scan(
-        contract_name=scan_result.contract_name,
-        source_code=scan_result.source_code,
-        vulnerabilities_count=scan_result.vulnerabilities_count,
-        severity_breakdown=scan_result.severity_breakdown,
-        overall_score=scan_result.overall_score,
-        summary=scan_result.summary,
-        findings=findings_json,
-        scanned_at=datetime.now(timezone.utc),
-    )
+    return Scan(**_build_scan_values(scan_result, findings_json))
+
+
+def _persist_scan_values(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert one or more scan rows and commit, returning their new IDs.
+
+    Uses a Core ``INSERT … RETURNING`` (batched via insertmanyvalues for
+    multiple rows) instead of ``db.add`` + ``db.commit`` + ``db.refresh``,
+    which costs an extra ``SELECT`` per row.
+
+    Args:
+        db: Active database session.
+        rows: Values built by :func:`_build_scan_values`.
+
+    Returns:
+        Generated scan IDs, in the same order as ``rows``.
+    """
+    scan_ids = bulk_insert_returning(db, Scan.__table__, rows)
+    db.commit()
+    return scan_ids
 
 
 def _scan_record_to_response(scan: Scan) -> ScanResponse:
@@ -218,6 +310,32 @@ def _scan_record_to_response(scan: Scan) -> ScanResponse:
     )
 
 
+def _scan_values_to_response(scan_id: int, values: Dict[str, Any]) -> ScanResponse:
+    """
+    Build a ``ScanResponse`` from freshly inserted column values.
+
+    Avoids re-reading the row after insert; the values are exactly what
+    was written.
+
+    Args:
+        scan_id: Primary key returned by the insert.
+        values: Values built by :func:`_build_scan_values`.
+
+    Returns:
+        ``ScanResponse`` ready for the API caller.
+    """
+    return ScanResponse(
+        scan_id=scan_id,
+        contract_name=values["contract_name"],
+        vulnerabilities_count=values["vulnerabilities_count"],
+        severity_breakdown=values["severity_breakdown"],
+        overall_score=values["overall_score"],
+        summary=values["summary"],
+        findings=values["findings"] or [],
+        timestamp=values["scanned_at"],
+    )
+
+
 def _scan_record_to_list_response(scan: Scan) -> ScanListResponse:
     """
     Convert an ORM ``Scan`` instance to a lightweight ``ScanListResponse``.
@@ -258,9 +376,9 @@ async def _run_analysis_and_persist(
     The heavy ``orchestrator.analyze()`` call is CPU/IO-bound (Slither
     invokes the Solidity compiler under the hood).  Running it directly
     inside an ``async`` endpoint would block FastAPI's event loop and
-    serialise all concurrent requests.  We offload it to a thread-pool
-    worker via :func:`asyncio.to_thread` so the event loop stays free
-    to accept and dispatch other requests while analysis runs.
+    serialise all concurrent requests.  We offload it to the scan
+    thread pool via ``orchestrator.analyze_async()`` so the event loop
+    stays free to accept and dispatch other requests while analysis runs.
 
     Args:
         source_code: Solidity source code to analyse.
@@ -277,7 +395,7 @@ async def _run_analysis_and_persist(
     """
     ctx = {"contract_name": contract_name, "file_path": file_path, "request_id": request_id}
     is_test_run = os.getenv("TESTING", "").lower() in {"1", "true", "yes"}
-    cache_enabled = settings.CACHE_SCAN_RESULTS and not is_test_run
+    cache_enabled = get_settings().CACHE_SCAN_RESULTS and not is_test_run
 
     # Cache key: SHA-256 of (source_code, contract_name) so two differently-named
     # contracts with identical source are each cached independently.
@@ -327,11 +445,8 @@ async def _run_analysis_and_persist(
                     contract_name=contract_name,
                     file_path=file_path,
                 )
-                loop = asyncio.get_running_loop()
-                scan_result = await loop.run_in_executor(
-                    _SCAN_EXECUTOR,
-                    orchestrator.analyze,
-                    analysis_request,
+                scan_result = await orchestrator.analyze_async(
+                    analysis_request, executor=_SCAN_EXECUTOR
                 )
             # Populate L1 (in-memory) cache
             _analysis_cache.set(cache_key, scan_result)
@@ -358,20 +473,18 @@ async def _run_analysis_and_persist(
     # entry, regardless of whether the analysis result came from cache.
     with PerformanceTimer("db_persist_scan", _scan_logger, extra=ctx):
         findings_json = _findings_to_json(scan_result)
-        scan_record = _build_scan_record(scan_result, findings_json)
+        scan_values = _build_scan_values(scan_result, findings_json)
         # Overwrite contract_name with the caller-supplied value so the DB
         # record reflects what *this* caller asked for, not the cached result.
-        scan_record.contract_name = contract_name
-        db.add(scan_record)
-        db.commit()
-        db.refresh(scan_record)
+        scan_values["contract_name"] = contract_name
+        (scan_id,) = _persist_scan_values(db, [scan_values])
 
     _scan_logger.info(
         "Scan persisted",
-        extra={**ctx, "scan_id": scan_record.id},
+        extra={**ctx, "scan_id": scan_id},
     )
 
-    return _scan_record_to_response(scan_record)
+    return _scan_values_to_response(scan_id, scan_values)
 
 
 # ----------------------------------------------
@@ -495,13 +608,14 @@ async def scan_contract_file(
             )
 
         # Validate via security module if available (adds MIME, size, content checks)
+        prefix = b""
         if SECURITY_ENABLED:
-            is_valid, error_message = await _file_validator.validate_file(file)
+            is_valid, error_message, prefix = await _file_validator.validate_file(file)
             if not is_valid:
                 raise HTTPException(status_code=400, detail=error_message)
 
-        # Read and decode file content
-        raw_bytes: bytes = await file.read()
+        # Read and decode file content (bounded, chunked), after the validated prefix
+        raw_bytes: bytes = await _read_upload(file, prefix=prefix)
 
         # BUG-002 fix (second layer): catch empty files even when file.size is unavailable.
         if not raw_bytes:
@@ -595,11 +709,14 @@ async def list_scans(
             # Defer heavy TEXT/JSON columns that the list view does not need.
             # source_code can be up to 500 KB; findings is a large JSON blob.
             # Both are safely deferred because _scan_record_to_list_response()
-            # does not access either column.
+            # does not access either column.  Scan has no relationships, so
+            # the page is a single SELECT (no N+1 to eager-load away).
+            # The id tie-breaker makes OFFSET paging stable for equal
+            # timestamps and matches idx_scans_scanned_at_id.
             base_query = (
                 db.query(Scan)
                 .options(defer(Scan.source_code), defer(Scan.findings))
-                .order_by(Scan.scanned_at.desc())
+                .order_by(Scan.scanned_at.desc(), Scan.id.desc())
             )
             # TODO(perf): paginate_with_total issues COUNT(*) on every request.
             # At scale (>100K rows), consider caching the count with a short
@@ -1,8 +1,8 @@
 """
 Root conftest.py — sets test environment variables BEFORE any app module is imported.
 
-This MUST run before anything triggers `from app.core.config import settings`,
-because settings = get_settings() executes at module-import time.
+This MUST run before anything first resolves settings (`get_settings()` or
+`from app.core.config import settings`), because the result is cached.
 """
 
 import os
@@ -0,0 +1,451 @@
+"""
+Tests for API key validation in app.core.auth.
+"""
+
+import asyncio
+import fnmatch
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core import auth
+from app.core.auth import (
+    APIKey,
+    AuthenticatedKey,
+    clear_api_key_cache,
+    create_api_key,
+    flush_api_key_usage,
+    flush_api_key_usage_async,
+    hash_api_key_fast,
+    revoke_api_key,
+    validate_api_key,
+    validate_api_key_async,
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_api_key_cache():
+    """Isolate every test from lookups cached or usage buffered by earlier ones."""
+    clear_api_key_cache()
+    auth._usage_buffer.drain()
+    yield
+    clear_api_key_cache()
+    auth._usage_buffer.drain()
+
+
+class TestCreateAPIKey:
+    """Key generation and creation round-trips."""
+
+    def test_generated_key_format(self):
+        import re
+
+        from app.core.config import settings
+
+        raw_key, key_hash, key_prefix = auth.generate_api_key()
+        random_part = raw_key[len(settings.API_KEY_PREFIX) :]
+
+        assert raw_key.startswith(settings.API_KEY_PREFIX)
+        assert re.fullmatch(r"[A-Za-z0-9_-]+", random_part)
+        # Same length as secrets.token_urlsafe(API_KEY_LENGTH)
+        assert len(random_part) == -(-settings.API_KEY_LENGTH * 4 // 3)
+        assert key_hash == auth.hash_api_key(raw_key)
+        assert key_prefix == raw_key[:12]
+
+    def test_generated_keys_are_unique(self):
+        assert len({auth.generate_api_key()[0] for _ in range(100)}) == 100
+
+    def test_create_issues_only_insert(self, db_session):
+        from sqlalchemy import event
+
+        engine = db_session.get_bind()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement.split(None, 1)[0].upper())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            _, created = create_api_key(db_session, name="NoRefresh", tier="pro")
+            loaded = (created.id, created.tier, created.total_requests, created.created_at)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert statements == ["INSERT"]
+        assert loaded[1:3] == ("pro", 0)
+        assert created in db_session and not db_session.is_modified(created)
+
+
+class TestValidateAPIKeyCache:
+    """The in-process lookup cache in front of validate_api_key."""
+
+    def test_repeat_lookup_skips_select(self, db_session, monkeypatch):
+        raw_key, created = create_api_key(db_session, name="CacheHit", tier="pro")
+
+        assert validate_api_key(db_session, raw_key) is not None
+
+        original_execute = db_session.execute
+        executed = []
+
+        def tracking_execute(statement, *args, **kwargs):
+            executed.append(statement)
+            return original_execute(statement, *args, **kwargs)
+
+        monkeypatch.setattr(db_session, "execute", tracking_execute)
+        cached = validate_api_key(db_session, raw_key)
+
+        assert cached.id == created.id
+        assert cached.tier == "pro"
+        assert executed == []
+
+    def test_revoke_invalidates_entry(self, db_session):
+        raw_key, created = create_api_key(db_session, name="CacheRevoke")
+        assert validate_api_key(db_session, raw_key) is not None
+
+        assert revoke_api_key(db_session, created.id)
+
+        assert validate_api_key(db_session, raw_key) is None
+
+    def test_expired_entry_is_reloaded(self, db_session, monkeypatch):
+        monkeypatch.setattr(auth, "_api_key_cache", auth._APIKeyCache(ttl_seconds=0.0))
+        raw_key, created = create_api_key(db_session, name="CacheTTL")
+        validate_api_key(db_session, raw_key)
+
+        # Revoked behind the cache's back: only the TTL can catch this
+        db_session.query(APIKey).filter(APIKey.id == created.id).update({"is_revoked": True})
+        db_session.commit()
+
+        assert validate_api_key(db_session, raw_key) is None
+
+    def test_unknown_key_rejected_from_memory_on_repeat(self, db_session, monkeypatch):
+        assert validate_api_key(db_session, "bsc_scanner-junk") is None
+
+        def no_database(*args, **kwargs):
+            raise AssertionError("known-unknown key must not reach the database")
+
+        monkeypatch.setattr(db_session, "execute", no_database)
+        assert validate_api_key(db_session, "bsc_scanner-junk") is None
+        assert asyncio.run(validate_api_key_async(db_session, "bsc_scanner-junk")) is None
+
+    def test_lru_evicts_oldest(self):
+        cache = auth._APIKeyCache(max_size=2)
+        cache.set("a", {"id": 1})
+        cache.set("b", {"id": 2})
+        cache.get("a")
+        cache.set("c", {"id": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": 1}
+        assert len(cache) == 2
+
+
+class TestValidateAPIKeyAsync:
+    """The async variant used by the FastAPI dependencies."""
+
+    def test_miss_runs_lookup_off_the_event_loop(self, db_session, monkeypatch):
+        import threading
+
+        raw_key, created = create_api_key(db_session, name="AsyncMiss")
+        original_load = auth._load_api_key
+        threads = []
+
+        def tracking_load(*args):
+            threads.append(threading.current_thread())
+            return original_load(*args)
+
+        monkeypatch.setattr(auth, "_load_api_key", tracking_load)
+        api_key = asyncio.run(validate_api_key_async(db_session, raw_key))
+
+        assert api_key.id == created.id
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_hit_stays_on_the_event_loop(self, db_session, monkeypatch):
+        raw_key, created = create_api_key(db_session, name="AsyncHit")
+        validate_api_key(db_session, raw_key)
+
+        async def no_threadpool(*args, **kwargs):
+            raise AssertionError("cache hit must not use the threadpool")
+
+        monkeypatch.setattr(auth, "run_in_threadpool", no_threadpool)
+        assert asyncio.run(validate_api_key_async(db_session, raw_key)).id == created.id
+
+    def test_unknown_key_rejected(self, db_session):
+        assert asyncio.run(validate_api_key_async(db_session, "bsc_not-a-real-key")) is None
+
+
+class TestAuthLookup:
+    """validate_api_key returns a lightweight record, not an ORM row."""
+
+    def test_returns_authenticated_key(self, db_session):
+        raw_key, created = create_api_key(
+            db_session, name="CoreLookup", tier="enterprise", allowed_ips=["10.0.0.1"]
+        )
+
+        api_key = validate_api_key(db_session, raw_key)
+
+        assert isinstance(api_key, AuthenticatedKey)
+        assert (api_key.id, api_key.name, api_key.tier) == (created.id, "CoreLookup", "enterprise")
+        assert api_key.allowed_ip_set == frozenset({"10.0.0.1"})
+
+    def test_record_is_immutable(self, db_session):
+        raw_key, _ = create_api_key(db_session, name="Immutable")
+        api_key = validate_api_key(db_session, raw_key)
+
+        with pytest.raises(AttributeError):
+            api_key.tier = "enterprise"
+
+    def test_lookup_searches_live_key_index(self):
+        from sqlalchemy import create_engine
+
+        engine = create_engine("sqlite://")
+        APIKey.__table__.create(engine)
+        sql = str(auth._AUTH_LOOKUP.compile(engine))
+
+        with engine.connect() as conn:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", ("x", 1, 0)).fetchall()
+
+        assert "USING INDEX idx_api_keys_fast_live" in plan[0][-1]
+        assert plan[0][-1].startswith("SEARCH")
+
+    def test_rate_limits_use_tier(self, db_session):
+        raw_key, _ = create_api_key(db_session, name="Limits", tier="pro")
+
+        limits = auth.get_rate_limits(validate_api_key(db_session, raw_key))
+
+        assert limits["per_minute"] == 100
+
+
+class TestRateLimits:
+    """Tier lookup in get_rate_limits."""
+
+    def test_anonymous_limits_follow_settings(self):
+        from app.core.config import settings
+
+        assert auth.get_rate_limits(None)["per_minute"] == settings.RATE_LIMIT_PER_MINUTE
+
+    def test_unknown_tier_falls_back_to_free(self):
+        free = auth.get_rate_limits(AuthenticatedKey(1, "k", "free", None, None, frozenset()))
+        unknown = auth.get_rate_limits(AuthenticatedKey(2, "k", "gold", None, None, frozenset()))
+
+        assert unknown == free
+
+    def test_limits_are_read_only(self):
+        with pytest.raises(TypeError):
+            auth.get_rate_limits(None)["per_minute"] = 0
+
+
+class TestFastLookupHash:
+    """Keyed BLAKE2b lookup hash with SHA256 fallback for older rows."""
+
+    def test_new_keys_store_fast_hash(self, db_session):
+        raw_key, created = create_api_key(db_session, name="FastHash")
+
+        assert created.key_hash_fast == hash_api_key_fast(raw_key)
+        assert len(created.key_hash_fast) == 16
+
+    def test_fast_hash_is_keyed(self, monkeypatch):
+        before = hash_api_key_fast("bsc_example")
+        monkeypatch.setattr(auth, "_FAST_HASH_KEY", b"another-server-secret")
+
+        assert hash_api_key_fast("bsc_example") != before
+
+    def test_legacy_row_is_backfilled_on_first_use(self, db_session):
+        raw_key, created = create_api_key(db_session, name="LegacyHash")
+        created.key_hash_fast = None
+        db_session.commit()
+
+        assert validate_api_key(db_session, raw_key) is not None
+
+        db_session.expire_all()
+        assert db_session.get(APIKey, created.id).key_hash_fast == hash_api_key_fast(raw_key)
+
+
+class TestAllowedIPs:
+    """IP allow-list parsing and enforcement."""
+
+    def test_allowed_ip_set_strips_entries(self):
+        api_key = APIKey(allowed_ips=" 10.0.0.1 , 10.0.0.2,")
+
+        assert api_key.allowed_ip_set == frozenset({"10.0.0.1", "10.0.0.2"})
+
+    def test_unrestricted_key_has_empty_set(self):
+        assert APIKey(allowed_ips=None).allowed_ip_set == frozenset()
+
+    def test_allow_list_is_parsed_once(self):
+        auth._parse_allowed_ips.cache_clear()
+        first = APIKey(allowed_ips="10.0.0.1,10.0.0.2")
+        second = APIKey(allowed_ips="10.0.0.1,10.0.0.2")
+
+        assert first.allowed_ip_set is second.allowed_ip_set
+        assert auth._parse_allowed_ips.cache_info().misses == 1
+
+    def test_allow_list_is_normalised_at_write_time(self, db_session):
+        _, created = create_api_key(
+            db_session, name="IPNormalised", allowed_ips=[" 10.0.0.1 ", "10.0.0.1", "", "10.0.0.2"]
+        )
+
+        assert created.allowed_ips == "10.0.0.1,10.0.0.2"
+
+    def test_blank_allow_list_is_unrestricted(self, db_session):
+        _, created = create_api_key(db_session, name="IPBlank", allowed_ips=[" ", ""])
+
+        assert created.allowed_ips is None
+
+    def test_client_ip_checked_on_cache_hit(self, db_session):
+        raw_key, _ = create_api_key(db_session, name="IPLocked", allowed_ips=["10.0.0.1"])
+
+        assert validate_api_key(db_session, raw_key, client_ip="10.0.0.1") is not None
+        assert validate_api_key(db_session, raw_key, client_ip="10.0.0.9") is None
+
+
+class TestUsageBatching:
+    """Usage counters are buffered and written back in one batch."""
+
+    def test_validate_does_not_write(self, db_session):
+        raw_key, created = create_api_key(db_session, name="UsageBuffered")
+
+        validate_api_key(db_session, raw_key)
+        validate_api_key(db_session, raw_key)
+
+        db_session.expire_all()
+        assert db_session.get(APIKey, created.id).total_requests == 0
+        assert len(auth._usage_buffer) == 1
+
+    def test_flush_applies_aggregated_counts(self, db_session):
+        raw_a, key_a = create_api_key(db_session, name="UsageA")
+        raw_b, key_b = create_api_key(db_session, name="UsageB")
+        for _ in range(3):
+            validate_api_key(db_session, raw_a)
+        validate_api_key(db_session, raw_b)
+
+        assert flush_api_key_usage(db_session) == 2
+
+        db_session.expire_all()
+        assert db_session.get(APIKey, key_a.id).total_requests == 3
+        assert db_session.get(APIKey, key_b.id).total_requests == 1
+        assert db_session.get(APIKey, key_a.id).last_used_at is not None
+        assert len(auth._usage_buffer) == 0
+
+    def test_flush_with_nothing_buffered(self, db_session):
+        assert flush_api_key_usage(db_session) == 0
+
+    def test_failed_flush_requeues_counts(self, db_session, monkeypatch):
+        raw_key, created = create_api_key(db_session, name="UsageRetry")
+        validate_api_key(db_session, raw_key)
+        validate_api_key(db_session, raw_key)
+
+        def broken_execute(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(db_session, "execute", broken_execute)
+        assert flush_api_key_usage(db_session) == 0
+        monkeypatch.undo()
+
+        assert flush_api_key_usage(db_session) == 1
+        db_session.expire_all()
+        assert db_session.get(APIKey, created.id).total_requests == 2
+
+
+class _FakePipeline:
+    """Queues commands and runs them against a ``_FakeRedis`` on execute."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self._calls.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self):
+        calls, self._calls = self._calls, []
+        return [await getattr(self._redis, name)(*args) for name, args in calls]
+
+
+class _FakeRedis:
+    """The handful of string commands the usage flusher relies on."""
+
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def incrby(self, key, amount):
+        self.store[key] = str(int(self.store.get(key, 0)) + amount)
+        return int(self.store[key])
+
+    async def set(self, key, value):
+        self.store[key] = str(value)
+        return True
+
+    async def eval(self, script, numkeys, key, used_at, ttl):
+        # Mirrors _STAGE_USAGE_TIME_SCRIPT: keep the newest timestamp
+        current = self.store.get(key)
+        if current is None or float(current) < float(used_at):
+            self.store[key] = str(used_at)
+        return self.store[key]
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def getdel(self, key):
+        return self.store.pop(key, None)
+
+    async def scan_iter(self, match="*", count=None):
+        for key in list(self.store):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+class TestRedisUsageCounters:
+    """Cross-worker usage aggregation through shared Redis counters."""
+
+    def test_counts_from_all_workers_reach_database(self, db_session, monkeypatch):
+        redis = _FakeRedis()
+        monkeypatch.setattr(auth, "_get_usage_redis", lambda: redis)
+        raw_key, created = create_api_key(db_session, name="RedisUsage")
+
+        # Another worker already staged two requests for this key
+        redis.store[f"ak:c:{created.id}"] = "2"
+        validate_api_key(db_session, raw_key)
+
+        assert asyncio.run(flush_api_key_usage_async()) == 1
+
+        db_session.expire_all()
+        assert db_session.get(APIKey, created.id).total_requests == 3
+        assert f"ak:c:{created.id}" not in redis.store
+        assert f"ak:t:{created.id}" not in redis.store
+
+    def test_staging_keeps_newest_last_used_at(self, db_session, monkeypatch):
+        redis = _FakeRedis()
+        monkeypatch.setattr(auth, "_get_usage_redis", lambda: redis)
+        raw_key, created = create_api_key(db_session, name="RedisUsageTime")
+
+        # Another worker already staged a request from the future
+        newest = datetime.now(timezone.utc) + timedelta(hours=1)
+        redis.store[f"ak:c:{created.id}"] = "1"
+        redis.store[f"ak:t:{created.id}"] = str(newest.timestamp())
+        validate_api_key(db_session, raw_key)
+
+        assert asyncio.run(flush_api_key_usage_async()) == 1
+
+        db_session.expire_all()
+        last_used_at = db_session.get(APIKey, created.id).last_used_at
+        assert last_used_at.replace(tzinfo=timezone.utc) == newest
+
+    def test_unreachable_redis_falls_back_to_database(self, db_session, monkeypatch):
+        class _DownRedis(_FakeRedis):
+            async def incrby(self, key, amount):
+                raise ConnectionError("redis down")
+
+        monkeypatch.setattr(auth, "_get_usage_redis", lambda: _DownRedis())
+        raw_key, created = create_api_key(db_session, name="RedisDown")
+        validate_api_key(db_session, raw_key)
+
+        assert asyncio.run(flush_api_key_usage_async()) == 1
+
+        db_session.expire_all()
+        assert db_session.get(APIKey, created.id).total_requests == 1
@@ -1,8 +1,9 @@
 """
 Unit tests for app.core.database helpers.
 
-Tests paginate(), get_by_id(), bulk_insert(), get_db_context(),
-test_connection(), init_db(), and the FastAPI get_db() dependency.
+Tests paginate(), get_by_id(), bulk_insert(), bulk_insert_returning(),
+get_db_context(), test_connection(), init_db(), and the FastAPI get_db()
+dependency.
 """
 
 import os
@@ -27,10 +28,16 @@ if str(BACKEND_DIR) not in sys.path:
 
 from app.core.database import (  # noqa: E402
     Base,
+    _json_deserializer,
+    _json_serializer,
     bulk_insert,
+    bulk_insert_returning,
     get_by_id,
     get_db,
+    get_async_engine,
     get_db_context,
+    get_engine,
+    get_sessionmaker,
     init_db,
     paginate,
     test_connection,
@@ -158,6 +165,56 @@ class TestBulkInsert:
         assert after == before
 
 
+# ══════════════════════════════════════════════════════════════
+# bulk_insert_returning()
+# ══════════════════════════════════════════════════════════════
+
+class TestBulkInsertReturning:
+
+    def _row(self, name: str) -> dict:
+        return dict(
+            contract_name=name,
+            source_code=f"contract {name} {{}}",
+            vulnerabilities_count=0,
+            severity_breakdown={"critical": 0},
+            overall_score=100,
+            summary="No issues",
+            findings=[],
+        )
+
+    def test_returns_ids_in_row_order(self, mem_db):
+        rows = [self._row(f"Ret{i}") for i in range(3)]
+        ids = bulk_insert_returning(mem_db, Scan.__table__, rows)
+        assert len(ids) == 3
+        for scan_id, row in zip(ids, rows):
+            assert mem_db.get(Scan, scan_id).contract_name == row["contract_name"]
+
+    def test_applies_column_defaults(self, mem_db):
+        (scan_id,) = bulk_insert_returning(mem_db, Scan.__table__, [self._row("Defaults")])
+        scan = mem_db.get(Scan, scan_id)
+        assert scan.status == "completed"
+        assert scan.created_at is not None
+
+    def test_empty_list_returns_empty(self, mem_db):
+        assert bulk_insert_returning(mem_db, Scan.__table__, []) == []
+
+
+# ══════════════════════════════════════════════════════════════
+# JSON column serialisation
+# ══════════════════════════════════════════════════════════════
+
+class TestJsonSerialisation:
+
+    def test_round_trips_findings(self):
+        value = [{"title": "Reentrancy", "line_number": None, "severity": "critical"}]
+        encoded = _json_serializer(value)
+        assert isinstance(encoded, str)
+        assert _json_deserializer(encoded) == value
+
+    def test_non_string_keys_are_stringified(self):
+        assert _json_deserializer(_json_serializer({1: "a"})) == {"1": "a"}
+
+
 # ══════════════════════════════════════════════════════════════
 # get_db_context()
 # ══════════════════════════════════════════════════════════════
@@ -192,6 +249,133 @@ class TestGetDb:
         except StopIteration:
             pass
 
+    def test_session_bound_to_shared_engine(self):
+        gen = get_db()
+        db = next(gen)
+        assert db.get_bind() is get_engine()
+        gen.close()
+
+
+# ══════════════════════════════════════════════════════════════
+# get_engine() / get_sessionmaker()
+# ══════════════════════════════════════════════════════════════
+
+class TestEngineSingleton:
+
+    def test_get_engine_returns_same_instance(self):
+        assert get_engine() is get_engine()
+
+    def test_get_sessionmaker_returns_same_instance(self):
+        assert get_sessionmaker() is get_sessionmaker()
+        assert get_sessionmaker().kw["bind"] is get_engine()
+
+    def test_engine_uses_configured_database_url(self):
+        from app.core.database import _database_config
+
+        assert _database_config() is _database_config()
+        assert get_engine().url.render_as_string(hide_password=False) == _database_config().url
+
+    def test_postgres_engine_pool_options(self):
+        from unittest.mock import patch
+
+        from app.core.database import _DatabaseConfig
+
+        pg_config = _DatabaseConfig(
+            url="postgresql://user:pw@db.test:5432/blockscope",
+            pool_size=5,
+            max_overflow=2,
+            pool_timeout=10,
+            pool_recycle=600,
+            echo=False,
+            statement_timeout=15000,
+        )
+        with patch("app.core.database._database_config", return_value=pg_config), patch(
+            "app.core.database.create_engine"
+        ) as mock_create_engine, patch("app.core.database._install_idle_ping") as mock_ping:
+            get_engine.__wrapped__()
+
+        mock_ping.assert_called_once_with(mock_create_engine.return_value)
+
+        kwargs = mock_create_engine.call_args.kwargs
+        assert kwargs["pool_pre_ping"] is False
+        assert kwargs["pool_use_lifo"] is True
+        assert kwargs["pool_reset_on_return"] == "rollback"
+        assert kwargs["connect_args"] == {"options": "-c statement_timeout=15000"}
+
+    def test_idle_ping_replaces_dropped_connection(self):
+        from sqlalchemy import text as sa_text
+        from sqlalchemy.pool import QueuePool
+
+        from app.core.database import _install_idle_ping
+
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1)
+        _install_idle_ping(engine, idle_seconds=0)
+        with engine.connect() as conn:
+            dropped = conn.connection.dbapi_connection
+        dropped.close()  # simulate the server closing an idle connection
+
+        with engine.connect() as conn:
+            assert conn.execute(sa_text("SELECT 1")).scalar() == 1
+            assert conn.connection.dbapi_connection is not dropped
+        engine.dispose()
+
+    def test_idle_ping_skipped_for_recently_used_connection(self):
+        from sqlalchemy.pool import QueuePool
+
+        from app.core.database import _install_idle_ping
+
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1)
+        _install_idle_ping(engine, idle_seconds=3600)
+        with engine.connect() as conn:
+            kept = conn.connection.dbapi_connection
+        kept.close()  # a ping would now fail and force a reconnect
+
+        with engine.connect() as conn:
+            assert conn.connection.dbapi_connection is kept
+        engine.dispose()
+
+    def test_async_engine_uses_asyncpg_for_postgres(self):
+        pytest.importorskip("asyncpg")
+        from unittest.mock import patch
+
+        from app.core.database import _DatabaseConfig
+
+        pg_config = _DatabaseConfig(
+            url="postgresql://user:pw@db.test:5432/blockscope",
+            pool_size=5,
+            max_overflow=2,
+            pool_timeout=10,
+            pool_recycle=600,
+            echo=False,
+            statement_timeout=15000,
+        )
+        with patch("app.core.database._database_config", return_value=pg_config), patch(
+            "app.core.database.create_async_engine"
+        ) as mock_create_async_engine:
+            get_async_engine.__wrapped__()
+
+        args, kwargs = mock_create_async_engine.call_args
+        assert args[0] == "postgresql+asyncpg://user:pw@db.test:5432/blockscope"
+        assert kwargs["pool_use_lifo"] is True
+        assert kwargs["connect_args"] == {"server_settings": {"statement_timeout": "15000"}}
+
+    def test_async_url_for_sqlite_uses_aiosqlite(self):
+        from app.core.database import _database_config
+
+        assert _database_config().async_url.startswith("sqlite+aiosqlite://")
+
+    def test_legacy_module_attributes_resolve_to_singletons(self):
+        import app.core.database as database
+
+        assert database.engine is get_engine()
+        assert database.SessionLocal is get_sessionmaker()
+
+    def test_unknown_attribute_raises(self):
+        import app.core.database as database
+
+        with pytest.raises(AttributeError):
+            database.no_such_attribute  # noqa: B018
+
 
 # ══════════════════════════════════════════════════════════════
 # test_connection() / init_db()
@@ -213,8 +397,8 @@ class TestConnectionHelpers:
         """test_connection returns False and logs error when DB is down."""
         from unittest.mock import patch, MagicMock
         from sqlalchemy import exc as sa_exc
-        with patch("app.core.database.engine") as mock_engine:
-            mock_engine.connect.side_effect = sa_exc.OperationalError("n", None, None)
+        with patch("app.core.database.get_engine") as mock_get_engine:
+            mock_get_engine.return_value.connect.side_effect = sa_exc.OperationalError("n", None, None)
             result = test_connection()
         assert result is False
 
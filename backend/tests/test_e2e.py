@@ -166,13 +166,12 @@ contract Test {
     result = subprocess.run(
         [sys.executable, "-m", "backend.cli.main", "scan", str(test_contract)],
         capture_output=True,
-        text=True,
         timeout=30,
         cwd=REPO_ROOT,
     )
 
     print(f"   Return code: {result.returncode}")
-    print(f"   STDOUT: {result.stdout[:500]}")
+    print(f"   STDOUT: {result.stdout[:500].decode(errors='replace')}")
 
     # Assert: Command runs without critical errors
     # Note: returncode might be non-zero if Slither not installed, but that's okay
@@ -181,7 +180,7 @@ contract Test {
     # Assert: Output contains scanning messages
     output = result.stdout + result.stderr
     assert any(
-        keyword in output.lower() for keyword in ["scan", "analyz", "contract"]
+        keyword in output.lower() for keyword in [b"scan", b"analyz", b"contract"]
     ), "Output should mention scanning or analysis"
 
     print(f"[OK] CLI scan test passed!")
@@ -200,13 +199,12 @@ def test_cli_scan_with_sample_sol(sample_sol_path):
     result = subprocess.run(
         [sys.executable, "-m", "backend.cli.main", "scan", str(sample_sol_path)],
         capture_output=True,
-        text=True,
         timeout=30,
         cwd=REPO_ROOT,
     )
 
     print(f"   Return code: {result.returncode}")
-    print(f"   STDOUT snippet: {result.stdout[:300]}")
+    print(f"   STDOUT snippet: {result.stdout[:300].decode(errors='replace')}")
 
     # Assert: CLI runs (may warn about Slither but shouldn't crash)
     assert result.returncode in [0, 1], "CLI should complete execution"
@@ -227,7 +225,6 @@ def test_cli_help_command():
     result = subprocess.run(
         [sys.executable, "-m", "backend.cli.main", "--help"],
         capture_output=True,
-        text=True,
         timeout=10,
         cwd=REPO_ROOT,
     )
@@ -238,8 +235,9 @@ def test_cli_help_command():
     assert result.returncode == 0, "Help command should succeed"
 
     # Assert: Output contains help text
+    stdout_lc = result.stdout.lower()
     assert (
-        "usage" in result.stdout.lower() or "help" in result.stdout.lower()
+        b"usage" in stdout_lc or b"help" in stdout_lc
     ), "Help output should contain usage information"
 
     print(f"[OK] CLI help test passed!")
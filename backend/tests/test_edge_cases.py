@@ -660,8 +660,8 @@ class TestDatabaseFailures:
         """Health endpoint must degrade gracefully when DB is unreachable."""
         from fastapi.testclient import TestClient
 
-        with patch("app.core.database.engine") as mock_engine:
-            mock_engine.connect.side_effect = Exception("Connection refused")
+        with patch("app.core.database.get_engine") as mock_engine:
+            mock_engine.return_value.connect.side_effect = Exception("Connection refused")
             with TestClient(app_instance, raise_server_exceptions=False) as c:
                 response = c.get("/health")
             # Health should report degraded or still return a valid JSON response
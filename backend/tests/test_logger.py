@@ -170,6 +170,7 @@ class TestPerformanceTimer:
 
     def _spy_logger(self):
         log = logging.getLogger("test.perf")
+        log.setLevel(logging.DEBUG)
         log.debug = MagicMock()
         log.warning = MagicMock()
         log.error = MagicMock()
@@ -194,6 +195,13 @@ class TestPerformanceTimer:
                 raise RuntimeError("boom")
         log.error.assert_called_once()
 
+    def test_fast_operation_skips_disabled_debug(self):
+        log = self._spy_logger()
+        log.setLevel(logging.INFO)
+        with PerformanceTimer("fast_op", log, warn_threshold_ms=5000):
+            pass
+        log.debug.assert_not_called()
+
     def test_extra_fields_passed_through(self):
         log = self._spy_logger()
         with PerformanceTimer("op", log, extra={"table": "scans"}):
@@ -246,6 +254,35 @@ class TestSetupLogger:
         log2 = setup_logger("test.idempotent")
         assert len(log2.handlers) == handler_count
 
+    def test_concurrent_setup_attaches_one_handler(self):
+        import threading
+
+        name = f"test.concurrent.{time.time_ns()}"
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(setup_logger(name)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(log is results[0] for log in results)
+        assert len(results[0].handlers) == 1
+
+    def test_rebuild_replaces_previous_queue_handler(self):
+        from app.core.logger import _build_logger
+
+        name = f"test.rebuild.{time.time_ns()}"
+        first = _build_logger.__wrapped__(name)
+        old_handler = first.handlers[0]
+        rebuilt = _build_logger.__wrapped__(name)
+
+        assert rebuilt is first
+        assert len(rebuilt.handlers) == 1
+        assert rebuilt.handlers[0] is not old_handler
+
     def test_module_singleton_is_logger(self):
         assert isinstance(logger, logging.Logger)
         assert logger.name == "blockscope"
@@ -258,12 +295,39 @@ class TestSetupLogger:
         import time
         unique_name = f"test.file.{int(time.time() * 1000)}"
         log = setup_logger(unique_name)
-        # Should have at least 1 file handler
+        # Should have at least 1 file handler behind the queue listener
         has_file = any(
-            hasattr(h, "baseFilename") for h in log.handlers
+            hasattr(h, "baseFilename") for h in log.handlers[0].listener.handlers
         )
         assert has_file
 
+    def test_handlers_run_behind_queue(self, monkeypatch):
+        from logging.handlers import QueueHandler
+
+        monkeypatch.setenv("LOG_FILE_ENABLED", "false")
+        log = setup_logger(f"test.queue.{time.time_ns()}")
+        assert len(log.handlers) == 1
+        assert isinstance(log.handlers[0], QueueHandler)
+
+    def test_queued_record_keeps_request_context(self):
+        from app.core.logger import _ContextQueueHandler
+        import queue
+
+        q = queue.Queue()
+        handler = _ContextQueueHandler(q)
+        set_request_id("queued-req")
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname=__file__,
+            lineno=1, msg="value=%s", args=(7,), exc_info=None,
+        )
+        handler.handle(record)
+
+        set_request_id("other-req")
+        queued = q.get_nowait()
+        assert queued.getMessage() == "value=7"
+        parsed = json.loads(JSONFormatter().format(queued))
+        assert parsed["request_id"] == "queued-req"
+
     def test_is_json_mode_explicit_true(self, monkeypatch):
         from app.core.logger import _is_json_mode
         monkeypatch.setenv("LOG_JSON_FORMAT", "true")
@@ -306,3 +370,42 @@ class TestHumanFormatterExcInfo:
         output = fmt.format(self._make_record_with_exc())
         assert "ValueError" in output
         assert "test error" in output
+
+
+# ══════════════════════════════════════════════════════════════
+# setup_logging (root logger)
+# ══════════════════════════════════════════════════════════════
+
+class TestSetupLogging:
+
+    @pytest.fixture
+    def root_handlers(self, tmp_path, monkeypatch):
+        from app.core import logging_config
+
+        monkeypatch.setattr(logging_config, "LOGS_DIR", tmp_path / "logs")
+        root = logging.getLogger()
+        before = list(root.handlers)
+        level = root.level
+        yield logging_config
+        for handler in list(root.handlers):
+            if handler not in before:
+                root.removeHandler(handler)
+                handler.close()
+        root.setLevel(level)
+
+    def test_no_log_dir_when_file_logging_disabled(self, root_handlers, monkeypatch):
+        monkeypatch.setenv("LOG_FILE_ENABLED", "false")
+        root_handlers.setup_logging()
+        assert not root_handlers.LOGS_DIR.exists()
+
+    def test_file_handlers_attached_once(self, root_handlers, monkeypatch):
+        monkeypatch.setenv("LOG_FILE_ENABLED", "true")
+        root_handlers.setup_logging()
+        root_handlers.setup_logging()
+
+        files = [
+            h.baseFilename for h in logging.getLogger().handlers
+            if hasattr(h, "baseFilename") and str(root_handlers.LOGS_DIR) in h.baseFilename
+        ]
+        assert sorted(files) == sorted(set(files))
+        assert len(files) == 2
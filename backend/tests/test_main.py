@@ -233,8 +233,8 @@ class TestExceptionHandlers:
         """Health returns 200 regardless of DB state (graceful down)."""
         from sqlalchemy import exc as sa_exc
         from unittest.mock import patch
-        with patch("app.core.database.engine") as m:
-            m.connect.side_effect = sa_exc.OperationalError("conn", None, None)
+        with patch("app.core.database.get_engine") as m:
+            m.return_value.connect.side_effect = sa_exc.OperationalError("conn", None, None)
             resp = client.get("/health")
             assert resp.status_code == 200
 
@@ -260,7 +260,8 @@ class TestDBSessionCleanup:
 
         closed_calls = []
 
-        with patch("app.core.database.SessionLocal") as mock_session_factory:
+        with patch("app.core.database.get_sessionmaker") as mock_get_sessionmaker:
+            mock_session_factory = mock_get_sessionmaker.return_value
             mock_session = MagicMock()
             mock_session.close.side_effect = lambda: closed_calls.append(True)
             mock_session_factory.return_value = mock_session
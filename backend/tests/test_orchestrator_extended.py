@@ -4,6 +4,7 @@ rule execution, deduplication edge cases, scoring, summary generation,
 and repr.
 """
 
+import asyncio
 import os
 import sys
 import tempfile
@@ -27,7 +28,13 @@ if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
 from analysis.models import Finding as PydanticFinding, ScanRequest, ScanResult  # noqa: E402
-from analysis.orchestrator import AnalysisOrchestrator, _remove_temp_file  # noqa: E402
+from analysis.models import SeverityRank, severity_rank  # noqa: E402
+from analysis.orchestrator import (  # noqa: E402
+    AnalysisOrchestrator,
+    _materialize_source,
+    _remove_temp_file,
+    _safe_detect,
+)
 from analysis.rules.base import Finding as RuleFinding, Severity, VulnerabilityRule  # noqa: E402
 
 
@@ -56,7 +63,8 @@ def _run_slither_pass(orc: AnalysisOrchestrator, request: ScanRequest) -> List[P
         ) as tmp_file:
             tmp_file.write(request.source_code)
             tmp_file_path = tmp_file.name
-        return orc._run_slither_analysis_from_file(tmp_file_path)
+        slither_obj, _ = orc._parse_once(tmp_file_path)
+        return orc._extract_slither_findings(slither_obj)
     finally:
         _remove_temp_file(tmp_file_path)
 
@@ -69,7 +77,8 @@ def _run_rule_pass(orc: AnalysisOrchestrator, request: ScanRequest) -> List[Pyda
         ) as tmp_file:
             tmp_file.write(request.source_code)
             tmp_file_path = tmp_file.name
-        return orc._run_rule_analysis_from_file(tmp_file_path, request)
+        _, ast = orc._parse_once(tmp_file_path)
+        return [f for rule in orc.rules for f in orc._run_rule(rule, ast)]
     finally:
         _remove_temp_file(tmp_file_path)
 
@@ -148,6 +157,44 @@ class TestAnalyzeCore:
         assert "SAFE" in result.summary or "No vulnerabilities" in result.summary
 
 
+# ══════════════════════════════════════════════════════════════
+# Async entry point
+# ══════════════════════════════════════════════════════════════
+
+class TestAnalyzeAsync:
+
+    def test_runs_analyze_in_executor(self):
+        orc = AnalysisOrchestrator(rules=[])
+        request = _request()
+        with patch.object(orc, "analyze", return_value="result") as analyze:
+            result = asyncio.run(orc.analyze_async(request))
+        assert result == "result"
+        analyze.assert_called_once_with(request)
+
+
+# ══════════════════════════════════════════════════════════════
+# Batch analysis
+# ══════════════════════════════════════════════════════════════
+
+class TestAnalyzeMany:
+
+    def test_empty_batch(self):
+        assert AnalysisOrchestrator(rules=[]).analyze_many([]) == []
+
+    def test_single_worker_runs_in_process(self):
+        orc = AnalysisOrchestrator(rules=[])
+        with patch.object(orc, "analyze", return_value="result") as analyze:
+            results = orc.analyze_many([_request(), _request()], workers=1)
+        assert results == ["result", "result"]
+        assert analyze.call_count == 2
+
+    def test_results_preserve_request_order(self):
+        orc = AnalysisOrchestrator(rules=[])
+        requests = [_request(source=f"contract C{i} {{}}", contract_name=None) for i in range(3)]
+        results = orc.analyze_many(requests, workers=2, chunksize=1)
+        assert [r.contract_name for r in results] == ["C0", "C1", "C2"]
+
+
 # ══════════════════════════════════════════════════════════════
 # Slither paths (mocked)
 # ══════════════════════════════════════════════════════════════
@@ -212,6 +259,24 @@ class TestSlitherIntegration:
         assert findings == []
 
 
+@pytest.mark.parametrize(
+    "impact, severity",
+    [
+        ("High", "critical"),
+        ("Medium", "high"),
+        ("Low", "medium"),
+        ("Informational", "low"),
+        ("Optimization", "low"),
+        (None, "low"),
+    ],
+)
+def test_slither_impact_mapping(impact, severity):
+    orc = AnalysisOrchestrator(rules=[])
+    finding = orc._convert_slither_finding({"check": "x", "impact": impact})
+    assert finding.severity == severity
+    assert finding.rank == finding.to_model().rank
+
+
 # ══════════════════════════════════════════════════════════════
 # Rule analysis paths
 # ══════════════════════════════════════════════════════════════
@@ -241,12 +306,57 @@ class TestRuleAnalysis:
             findings = _run_rule_pass(orc, _request())
         assert findings == []
 
+    def test_safe_detect_returns_exception_instead_of_raising(self):
+        rule_id, outcome = _safe_detect(_CrashingRule(), MagicMock())
+        assert rule_id == "CRASHER"
+        assert isinstance(outcome, RuntimeError)
+
+    def test_analyze_parses_contract_once(self):
+        orc = AnalysisOrchestrator(rules=[_AlwaysFindsRule(), _CrashingRule()])
+        mock_slither_obj = MagicMock()
+        mock_slither_obj.detectors_results = []
+        with patch.object(type(orc.slither_wrapper), "available", new_callable=PropertyMock, return_value=True), \
+             patch.object(orc.slither_wrapper, "parse_contract", return_value=mock_slither_obj) as parse, \
+             patch.object(orc.slither_wrapper, "get_ast_nodes", return_value=MagicMock()):
+            result = orc.analyze(_request(source="contract ParseOnce {}"))
+        assert parse.call_count == 1
+        assert any(f.title == "Always Found" for f in result.findings)
+        assert all(isinstance(f, PydanticFinding) for f in result.findings)
+
+    def test_analyze_reuses_cached_parse_without_reparsing(self):
+        orc = AnalysisOrchestrator(rules=[_AlwaysFindsRule()])
+        mock_slither_obj = MagicMock()
+        mock_slither_obj.detectors_results = []
+        with patch.object(type(orc.slither_wrapper), "available", new_callable=PropertyMock, return_value=True), \
+             patch.object(orc.slither_wrapper, "get_cached_parse", return_value=mock_slither_obj), \
+             patch.object(orc.slither_wrapper, "parse_contract") as parse, \
+             patch.object(orc.slither_wrapper, "get_ast_nodes", return_value=MagicMock()), \
+             patch("analysis.orchestrator._materialize_source") as tmp:
+            result = orc.analyze(_request(source="contract Cached {}"))
+        parse.assert_not_called()
+        tmp.assert_not_called()
+        assert any(f.title == "Always Found" for f in result.findings)
+
     def test_rule_analysis_slither_unavailable_skips_rules(self):
         orc = AnalysisOrchestrator(rules=[_AlwaysFindsRule()])
         with patch.object(type(orc.slither_wrapper), "available", new_callable=PropertyMock, return_value=False):
             findings = _run_rule_pass(orc, _request())
         assert findings == []
 
+    def test_rule_cost_recorded_after_run(self):
+        orc = AnalysisOrchestrator(rules=[_AlwaysFindsRule()])
+        orc._run_rule(orc.rules[0], MagicMock())
+        # EWMA moves from the 1.0s seed towards the (tiny) measured latency
+        assert orc._rule_cost["ALWAYS_FINDS"] < 1.0
+
+    def test_rules_dispatched_most_expensive_first(self):
+        fast, slow = _AlwaysFindsRule(), _CrashingRule()
+        orc = AnalysisOrchestrator(rules=[fast, slow])
+        orc._record_rule_cost(fast.rule_id, 0.0)
+        orc._record_rule_cost(slow.rule_id, 5.0)
+        assert orc._rules_by_cost() == [slow, fast]
+        assert orc.rules == [fast, slow]
+
 
 # ══════════════════════════════════════════════════════════════
 # Deduplication
@@ -257,11 +367,17 @@ class TestDeduplication:
     def _orc(self):
         return AnalysisOrchestrator(rules=[])
 
+    def test_empty_inputs_take_fast_path(self):
+        result, breakdown, score = self._orc()._merge_and_deduplicate([], [])
+        assert result == []
+        assert breakdown == {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0}
+        assert score == 100
+
     def test_identical_findings_deduplicated(self):
         orc = self._orc()
         f1 = _finding(desc="short")
         f2 = _finding(desc="longer description wins")
-        result = orc._merge_and_deduplicate([f1], [f2])
+        result, _, _ = orc._merge_and_deduplicate([f1], [f2])
         assert len(result) == 1
         assert result[0].description == "longer description wins"
 
@@ -269,19 +385,47 @@ class TestDeduplication:
         orc = self._orc()
         f1 = _finding(severity="high", line=1)
         f2 = _finding(severity="low", line=2)
-        result = orc._merge_and_deduplicate([f1], [f2])
+        result, _, _ = orc._merge_and_deduplicate([f1], [f2])
+        assert len(result) == 2
+
+    def test_same_line_different_titles_kept(self):
+        orc = self._orc()
+        f1 = _finding(title="First", line=None)
+        f2 = _finding(title="Second", line=None)
+        result, _, _ = orc._merge_and_deduplicate([f1], [f2])
+        assert len(result) == 2
+
+    def test_none_line_not_merged_with_real_line(self):
+        orc = self._orc()
+        result, _, _ = orc._merge_and_deduplicate([_finding(line=None)], [_finding(line=0xFFFFFFFE)])
         assert len(result) == 2
 
     def test_sorted_critical_first(self):
         orc = self._orc()
         f_low = _finding(severity="low", line=100)
         f_critical = _finding(severity="critical", line=200)
-        result = orc._merge_and_deduplicate([f_low], [f_critical])
+        result, _, _ = orc._merge_and_deduplicate([f_low], [f_critical])
         assert result[0].severity == "critical"
 
     def test_no_findings_returns_empty(self):
         orc = self._orc()
-        assert orc._merge_and_deduplicate([], []) == []
+        assert orc._merge_and_deduplicate([], []) == (
+            [],
+            {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0},
+            100,
+        )
+
+    def test_fused_totals_match_standalone_calculations(self):
+        orc = self._orc()
+        slither = [_finding(severity="critical", line=1), _finding(severity="low", line=2)]
+        rules = [
+            _finding(severity="critical", line=1, desc="longer duplicate"),
+            _finding(title="Other", severity="high", line=3),
+        ]
+        findings, breakdown, score = orc._merge_and_deduplicate(slither, rules)
+        assert len(findings) == 3
+        assert breakdown == orc._calculate_severity_breakdown(findings)
+        assert score == orc._calculate_score(findings) == 84
 
 
 # ══════════════════════════════════════════════════════════════
@@ -298,6 +442,25 @@ class TestScoringAndBreakdown:
         breakdown = orc._calculate_severity_breakdown([])
         assert all(v == 0 for v in breakdown.values())
 
+    @pytest.mark.parametrize(
+        "severity, rank",
+        [
+            ("critical", SeverityRank.CRITICAL),
+            ("High", SeverityRank.HIGH),
+            ("MEDIUM", SeverityRank.MEDIUM),
+            ("info", SeverityRank.INFO),
+            ("severe", SeverityRank.UNKNOWN),
+        ],
+    )
+    def test_severity_rank_is_case_insensitive(self, severity, rank):
+        assert severity_rank(severity) is rank
+
+    def test_finding_rank_follows_severity_updates(self):
+        finding = _finding(severity="low")
+        assert finding.model_copy(update={"severity": "critical"}).rank is SeverityRank.CRITICAL
+        finding.severity = "high"
+        assert finding.rank is SeverityRank.HIGH
+
     def test_breakdown_counts_correctly(self):
         orc = self._orc()
         findings = [_finding(severity="critical"), _finding(severity="critical"), _finding(severity="low")]
@@ -305,6 +468,18 @@ class TestScoringAndBreakdown:
         assert bd["critical"] == 2
         assert bd["low"] == 1
 
+    def test_breakdown_and_score_ignore_severity_case(self):
+        orc = self._orc()
+        findings = [_finding(severity="CRITICAL"), _finding(severity="High")]
+        assert orc._calculate_severity_breakdown(findings)["critical"] == 1
+        assert orc._calculate_score(findings) == 85
+
+    def test_unknown_severity_not_counted(self):
+        orc = self._orc()
+        findings = [_finding(severity="bogus")]
+        assert sum(orc._calculate_severity_breakdown(findings).values()) == 0
+        assert orc._calculate_score(findings) == 100
+
     def test_score_max_100_no_findings(self):
         assert self._orc()._calculate_score([]) == 100
 
@@ -396,6 +571,49 @@ class TestRemoveTempFile:
         assert not tmp_path.exists()
 
 
+# ══════════════════════════════════════════════════════════════
+# _materialize_source utility
+# ══════════════════════════════════════════════════════════════
+
+class TestMaterializeSource:
+
+    def test_writes_utf8_source(self):
+        source = "// \u00e9\ncontract A {}"
+        path = _materialize_source(source, "ab" * 32)
+        try:
+            assert path.endswith(".sol")
+            assert Path(path).read_text(encoding="utf-8") == source
+        finally:
+            _remove_temp_file(path)
+
+    def test_identical_sources_get_distinct_paths(self):
+        first = _materialize_source("contract A {}", "cd" * 32)
+        second = _materialize_source("contract A {}", "cd" * 32)
+        try:
+            assert first != second
+        finally:
+            _remove_temp_file(first)
+            _remove_temp_file(second)
+
+
+# ══════════════════════════════════════════════════════════════
+# Cache management
+# ══════════════════════════════════════════════════════════════
+
+class TestClearCache:
+
+    def test_clear_cache_evicts_parses_and_resets_costs(self):
+        from analysis.slither_wrapper import _PARSE_CACHE
+
+        orc = AnalysisOrchestrator(rules=[_AlwaysFindsRule()])
+        _PARSE_CACHE.set("deadbeef", object())
+        orc._record_rule_cost("ALWAYS_FINDS", 9.0)
+
+        assert orc.clear_cache() >= 1
+        assert orc.slither_wrapper.get_cached_parse("deadbeef") is None
+        assert orc._rule_cost == {"ALWAYS_FINDS": 1.0}
+
+
 # ══════════════════════════════════════════════════════════════
 # Repr
 # ══════════════════════════════════════════════════════════════
@@ -410,3 +628,33 @@ class TestRepr:
     def test_repr_is_string(self):
         orc = AnalysisOrchestrator(rules=[])
         assert isinstance(repr(orc), str)
+
+
+# ══════════════════════════════════════════════════════════════
+# Package exports
+# ══════════════════════════════════════════════════════════════
+
+class TestLazyPackageExports:
+
+    def test_submodule_import_does_not_load_orchestrator(self):
+        import subprocess
+
+        code = (
+            "import sys, analysis.rules.base; "
+            "sys.exit('analysis.orchestrator' in sys.modules)"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR)
+        assert proc.returncode == 0
+
+    def test_exports_resolve_to_submodule_objects(self):
+        import analysis
+
+        assert analysis.AnalysisOrchestrator is AnalysisOrchestrator
+        assert analysis.PydanticFinding is PydanticFinding
+        assert analysis.RuleFinding is RuleFinding
+
+    def test_unknown_attribute_raises(self):
+        import analysis
+
+        with pytest.raises(AttributeError):
+            analysis.does_not_exist
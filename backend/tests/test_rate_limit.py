@@ -0,0 +1,533 @@
+"""
+Tests for the Redis-backed sliding window in app.core.rate_limit.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import redis.asyncio as aioredis
+from redis.exceptions import NoScriptError, RedisError
+
+from app.core import rate_limit
+from app.core.rate_limit import RateLimiter, RateLimitMiddleware
+from app.core.redis import RedisManager
+
+
+class _FakePipeline:
+    """Queues commands and runs them against a ``_FakeRedis`` on execute."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        self._redis.round_trips += 1
+        calls, self._calls = self._calls, []
+        return [
+            await getattr(self._redis, "_" + name)(*args, **kwargs) for name, args, kwargs in calls
+        ]
+
+
+class _FakeRedis:
+    """Commands used by the limiter, counting network round-trips."""
+
+    def __init__(self):
+        self.zsets = {}
+        self.strings = {}
+        self.ttls = {}
+        self.round_trips = 0
+        self.scripts = {}
+        self.evals = []
+        self.reply = [0, 0, 0]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def __getattr__(self, name):
+        # Direct (non-pipelined) commands cost one round-trip each
+        command = object.__getattribute__(self, "_" + name)
+
+        async def call(*args, **kwargs):
+            self.round_trips += 1
+            return await command(*args, **kwargs)
+
+        return call
+
+    async def _zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        stale = [m for m, score in zset.items() if score <= high]
+        for member in stale:
+            del zset[member]
+        return len(stale)
+
+    async def _zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    async def _zrange(self, key, start, end, withscores=False):
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        return ordered[start : end + 1]
+
+    async def _zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def _expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    async def _incr(self, key):
+        self.strings[key] = self.strings.get(key, 0) + 1
+        return self.strings[key]
+
+    async def _decr(self, key):
+        self.strings[key] = self.strings.get(key, 0) - 1
+        return self.strings[key]
+
+    async def _get(self, key):
+        value = self.strings.get(key)
+        return None if value is None else str(value)
+
+    async def _script_load(self, source):
+        sha = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        self.scripts[sha] = source
+        return sha
+
+    async def _evalsha(self, sha, numkeys, *keys_and_args):
+        if sha not in self.scripts:
+            raise NoScriptError("NOSCRIPT No matching script.")
+        self.evals.append((sha, list(keys_and_args[:numkeys]), list(keys_and_args[numkeys:])))
+        return self.reply
+
+    async def _delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += self.zsets.pop(key, None) is not None
+            removed += self.strings.pop(key, None) is not None
+        return removed
+
+
+_LIMITS = {"per_minute": 3, "per_hour": 100, "per_day": 1000}
+_NOW = 1_000_000_040.0  # 20 seconds into a minute bucket
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _loaded_redis():
+    redis = _FakeRedis()
+    _run(rate_limit.load_scripts(redis))
+    redis.round_trips = 0
+    return redis
+
+
+def _limit(limiter, limits=_LIMITS, burst_allowance=0):
+    with patch("app.core.rate_limit.time.time", return_value=_NOW):
+        return _run(limiter.is_rate_limited("ip:1", limits, burst_allowance))
+
+
+class TestStrategySelection:
+    def test_default_strategy_is_counter(self):
+        assert RateLimiter(_FakeRedis()).strategy == "counter"
+
+    def test_unknown_strategy_rejected(self):
+        with pytest.raises(ValueError):
+            RateLimiter(_FakeRedis(), strategy="leaky")
+
+
+class TestLuaScripts:
+    """Each decision is a single EVALSHA against a preloaded script."""
+
+    def test_script_sha_matches_source(self):
+        for script in (rate_limit._COUNTER_SCRIPT, rate_limit._ZSET_SCRIPT):
+            assert script.sha == hashlib.sha1(script.source.encode("utf-8")).hexdigest()
+
+    def test_counter_request_is_one_round_trip(self):
+        redis = _loaded_redis()
+        redis.reply = [0, 2, 1_000_000_080]
+
+        limited, info = _limit(RateLimiter(redis))
+
+        assert limited is False
+        assert redis.round_trips == 1
+        sha, keys, args = redis.evals[0]
+        assert sha == rate_limit._COUNTER_SCRIPT.sha
+        minute = int(_NOW // 60)
+        assert keys[:2] == [f"ratelimit:ip:1:minute:{minute}", f"ratelimit:ip:1:minute:{minute - 1}"]
+        assert len(keys) == 6
+        assert args == [_NOW, 3, 100, 1000, 0]
+        assert info == {
+            "limited": False,
+            "retry_after": 0,
+            "limit": 3,
+            "remaining": 2,
+            "reset": 1_000_000_080,
+            "window": "",
+        }
+
+    def test_zset_request_passes_window_keys_and_member(self):
+        redis = _loaded_redis()
+        limiter = RateLimiter(redis, strategy="zset")
+
+        _limit(limiter, burst_allowance=2)
+        _limit(limiter, burst_allowance=2)
+
+        sha, keys, args = redis.evals[0]
+        assert sha == rate_limit._ZSET_SCRIPT.sha
+        assert keys == [
+            "ratelimit:ip:1:minute",
+            "ratelimit:ip:1:hour",
+            "ratelimit:ip:1:day",
+        ]
+        assert args[:5] == [_NOW, 3, 100, 1000, 2]
+        # Same identifier, same timestamp: members must still differ
+        assert args[5] != redis.evals[1][2][5]
+
+    def test_limited_reply_is_decoded(self):
+        redis = _loaded_redis()
+        redis.reply = [1, 2, 1200, 1_000_001_240]
+
+        limited, info = _limit(RateLimiter(redis))
+
+        assert limited is True
+        assert info == {
+            "limited": True,
+            "retry_after": 1200,
+            "limit": 100,
+            "remaining": 0,
+            "reset": 1_000_001_240,
+            "window": "hour",
+        }
+
+    def test_unset_minute_window_leaves_headers_empty(self):
+        redis = _loaded_redis()
+
+        limited, info = _limit(RateLimiter(redis), limits={"per_hour": 5})
+
+        assert limited is False
+        assert info["limit"] == 0
+        assert redis.evals[0][2] == [_NOW, 0, 5, 0, 0]
+
+    def test_missing_script_is_loaded_and_retried(self):
+        redis = _FakeRedis()
+
+        limited, _ = _limit(RateLimiter(redis))
+
+        assert limited is False
+        # NOSCRIPT, SCRIPT LOAD, EVALSHA
+        assert redis.round_trips == 3
+        assert rate_limit._COUNTER_SCRIPT.sha in redis.scripts
+        assert len(redis.evals) == 1
+
+    def test_redis_error_falls_back_to_memory(self):
+        class _BrokenRedis(_FakeRedis):
+            async def _evalsha(self, *args):
+                raise ConnectionError("redis down")
+
+        limiter = RateLimiter(_BrokenRedis())
+
+        limited, info = _run(limiter.is_rate_limited("ip:fallback-test", _LIMITS))
+
+        assert limited is False
+        assert info["window"] == "minute"
+
+
+class TestUsageAndReset:
+    def test_counter_usage_weights_previous_bucket(self):
+        redis = _FakeRedis()
+        limiter = RateLimiter(redis)
+        minute = int(_NOW // 60)
+        # 40 of 60 seconds of the previous bucket still overlap: 3 * 2/3 = 2
+        redis.strings[f"ratelimit:ip:1:minute:{minute - 1}"] = 3
+        redis.strings[f"ratelimit:ip:1:minute:{minute}"] = 1
+
+        with patch("app.core.rate_limit.time.time", return_value=_NOW):
+            usage = _run(limiter.get_usage("ip:1"))
+
+        assert usage == {"minute": 3, "hour": 0, "day": 0}
+        assert redis.round_trips == 1
+
+    def test_zset_usage_counts_members(self):
+        redis = _FakeRedis()
+        limiter = RateLimiter(redis, strategy="zset")
+        redis.zsets["ratelimit:ip:1:minute"] = {"a": _NOW - 90, "b": _NOW - 5}
+
+        with patch("app.core.rate_limit.time.time", return_value=_NOW):
+            usage = _run(limiter.get_usage("ip:1"))
+
+        assert usage == {"minute": 1, "hour": 0, "day": 0}
+
+    def test_reset_deletes_both_layouts(self):
+        redis = _FakeRedis()
+        limiter = RateLimiter(redis)
+        minute = int(_NOW // 60)
+        redis.strings[f"ratelimit:ip:1:minute:{minute}"] = 1
+        redis.zsets["ratelimit:ip:1:minute"] = {"a": _NOW}
+
+        with patch("app.core.rate_limit.time.time", return_value=_NOW):
+            assert _run(limiter.reset("ip:1")) is True
+
+        assert redis.strings == {}
+        assert redis.zsets == {}
+        assert redis.round_trips == 1
+
+
+def _with_live_redis(scenario):
+    """
+    Run ``scenario(client, limiter_prefix)`` against a real Redis server.
+
+    The fake above only returns canned replies, so these tests are what
+    actually execute the Lua scripts. Skipped when no server is reachable.
+    """
+
+    async def main():
+        client = aioredis.from_url(
+            os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
+            decode_responses=True,
+            socket_connect_timeout=0.5,
+        )
+        try:
+            try:
+                await client.ping()
+            except (RedisError, OSError) as exc:
+                pytest.skip(f"Redis server not reachable: {exc}")
+            prefix = f"test-ratelimit-{uuid.uuid4().hex[:8]}"
+            try:
+                await scenario(client, prefix)
+            finally:
+                keys = [key async for key in client.scan_iter(match=f"{prefix}:*")]
+                if keys:
+                    await client.delete(*keys)
+        finally:
+            await client.aclose()
+
+    _run(main())
+
+
+async def _limit_live(limiter, limits=_LIMITS, burst_allowance=0, now=_NOW):
+    with patch("app.core.rate_limit.time.time", return_value=now):
+        return await limiter.is_rate_limited("ip:1", limits, burst_allowance)
+
+
+class TestCounterScriptOnRedis:
+    """rate_limit_counter.lua executed by a real Redis server."""
+
+    def test_previous_bucket_is_weighted(self):
+        async def scenario(client, prefix):
+            limiter = RateLimiter(client, prefix=prefix)
+            minute = int(_NOW // 60)
+            current_key = limiter._get_bucket_key("ip:1", "minute", minute)
+            await client.set(limiter._get_bucket_key("ip:1", "minute", minute - 1), 3)
+
+            # 20s into the bucket, 3 previous requests weigh 2; this makes 3
+            limited, info = await _limit_live(limiter)
+            assert limited is False
+            assert info["remaining"] == 0
+            assert info["reset"] == (minute + 1) * 60
+            assert await client.get(current_key) == "1"
+
+            limited, info = await _limit_live(limiter)
+            assert limited is True
+            assert info["window"] == "minute"
+            assert info["retry_after"] == 40
+            assert info["reset"] == (minute + 1) * 60
+            # A rejected request is not counted
+            assert await client.get(current_key) == "1"
+
+        _with_live_redis(scenario)
+
+    def test_burst_allowance_extends_the_limit(self):
+        async def scenario(client, prefix):
+            limiter = RateLimiter(client, prefix=prefix)
+
+            results = [(await _limit_live(limiter, burst_allowance=2))[0] for _ in range(6)]
+
+            assert results == [False] * 5 + [True]
+
+        _with_live_redis(scenario)
+
+    def test_hour_limit_reports_hour_bucket_reset(self):
+        async def scenario(client, prefix):
+            limiter = RateLimiter(client, prefix=prefix)
+            limits = {"per_minute": 10, "per_hour": 2, "per_day": 1000}
+
+            for _ in range(2):
+                assert (await _limit_live(limiter, limits))[0] is False
+            limited, info = await _limit_live(limiter, limits)
+
+            hour_end = (int(_NOW) // 3600 + 1) * 3600
+            assert limited is True
+            assert info["window"] == "hour"
+            assert info["reset"] == hour_end
+            assert info["retry_after"] == hour_end - int(_NOW)
+
+        _with_live_redis(scenario)
+
+    def test_new_buckets_expire_after_two_windows(self):
+        async def scenario(client, prefix):
+            limiter = RateLimiter(client, prefix=prefix)
+
+            await _limit_live(limiter)
+            await _limit_live(limiter)
+
+            for window, seconds in rate_limit._WINDOW_SECONDS.items():
+                key = limiter._get_bucket_key("ip:1", window, int(_NOW // seconds))
+                assert await client.get(key) == "2"
+                assert 0 < await client.ttl(key) <= 2 * seconds
+
+        _with_live_redis(scenario)
+
+
+class TestZsetScriptOnRedis:
+    """rate_limit_zset.lua executed by a real Redis server."""
+
+    def test_window_is_trimmed_and_oldest_member_sets_retry_after(self):
+        async def scenario(client, prefix):
+            limiter = RateLimiter(client, prefix=prefix, strategy="zset")
+            minute_key = limiter._get_key("ip:1", "minute")
+            await client.zadd(minute_key, {"stale": _NOW - 70, "old": _NOW - 50, "new": _NOW - 10})
+
+            limited, info = await _limit_live(limiter)
+            assert limited is False
+            assert info["remaining"] == 1
+            assert await client.zscore(minute_key, "stale") is None
+            assert await client.zcard(minute_key) == 3
+            assert 0 < await client.ttl(minute_key) <= 120
+
+            limited, info = await _limit_live(limiter)
+            assert limited is True
+            assert info["window"] == "minute"
+            assert info["retry_after"] == 10
+            assert info["reset"] == int(_NOW) + 10
+
+        _with_live_redis(scenario)
+
+    def test_rejected_request_is_not_recorded_in_any_window(self):
+        async def scenario(client, prefix):
+            limiter = RateLimiter(client, prefix=prefix, strategy="zset")
+            limits = {"per_minute": 10, "per_hour": 1, "per_day": 1000}
+
+            assert (await _limit_live(limiter, limits))[0] is False
+            limited, info = await _limit_live(limiter, limits)
+
+            assert limited is True
+            assert info["window"] == "hour"
+            for window in rate_limit._WINDOW_SECONDS:
+                assert await client.zcard(limiter._get_key("ip:1", window)) == 1
+
+        _with_live_redis(scenario)
+
+
+class TestConnectionPool:
+    def test_connect_uses_bounded_blocking_pool(self):
+        manager = RedisManager()
+
+        with patch.object(aioredis.Redis, "ping", AsyncMock(return_value=True)):
+            assert _run(manager.connect(max_connections=7, socket_timeout=2)) is True
+
+        pool = manager.redis.connection_pool
+        assert isinstance(pool, aioredis.BlockingConnectionPool)
+        assert pool.max_connections == 7
+        assert pool.timeout == 2
+
+        _run(manager.disconnect())
+        assert manager.is_available is False
+
+    def test_unreachable_server_fails_fast_with_real_error(self):
+        manager = RedisManager()
+
+        async def ping_twice():
+            await manager.connect(url="redis://127.0.0.1:1/0", max_connections=1, socket_timeout=5)
+            return await manager.ping()
+
+        started = time.monotonic()
+        assert _run(ping_twice()) is False
+        assert time.monotonic() - started < 4
+        assert "No connection available" not in manager.connection_status["last_error"]
+        _run(manager.disconnect())
+
+
+class _StubLimiter:
+    def __init__(self, limited):
+        self.limited = limited
+        self.identifiers = []
+        self.limits = []
+
+    async def is_rate_limited(self, identifier, limits, burst_allowance=0):
+        self.identifiers.append(identifier)
+        self.limits.append(limits)
+        info = {"limit": 3, "remaining": 0 if self.limited else 2, "reset": 99, "window": "minute"}
+        info["retry_after"] = 7 if self.limited else 0
+        return self.limited, info
+
+
+def _client(limited):
+    from fastapi.testclient import TestClient
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    async def endpoint(request):
+        return PlainTextResponse("ok")
+
+    inner = Starlette(routes=[Route("/scan", endpoint), Route("/health", endpoint)])
+    middleware = RateLimitMiddleware(inner)
+    middleware.enabled = True
+    middleware.limiter = _StubLimiter(limited)
+    return TestClient(middleware), middleware.limiter
+
+
+class TestRateLimitMiddleware:
+    """Pure ASGI middleware: headers on pass-through, 429 on rejection."""
+
+    def test_allowed_request_gets_rate_limit_headers(self):
+        client, limiter = _client(limited=False)
+
+        response = client.get("/scan", headers={"X-Forwarded-For": "10.0.0.1, 10.0.0.2"})
+
+        assert response.status_code == 200
+        assert response.text == "ok"
+        assert response.headers["X-RateLimit-Limit"] == "3"
+        assert response.headers["X-RateLimit-Remaining"] == "2"
+        assert response.headers["X-RateLimit-Reset"] == "99"
+        assert limiter.identifiers == ["ip:10.0.0.1"]
+        assert limiter.limits[0]["per_minute"] == rate_limit.settings.RATE_LIMIT_PER_MINUTE
+
+    def test_limited_request_is_rejected_before_the_app(self):
+        client, limiter = _client(limited=True)
+
+        response = client.get("/scan", headers={"X-API-Key": "bsc_" + "k" * 40})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "error": "rate_limit_exceeded",
+            "message": "Rate limit exceeded. Please try again in 7 seconds.",
+            "retry_after": 7,
+            "limit": 3,
+            "window": "minute",
+        }
+        assert limiter.identifiers == ["apikey:bsc_kkkkkkkkkkkk"]
+        assert limiter.limits[0]["per_minute"] == rate_limit.settings.API_KEY_RATE_LIMIT_PER_MINUTE
+
+    def test_skipped_paths_bypass_the_limiter(self):
+        client, limiter = _client(limited=True)
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert "X-RateLimit-Limit" not in response.headers
+        assert limiter.identifiers == []
@@ -5,6 +5,8 @@ Tests the pure helper utilities directly without going through HTTP.
 These cover branches that the integration tests miss.
 """
 
+import asyncio
+import io
 import os
 import sys
 from pathlib import Path
@@ -24,9 +26,10 @@ BACKEND_DIR = Path(__file__).resolve().parent.parent
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
-from fastapi import HTTPException  # noqa: E402
+from fastapi import HTTPException, UploadFile  # noqa: E402
 from app.routers.scan import (  # noqa: E402
     _validate_source_length,
+    _read_upload,
     _findings_to_json,
     _build_scan_record,
     _scan_record_to_response,
@@ -99,6 +102,32 @@ class TestValidateSourceLength:
         _validate_source_length("x" * 500_000)  # Exactly at limit, should not raise
 
 
+# ══════════════════════════════════════════════════════════════
+# _read_upload
+# ══════════════════════════════════════════════════════════════
+
+class TestReadUpload:
+
+    def test_reads_whole_file_across_chunks(self):
+        payload = b"x" * (200 * 1024)
+        upload = UploadFile(file=io.BytesIO(payload), filename="a.sol")
+        assert asyncio.run(_read_upload(upload)) == payload
+
+    def test_oversized_upload_raises_413(self):
+        upload = UploadFile(file=io.BytesIO(b"x" * 1025), filename="a.sol")
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(_read_upload(upload, limit=1024))
+        assert exc_info.value.status_code == 413
+
+    def test_declared_size_rejected_without_reading(self):
+        stream = io.BytesIO(b"x" * 10)
+        upload = UploadFile(file=stream, filename="a.sol", size=10_000)
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(_read_upload(upload, limit=1024))
+        assert exc_info.value.status_code == 413
+        assert stream.tell() == 0
+
+
 # ══════════════════════════════════════════════════════════════
 # _findings_to_json
 # ══════════════════════════════════════════════════════════════
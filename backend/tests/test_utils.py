@@ -63,5 +63,5 @@ def test_merge_deduplication():
         )
     ]
 
-    r = orch._merge_and_deduplicate(a, b)
+    r, _, _ = orch._merge_and_deduplicate(a, b)
     assert len(r) == 1